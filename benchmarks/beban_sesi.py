@@ -0,0 +1,199 @@
+"""
+Uji beban: banyak siswa memakai aplikasi SPLDV secara bersamaan.
+
+Setiap pengguna tiruan adalah satu sesi streamlit.testing AppTest yang
+dijalankan di thread sendiri di dalam proses ini, seperti sesi-sesi di satu
+replika server Streamlit. AppTest memasang Runtime tiruan global di awal setiap
+run dan melepasnya di akhir, yang tidak aman bila beberapa sesi berjalan
+bersamaan; selama uji beban semua sesi memakai satu Runtime tiruan bersama
+(lihat runtime_bersama), seperti satu Runtime di server sungguhan:
+- kalkulatorspldv: mengisi koefisien, menggeser slider X coba beberapa kali,
+  lalu membuka lagi halaman (rerun) untuk melihat bagian solusi. AppTest selalu
+  menjalankan isi expander, sehingga bagian solusi ikut terukur di setiap rerun.
+- spldv_calculator: mengisi koefisien lalu menekan "Hitung Solusi".
+
+Untuk setiap jumlah sesi dilaporkan persentil latensi rerun, throughput
+(rerun/detik), pemakaian CPU proses, dan memori resident (RSS).
+
+Contoh:
+    python benchmarks/beban_sesi.py --sesi 1,5,10,20,40 --keluaran beban.json
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.testing.v1 import AppTest
+
+AKAR = Path(__file__).resolve().parent.parent
+
+APLIKASI = {
+    "kalkulatorspldv": AKAR / "kalkulatorspldv" / "kalkulatorspldv.py",
+    "spldv_calculator": AKAR / "pemograman aini" / "spldv_calculator.py",
+}
+
+
+def rss_mb():
+    """Memori resident proses saat ini (MB); memakai /proc di Linux, selain itu puncak RSS."""
+    try:
+        with open("/proc/self/status") as f:
+            for baris in f:
+                if baris.startswith("VmRSS:"):
+                    return int(baris.split()[1]) / 1024
+    except OSError:
+        pass
+    puncak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return puncak / (1024 * 1024) if sys.platform == "darwin" else puncak / 1024
+
+
+def waktu_cpu():
+    pemakaian = resource.getrusage(resource.RUSAGE_SELF)
+    return pemakaian.ru_utime + pemakaian.ru_stime
+
+
+def koefisien_acak(rng):
+    """Koefisien bulat acak dengan determinan tidak nol, seperti soal latihan biasa."""
+    while True:
+        a1, b1, a2, b2 = (float(rng.randint(-9, 9)) for _ in range(4))
+        if a1 * b2 - a2 * b1 != 0:
+            return a1, b1, float(rng.randint(-20, 20)), a2, b2, float(rng.randint(-20, 20))
+
+
+@contextmanager
+def runtime_bersama():
+    """Satu Runtime tiruan untuk semua sesi; Runtime.instance()/exists() tidak lagi bergantung pada run terakhir."""
+    runtime = mock.MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = DataframeSourceManager()
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    with mock.patch.object(Runtime, "instance", classmethod(lambda cls: runtime)), \
+            mock.patch.object(Runtime, "exists", classmethod(lambda cls: True)):
+        yield runtime
+
+
+class PenggunaTiruan:
+    """Satu siswa tiruan; setiap rerun dicatat latensinya ke `latensi`."""
+
+    def __init__(self, aplikasi, rng, sapuan, latensi, kunci_latensi):
+        self.aplikasi = aplikasi
+        self.rng = rng
+        self.sapuan = sapuan
+        self.latensi = latensi
+        self.kunci_latensi = kunci_latensi
+        self.galat = []
+
+    def _rerun(self, app):
+        mulai = time.perf_counter()
+        app.run()
+        durasi = time.perf_counter() - mulai
+        with self.kunci_latensi:
+            self.latensi.append(durasi)
+        if app.exception:
+            self.galat.append(app.exception[0].value)
+
+    def jalankan(self):
+        app = AppTest.from_file(str(APLIKASI[self.aplikasi]), default_timeout=600)
+        self._rerun(app)
+        a1, b1, c1, a2, b2, c2 = koefisien_acak(self.rng)
+
+        if self.aplikasi == "kalkulatorspldv":
+            for kunci, nilai in zip(("a1_main", "b1_main", "c1_main", "a2_main", "b2_main", "c2_main"),
+                                    (a1, b1, c1, a2, b2, c2)):
+                app.number_input(key=kunci).set_value(nilai)
+            self._rerun(app)
+            for _ in range(self.sapuan):
+                app.slider[0].set_value(round(self.rng.uniform(-10, 10), 1))
+                self._rerun(app)
+            self._rerun(app) # Membuka kembali halaman untuk melihat solusi
+        else:
+            for kunci, nilai in zip(("a1", "b1", "c1", "a2", "b2", "c2"), (a1, b1, c1, a2, b2, c2)):
+                app.number_input(key=kunci).set_value(nilai)
+            self._rerun(app)
+            app.button[0].click()
+            self._rerun(app)
+        return self.galat
+
+
+def uji_beban(aplikasi, jumlah_sesi, sapuan=5, seed=0):
+    """Menjalankan `jumlah_sesi` pengguna tiruan sekaligus dan mengembalikan ringkasan pengukuran."""
+    latensi = []
+    kunci_latensi = threading.Lock()
+    pengguna = [PenggunaTiruan(aplikasi, random.Random(seed * 1000 + i), sapuan, latensi, kunci_latensi)
+                for i in range(jumlah_sesi)]
+
+    cpu_awal = waktu_cpu()
+    mulai = time.perf_counter()
+    rss_puncak = rss_mb()
+    with runtime_bersama(), ThreadPoolExecutor(max_workers=jumlah_sesi) as executor:
+        futures = [executor.submit(p.jalankan) for p in pengguna]
+        while not all(f.done() for f in futures):
+            rss_puncak = max(rss_puncak, rss_mb())
+            time.sleep(0.2)
+        galat = [pesan for f in futures for pesan in f.result()]
+    durasi = time.perf_counter() - mulai
+    cpu = waktu_cpu() - cpu_awal
+
+    terurut = sorted(latensi)
+    kuantil = statistics.quantiles(terurut, n=100, method="inclusive") if len(terurut) > 1 else terurut * 99
+    return {
+        "aplikasi": aplikasi,
+        "sesi": jumlah_sesi,
+        "rerun": len(latensi),
+        "p50_ms": kuantil[49] * 1000,
+        "p95_ms": kuantil[94] * 1000,
+        "p99_ms": kuantil[98] * 1000,
+        "maks_ms": terurut[-1] * 1000,
+        "rerun_per_detik": len(latensi) / durasi,
+        "cpu_persen": 100 * cpu / durasi, # 100% = satu inti penuh
+        "rss_puncak_mb": rss_puncak,
+        "galat": len(galat),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji beban sesi bersamaan untuk aplikasi SPLDV.")
+    parser.add_argument("--sesi", default="1,5,10,20", help="Daftar jumlah sesi bersamaan, dipisah koma")
+    parser.add_argument("--aplikasi", default=",".join(APLIKASI), help="Aplikasi yang diuji, dipisah koma")
+    parser.add_argument("--sapuan", type=int, default=5, help="Jumlah pergeseran slider per pengguna")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keluaran", type=Path, help="File JSON untuk menyimpan hasil")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    daftar_sesi = [int(n) for n in args.sesi.split(",")]
+    hasil = []
+    print(f"{'aplikasi':18s} {'sesi':>5s} {'rerun':>6s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} "
+          f"{'rerun/s':>8s} {'CPU %':>6s} {'RSS MB':>7s} {'galat':>5s}")
+    for aplikasi in args.aplikasi.split(","):
+        for jumlah_sesi in daftar_sesi:
+            ringkasan = uji_beban(aplikasi, jumlah_sesi, args.sapuan, args.seed)
+            hasil.append(ringkasan)
+            print(f"{aplikasi:18s} {jumlah_sesi:5d} {ringkasan['rerun']:6d} {ringkasan['p50_ms']:9.0f} "
+                  f"{ringkasan['p95_ms']:9.0f} {ringkasan['p99_ms']:9.0f} {ringkasan['rerun_per_detik']:8.2f} "
+                  f"{ringkasan['cpu_persen']:6.0f} {ringkasan['rss_puncak_mb']:7.0f} {ringkasan['galat']:5d}",
+                  flush=True)
+
+    if args.keluaran:
+        laporan = {"cpu_count": os.cpu_count(), "python": sys.version.split()[0], "hasil": hasil}
+        args.keluaran.write_text(json.dumps(laporan, indent=2))
+    return 1 if any(r["galat"] for r in hasil) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
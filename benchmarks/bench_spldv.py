@@ -0,0 +1,236 @@
+"""
+Benchmark kalkulator SPLDV: solver, plotting, dan waktu rerun halaman.
+
+Mengukur:
+- hitung_y untuk beberapa ukuran array
+- hitung_solusi_spldv (skalar) dibandingkan hitung_solusi_spldv_batch
+- waktu membangun figure plot_garis, memperbarui figure PenggambarGaris yang dipakai ulang,
+  dan waktu merendernya ke PNG
+- waktu rerun skrip penuh ketiga aplikasi lewat streamlit.testing AppTest
+- (dengan --startup) waktu cold start tiap aplikasi di proses Python baru,
+  beserta modul berat yang ikut dimuat pada run pertama
+
+Hasil ditulis ke file JSON dan dibandingkan dengan baseline tersimpan;
+keluar dengan kode 1 jika ada pengukuran yang melambat melewati ambang.
+
+Contoh:
+    python benchmarks/bench_spldv.py --keluaran hasil_bench.json
+    python benchmarks/bench_spldv.py --simpan-baseline
+    python benchmarks/bench_spldv.py --startup --tanpa-aplikasi
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+
+AKAR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(AKAR))
+
+import matplotlib
+import numpy as np
+
+from spldv.plotting import OPSI_SAVEFIG, PenggambarGaris, plot_garis
+from spldv.solver import hitung_solusi_spldv, hitung_solusi_spldv_batch, hitung_y
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+AMBANG_REGRESI = 1.5 # Dianggap regresi jika lebih lambat dari 1.5x baseline
+
+APLIKASI = {
+    "kalkulatorspldv": AKAR / "kalkulatorspldv" / "kalkulatorspldv.py",
+    "spldv_calculator": AKAR / "pemograman aini" / "spldv_calculator.py",
+    "kalkulator_spldv2": AKAR / "pemograman aini" / "kalkulatorspldv2" / "kalkulator_spldv2.py",
+}
+
+MODUL_BERAT = ("numpy", "pandas", "pyarrow", "altair", "matplotlib")
+
+# Dijalankan di proses baru: impor streamlit.testing lalu run pertama aplikasi, dilaporkan sebagai JSON
+_KODE_STARTUP = """
+import json, sys, time, warnings
+warnings.filterwarnings("ignore")
+mulai = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+impor = time.perf_counter()
+AppTest.from_file(sys.argv[1], default_timeout=60).run()
+selesai = time.perf_counter()
+print(json.dumps({"impor_streamlit": impor - mulai, "run_pertama": selesai - impor,
+                  "modul": [m for m in sys.argv[2:] if m in sys.modules]}))
+"""
+
+
+def ukur(fungsi, ulang=7, per_panggilan=1):
+    """Menjalankan `fungsi` beberapa kali dan mengembalikan median detik per operasi."""
+    waktu = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        waktu.append((time.perf_counter() - mulai) / per_panggilan)
+    return statistics.median(waktu)
+
+
+def bench_hitung_y():
+    hasil = {}
+    for ukuran in (10, 1_000, 100_000, 1_000_000):
+        x = np.linspace(-10, 10, ukuran)
+        hasil[f"hitung_y/n={ukuran}"] = ukur(lambda: hitung_y((2.0, -3.0, 7.0), x))
+    return hasil
+
+
+def bench_solver(jumlah=100_000):
+    rng = np.random.default_rng(0)
+    sistem = rng.integers(-20, 21, size=(jumlah, 2, 3)).astype(float)
+    contoh = [(tuple(s[0]), tuple(s[1])) for s in sistem[:2_000]]
+
+    def skalar():
+        for persamaan1, persamaan2 in contoh:
+            hitung_solusi_spldv(persamaan1, persamaan2)
+
+    def skalar_eksak():
+        for persamaan1, persamaan2 in contoh:
+            hitung_solusi_spldv(persamaan1, persamaan2, eksak=True)
+
+    return {
+        "solver/skalar_per_sistem": ukur(skalar, ulang=5, per_panggilan=len(contoh)),
+        "solver/skalar_eksak_per_sistem": ukur(skalar_eksak, ulang=5, per_panggilan=len(contoh)),
+        "solver/batch_per_sistem": ukur(lambda: hitung_solusi_spldv_batch(sistem), per_panggilan=jumlah),
+    }
+
+
+def bench_plot():
+    x_range = np.linspace(-10, 10, 400)
+    argumen = ((1.0, -1.0, 2.0), (2.0, 1.0, 7.0), x_range, "#4CAF50", "#FF5733")
+
+    def bangun():
+        plot_garis(*argumen, point_x=3.0, point_y=1.0)
+
+    penggambar = PenggambarGaris()
+    titik = iter(np.tile(np.linspace(-5, 5, 50), 1000))
+
+    def perbarui():
+        penggambar.perbarui(*argumen, point_x=next(titik), point_y=1.0)
+
+    fig = plot_garis(*argumen, point_x=3.0, point_y=1.0)
+
+    def render():
+        fig.savefig(io.BytesIO(), format="png", **OPSI_SAVEFIG)
+
+    return {
+        "plot/bangun_figure": ukur(bangun),
+        "plot/perbarui_figure": ukur(perbarui),
+        "plot/render_png": ukur(render, ulang=5),
+    }
+
+
+def bench_aplikasi(ulang=5):
+    from streamlit.testing.v1 import AppTest
+
+    hasil = {}
+    for nama, path in APLIKASI.items():
+        app = AppTest.from_file(str(path), default_timeout=60)
+        mulai = time.perf_counter()
+        app.run()
+        hasil[f"app/{nama}/run_pertama"] = time.perf_counter() - mulai
+
+        if nama == "kalkulatorspldv":
+            nilai = iter(np.linspace(-5, 5, ulang * 2))
+            aksi = lambda: app.slider[0].set_value(float(round(next(nilai), 1))).run()
+        else:
+            aksi = lambda: app.button[0].click().run()
+        hasil[f"app/{nama}/rerun"] = ukur(aksi, ulang=ulang)
+        if app.exception:
+            raise RuntimeError(f"{nama} gagal dijalankan: {app.exception[0].value}")
+    return hasil
+
+
+def bench_startup(ulang=3):
+    """
+    Mengukur cold start tiap aplikasi di proses Python baru: lama proses keseluruhan
+    dan lama run pertama skrip (impor milik aplikasi + render pertama).
+    Mengembalikan (hasil, modul berat yang termuat per aplikasi).
+    """
+    hasil = {}
+    modul_termuat = {}
+    for nama, path in APLIKASI.items():
+        proses, run_pertama = [], []
+        for _ in range(ulang):
+            mulai = time.perf_counter()
+            keluaran = subprocess.run([sys.executable, "-c", _KODE_STARTUP, str(path), *MODUL_BERAT],
+                                      capture_output=True, text=True, check=True).stdout
+            proses.append(time.perf_counter() - mulai)
+            laporan = json.loads(keluaran.strip().splitlines()[-1])
+            run_pertama.append(laporan["run_pertama"])
+        hasil[f"startup/{nama}/proses"] = statistics.median(proses)
+        hasil[f"startup/{nama}/run_pertama"] = statistics.median(run_pertama)
+        modul_termuat[nama] = laporan["modul"]
+    return hasil, modul_termuat
+
+
+def bandingkan(hasil, baseline, ambang=AMBANG_REGRESI):
+    """Mengembalikan daftar (nama, baseline, sekarang, rasio) untuk pengukuran yang melambat melewati ambang."""
+    regresi = []
+    for nama, detik in hasil.items():
+        acuan = baseline.get(nama)
+        if acuan and detik / acuan > ambang:
+            regresi.append((nama, acuan, detik, detik / acuan))
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark solver, plotting, dan rerun aplikasi SPLDV.")
+    parser.add_argument("--keluaran", type=Path, help="File JSON untuk menyimpan hasil")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="File baseline untuk pembanding")
+    parser.add_argument("--simpan-baseline", action="store_true", help="Menimpa baseline dengan hasil kali ini")
+    parser.add_argument("--ambang", type=float, default=AMBANG_REGRESI, help="Rasio perlambatan yang dianggap regresi")
+    parser.add_argument("--tanpa-aplikasi", action="store_true", help="Lewati pengukuran rerun aplikasi Streamlit")
+    parser.add_argument("--startup", action="store_true", help="Ukur juga cold start tiap aplikasi di proses baru")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    hasil = {}
+    for bench in (bench_hitung_y, bench_solver, bench_plot):
+        hasil.update(bench())
+    if not args.tanpa_aplikasi:
+        hasil.update(bench_aplikasi())
+    modul_termuat = {}
+    if args.startup:
+        hasil_startup, modul_termuat = bench_startup()
+        hasil.update(hasil_startup)
+
+    for nama, detik in hasil.items():
+        print(f"{nama:45s} {detik * 1e6:14.2f} µs")
+    for nama, modul in modul_termuat.items():
+        print(f"Modul berat setelah run pertama {nama}: {', '.join(modul) or '-'}")
+
+    laporan = {
+        "python": platform.python_version(),
+        "mesin": platform.machine(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "hasil": hasil,
+    }
+    if args.keluaran:
+        args.keluaran.write_text(json.dumps(laporan, indent=2))
+    if args.simpan_baseline:
+        args.baseline.write_text(json.dumps(laporan, indent=2) + "\n")
+        print(f"Baseline disimpan ke {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("Baseline belum ada; jalankan dengan --simpan-baseline.")
+        return 0
+    regresi = bandingkan(hasil, json.loads(args.baseline.read_text())["hasil"], args.ambang)
+    for nama, acuan, detik, rasio in regresi:
+        print(f"REGRESI {nama}: {acuan * 1e6:.2f} µs -> {detik * 1e6:.2f} µs ({rasio:.2f}x)")
+    if not regresi:
+        print(f"Tidak ada regresi di atas {args.ambang:.2f}x baseline.")
+    return 1 if regresi else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
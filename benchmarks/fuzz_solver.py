@@ -0,0 +1,551 @@
+"""
+Uji diferensial solver SPLDV dengan jutaan sistem acak dan sistem yang sengaja dibuat sulit.
+
+Implementasi yang dibandingkan:
+- cramer: hitung_solusi_spldv_batch (juga dipakai hitung_solusi_spldv mode float)
+- presisi_campuran: hitung_solusi_spldv_campuran dengan ulang="float64"; hasilnya harus sama dengan cramer
+- substitusi: salinan ter-vektorisasi solve_spldv_substitusi mode float, yang dipakai
+  spldv_calculator.py dan kalkulator_spldv2.py. Urutan operasinya sama persis dengan versi
+  skalar; kesamaan ini diperiksa ulang setiap run pada sampel baris.
+- cramer_eksak dan substitusi_eksak: selesaikan_eksak dan solve_spldv_substitusi(eksak=True),
+  skalar, sehingga hanya diperiksa pada sampel baris bulat; begitu pula presisi_campuran_eksak
+  (hitung_solusi_spldv_campuran dengan ulang="eksak"), yang x dan y-nya harus sama persis
+  dengan pembulatan solusi eksak.
+
+Setiap sistem dibangun dari koefisien bulat (|v| < 2^31) yang tiap persamaannya dikalikan
+pangkat dua 2^e. Perkalian ini tepat dalam float dan tidak mengubah solusi, sehingga status
+dan solusi eksak semua baris dapat dihitung dengan aritmetika int64 ter-vektorisasi.
+
+Ketidaksesuaian dikelompokkan per (implementasi, kategori); beberapa contoh dari setiap
+kelompok dikecilkan menjadi kasus paling sederhana yang masih memunculkan kategori yang sama.
+Keluar dengan kode 1 jika ada temuan di luar DIKETAHUI dan --abaikan.
+
+Contoh:
+    python benchmarks/fuzz_solver.py --jumlah 2000000 --seed 1 --keluaran fuzz.json
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from fractions import Fraction
+from pathlib import Path
+
+AKAR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(AKAR))
+
+import numpy as np
+
+from spldv.eksak import selesaikan_eksak
+from spldv.sistem_linear import kondisi_2x2
+from spldv.solver import hitung_solusi_spldv, hitung_solusi_spldv_batch, hitung_solusi_spldv_campuran
+from spldv.status import NAMA_STATUS, STATUS_BERHIMPIT, STATUS_PARALEL, STATUS_TIDAK_VALID, STATUS_UNIK
+from spldv.substitusi import (
+    GAGAL_A1_NOL,
+    GAGAL_B1_NOL,
+    GAGAL_DETERMINAN_NOL,
+    GAGAL_PERSAMAAN1_TIDAK_VALID,
+    TOLERANSI_PENYEBUT,
+    solve_spldv_substitusi,
+)
+
+UKURAN_POTONGAN = 250_000
+SAMPEL_CERMIN = 20_000 # Baris yang diperiksa ulang dengan solve_spldv_substitusi skalar
+SAMPEL_EKSAK = 20_000 # Baris bulat yang diselesaikan dengan kedua solver eksak
+CONTOH_PER_GENERATOR = 1 # Contoh mentah yang disimpan per (implementasi, kategori, generator)
+TOLERANSI_NILAI = 1e-6 # Galat relatif x, y terhadap solusi eksak
+FAKTOR_KONDISI = 100 # Galat sampai FAKTOR_KONDISI * kondisi * eps masih wajar untuk sistem yang buruk kondisinya
+
+# Kelas hasil: kode STATUS_* ditambah dua kelas khusus metode substitusi
+KELAS_SINGULAR = 4 # Penyebut hasil substitusi nol: sejajar, berhimpit, atau Persamaan 2 tidak valid
+KELAS_GAGAL = 5 # Substitusi balik gagal karena a1 atau b1 nol, walaupun determinan tidak nol
+
+_ALASAN = (None, GAGAL_PERSAMAAN1_TIDAK_VALID, GAGAL_DETERMINAN_NOL, GAGAL_B1_NOL, GAGAL_A1_NOL)
+_KELAS_ALASAN = np.array([STATUS_UNIK, STATUS_TIDAK_VALID, KELAS_SINGULAR, KELAS_GAGAL, KELAS_GAGAL], dtype=np.int8)
+
+KATEGORI = {
+    1: "unik_terlewat", # Solusi unik ada, tetapi implementasi menyatakan tidak ada
+    2: "gagal",         # Solusi unik ada, tetapi substitusi balik gagal
+    3: "unik_palsu",    # Tidak ada solusi unik, tetapi implementasi melanjutkan perhitungan
+    4: "jenis",         # Sama-sama tidak unik, tetapi jenisnya berbeda (misalnya sejajar vs berhimpit)
+    5: "tak_hingga",    # Solusi unik dilaporkan sebagai NaN atau inf
+    6: "nilai",         # x atau y menyimpang dari solusi eksak melebihi toleransi
+}
+_KODE_KATEGORI = {nama: kode for kode, nama in KATEGORI.items()}
+
+# Temuan yang sudah diketahui: (implementasi, kategori) -> (generator tempat temuan itu wajar, alasan).
+# Generator None berarti semua generator. Temuan ini tetap dilaporkan, tetapi tidak membuat run gagal;
+# temuan yang sama dari generator lain dianggap baru.
+_SKALA = ("hampir_sejajar", "skala", "ekstrem")
+_OVERFLOW = "Hasil kali koefisien melampaui rentang float (overflow/underflow), sehingga determinan menjadi inf, NaN, atau nol."
+DIKETAHUI = {
+    ("substitusi", "gagal"): (None, "Substitusi balik membagi dengan b1 (atau a1), sehingga gagal jika salah satunya nol."),
+    ("substitusi_eksak", "gagal"): (None, "Sama seperti substitusi float, dengan pembanding nol yang tepat."),
+    ("cramer", "unik_terlewat"): (_SKALA, "Toleransi determinan mutlak (1e-9): determinan sistem yang diskalakan kecil, "
+                                          "atau yang hilang karena pembulatan hasil kali di atas 2^53, dianggap nol; "
+                                          "determinan yang meluap menjadi inf/NaN berstatus tidak valid."),
+    ("substitusi", "unik_terlewat"): (_SKALA, "Toleransi penyebut mutlak (1e-9), seperti cramer."),
+    ("cramer", "jenis"): (("kelipatan", "skala", "ekstrem"),
+                          "Toleransi mutlak juga dipakai untuk det_x dan det_y, sehingga sistem sejajar yang "
+                          "diskalakan kecil dianggap berhimpit."),
+    **{(implementasi, kategori): (("ekstrem",), _OVERFLOW)
+       for implementasi in ("substitusi",) for kategori in ("unik_palsu", "tak_hingga", "nilai")},
+}
+# Presisi campuran dengan ulang="float64" harus memberi hasil yang sama dengan cramer, termasuk temuannya
+DIKETAHUI.update({("presisi_campuran", kategori): nilai for (implementasi, kategori), nilai in list(DIKETAHUI.items())
+                  if implementasi == "cramer"})
+
+
+# --- Generator sistem: (basis int64 (n, 6), eksponen int64 (n, 2)) ---
+
+def _bulat(rng, n, batas=20):
+    return rng.integers(-batas, batas + 1, (n, 6))
+
+
+def _tanpa_skala(n):
+    return np.zeros((n, 2), dtype=np.int64)
+
+
+def gen_acak(rng, n):
+    """Koefisien bulat kecil; nol muncul sesekali dengan sendirinya."""
+    return _bulat(rng, n), _tanpa_skala(n)
+
+
+def gen_nol(rng, n):
+    """Banyak koefisien nol: a1 = 0, garis vertikal, persamaan tidak valid."""
+    basis = _bulat(rng, n)
+    basis[rng.random((n, 6)) < 0.35] = 0
+    return basis, _tanpa_skala(n)
+
+
+def gen_kelipatan(rng, n):
+    """Persamaan 2 kelipatan Persamaan 1 (berhimpit) atau hanya berbeda konstanta (sejajar), sebagian diskalakan."""
+    basis = _bulat(rng, n)
+    k = rng.choice(np.array([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5]), n)
+    geser = np.where(rng.random(n) < 0.5, 0, rng.integers(-3, 4, n))
+    basis[:, 3:] = basis[:, :3] * k[:, None]
+    basis[:, 5] += geser
+    eksponen = np.where(rng.random((n, 2)) < 0.5, 0, rng.integers(-30, 31, (n, 2)))
+    return basis, eksponen
+
+
+def _egcd(a, b):
+    """Algoritma Euclid diperluas ter-vektorisasi: (g, u, v) dengan a*u + b*v = g."""
+    r0, r1 = a.copy(), b.copy()
+    s0, s1 = np.ones_like(a), np.zeros_like(a)
+    t0, t1 = np.zeros_like(a), np.ones_like(a)
+    while True:
+        aktif = r1 != 0
+        if not aktif.any():
+            return r0, s0, t0
+        q = np.where(aktif, r0 // np.where(aktif, r1, 1), 0)
+        r0, r1 = np.where(aktif, r1, r0), np.where(aktif, r0 - q * r1, r1)
+        s0, s1 = np.where(aktif, s1, s0), np.where(aktif, s0 - q * s1, s1)
+        t0, t1 = np.where(aktif, t1, t0), np.where(aktif, t0 - q * t1, t1)
+
+
+def gen_hampir_sejajar(rng, n):
+    """
+    Koefisien sampai 2^28 dengan determinan tepat -2..2: hasil kali koefisien melebihi 2^53,
+    sehingga determinan float bisa meleset jauh dari nilai sebenarnya.
+    """
+    a1 = rng.integers(1 << 20, 1 << 28, n)
+    b1 = rng.integers(1 << 20, 1 << 28, n)
+    _, u, v = _egcd(a1, b1)
+    delta = rng.integers(-2, 3, n)
+    t = rng.choice(np.array([-3, -2, -1, 1, 2, 3]), n)
+    a2 = -delta * v + t * a1
+    b2 = delta * u + t * b1
+    c1 = rng.integers(-(1 << 28), 1 << 28, n)
+    # Untuk delta = 0 Persamaan 2 adalah t * Persamaan 1: berhimpit, atau sejajar jika konstantanya digeser
+    c2 = np.where(delta == 0, t * c1 + rng.integers(0, 2, n), rng.integers(-(1 << 28), 1 << 28, n))
+    tanda_a = rng.choice(np.array([-1, 1]), n)
+    tanda_b = rng.choice(np.array([-1, 1]), n)
+    basis = np.column_stack([a1 * tanda_a, b1 * tanda_b, c1, a2 * tanda_a, b2 * tanda_b, c2])
+    return basis, _tanpa_skala(n)
+
+
+def gen_campuran(rng, n):
+    """Besar koefisien sangat berbeda dalam satu persamaan (m * 2^k), menguji pembagian tanpa pivot."""
+    basis = rng.integers(-3, 4, (n, 6)) << rng.integers(0, 29, (n, 6))
+    return basis, _tanpa_skala(n)
+
+
+def gen_skala(rng, n):
+    """Koefisien bulat kecil dengan setiap persamaan dikalikan 2^-60..2^60."""
+    return _bulat(rng, n), rng.integers(-60, 61, (n, 2))
+
+
+def gen_ekstrem(rng, n):
+    """Seperti gen_skala, tetapi sampai batas rentang float (2^-1000..2^990): menguji overflow dan underflow."""
+    return _bulat(rng, n), rng.integers(-1000, 991, (n, 2))
+
+
+GENERATOR = {
+    "acak": gen_acak,
+    "nol": gen_nol,
+    "kelipatan": gen_kelipatan,
+    "hampir_sejajar": gen_hampir_sejajar,
+    "campuran": gen_campuran,
+    "skala": gen_skala,
+    "ekstrem": gen_ekstrem,
+}
+
+
+def ke_float(basis, eksponen):
+    """Koefisien float (n, 6): setiap persamaan basis dikalikan 2^eksponen-nya (tepat, tanpa pembulatan)."""
+    return np.ldexp(basis.astype(float), np.repeat(eksponen, 3, axis=1))
+
+
+# --- Jawaban eksak dan implementasi ---
+
+def jawaban_eksak(basis):
+    """Status, x, y (float dari pecahan eksak), det_x, det_y, dan det int64 untuk setiap baris basis."""
+    a1, b1, c1, a2, b2, c2 = basis.T
+    determinan = a1 * b2 - a2 * b1
+    det_x = c1 * b2 - c2 * b1
+    det_y = a1 * c2 - a2 * c1
+    status = np.full(len(basis), STATUS_UNIK, dtype=np.int8)
+    status[determinan == 0] = STATUS_PARALEL
+    status[(determinan == 0) & (det_x == 0) & (det_y == 0)] = STATUS_BERHIMPIT
+    status[((a1 == 0) & (b1 == 0)) | ((a2 == 0) & (b2 == 0))] = STATUS_TIDAK_VALID
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = det_x / determinan
+        y = det_y / determinan
+    return status, x, y, det_x, det_y, determinan
+
+
+def kondisi_setara(basis):
+    """Bilangan kondisi matriks koefisien setelah setiap baris dinormalkan; skala persamaan tidak memengaruhinya."""
+    A = basis[:, [0, 1, 3, 4]].reshape(-1, 2, 2).astype(float)
+    skala = np.abs(A).max(axis=2, keepdims=True)
+    return kondisi_2x2(A / np.where(skala == 0, 1, skala))
+
+
+def jalankan_cramer(koefisien):
+    with np.errstate(invalid="ignore", over="ignore"):
+        x, y, status = hitung_solusi_spldv_batch(koefisien.reshape(-1, 2, 3))
+    return status, x, y
+
+
+def substitusi_batch(koefisien):
+    """
+    solve_spldv_substitusi (mode float) untuk banyak sistem sekaligus, dengan urutan operasi yang sama.
+    Mengembalikan (kode alasan: indeks _ALASAN, x, y); x dan y NaN jika gagal.
+    """
+    a1, b1, c1, a2, b2, c2 = koefisien.T
+    pakai_y = a1 == 0 # Langkah 1 menyatakan y dari Persamaan 1 jika a1 = 0
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        penyebut = np.where(pakai_y, a2 * b1 - b2 * a1, b2 * a1 - a2 * b1)
+        pembilang = np.where(pakai_y, c2 * b1 - b2 * c1, c2 * a1 - a2 * c1)
+        nilai_pertama = pembilang / penyebut
+
+        x_dari_x = (c1 - b1 * nilai_pertama) / a1
+        y_dari_x = (c1 - a1 * x_dari_x) / b1
+        y_dari_y = (c1 - a1 * nilai_pertama) / b1
+        x_dari_y = (c1 - b1 * y_dari_y) / a1
+    x = np.where(pakai_y, x_dari_y, x_dari_x)
+    y = np.where(pakai_y, y_dari_y, y_dari_x)
+
+    alasan = np.zeros(len(koefisien), dtype=np.int8)
+    alasan[~pakai_y & (np.abs(b1) < TOLERANSI_PENYEBUT)] = 3
+    alasan[pakai_y] = 4 # Substitusi balik lewat a1 selalu gagal pada cabang a1 = 0
+    alasan[np.abs(penyebut) < TOLERANSI_PENYEBUT] = 2
+    alasan[pakai_y & (b1 == 0)] = 1
+    gagal = alasan != 0
+    x[gagal] = np.nan
+    y[gagal] = np.nan
+    return alasan, x, y
+
+
+def jalankan_substitusi(koefisien):
+    alasan, x, y = substitusi_batch(koefisien)
+    return _KELAS_ALASAN[alasan], x, y
+
+
+def jalankan_campuran(koefisien):
+    with np.errstate(invalid="ignore", over="ignore"):
+        x, y, status, _ = hitung_solusi_spldv_campuran(koefisien.reshape(-1, 2, 3))
+    return status, x, y
+
+
+IMPLEMENTASI = {"cramer": jalankan_cramer, "presisi_campuran": jalankan_campuran, "substitusi": jalankan_substitusi}
+
+
+def kategorikan(status_eksak, kelas, tak_hingga, salah_nilai):
+    """Kode kategori per baris (0 = sesuai) dari kelas hasil implementasi dibandingkan status eksak."""
+    eksak_unik = status_eksak == STATUS_UNIK
+    dianggap_unik = (kelas == STATUS_UNIK) | (kelas == KELAS_GAGAL)
+    # Substitusi tidak membedakan sejajar, berhimpit, dan Persamaan 2 tidak valid
+    jenis_cocok = (kelas == status_eksak) | (kelas == KELAS_SINGULAR)
+    return np.select(
+        [
+            eksak_unik & (kelas == KELAS_GAGAL),
+            eksak_unik & ~dianggap_unik,
+            ~eksak_unik & dianggap_unik,
+            ~eksak_unik & ~jenis_cocok,
+            eksak_unik & (kelas == STATUS_UNIK) & tak_hingga,
+            eksak_unik & (kelas == STATUS_UNIK) & salah_nilai,
+        ],
+        [_KODE_KATEGORI[nama] for nama in ("gagal", "unik_terlewat", "unik_palsu", "jenis", "tak_hingga", "nilai")],
+        0,
+    )
+
+
+def evaluasi_float(basis, eksponen):
+    """Kategori setiap implementasi float untuk setiap baris: dict nama -> array kode kategori."""
+    koefisien = ke_float(basis, eksponen)
+    status_eksak, x_eksak, y_eksak = jawaban_eksak(basis)[:3]
+    with np.errstate(invalid="ignore", over="ignore"):
+        skala = np.maximum(1, np.maximum(np.abs(x_eksak), np.abs(y_eksak)))
+        batas = np.maximum(TOLERANSI_NILAI, FAKTOR_KONDISI * kondisi_setara(basis) * np.finfo(float).eps)
+    hasil = {}
+    for nama, jalankan in IMPLEMENTASI.items():
+        kelas, x, y = jalankan(koefisien)
+        with np.errstate(invalid="ignore", over="ignore"):
+            tak_hingga = ~(np.isfinite(x) & np.isfinite(y))
+            galat = np.maximum(np.abs(x - x_eksak), np.abs(y - y_eksak)) / skala
+        hasil[nama] = kategorikan(status_eksak, kelas, tak_hingga, ~(galat <= batas))
+    return hasil
+
+
+def _kelas_jejak(jejak):
+    return int(_KELAS_ALASAN[_ALASAN.index(jejak.alasan_gagal)])
+
+
+def evaluasi_eksak(basis):
+    """Kategori ketiga solver eksak untuk baris-baris basis bulat tanpa skala."""
+    status_eksak, _, _, det_x, det_y, determinan = jawaban_eksak(basis)
+    kelas = {"cramer_eksak": [], "substitusi_eksak": [], "presisi_campuran_eksak": []}
+    salah = {"cramer_eksak": [], "substitusi_eksak": [], "presisi_campuran_eksak": []}
+    x_campuran, y_campuran, status_campuran, _ = hitung_solusi_spldv_campuran(basis.reshape(-1, 2, 3), ulang="eksak")
+    kelas["presisi_campuran_eksak"] = status_campuran
+    for i, (baris, dx, dy, d) in enumerate(zip(basis.tolist(), det_x.tolist(), det_y.tolist(), determinan.tolist())):
+        x_benar, y_benar = (Fraction(dx, d), Fraction(dy, d)) if d != 0 else (None, None)
+        # Pembagian int Python dibulatkan dengan benar, sama seperti yang dijanjikan hitung_solusi_spldv_campuran
+        salah["presisi_campuran_eksak"].append(status_campuran[i] == STATUS_UNIK and d != 0
+                                               and (x_campuran[i], y_campuran[i]) != (dx / d, dy / d))
+        status, solusi_x, solusi_y = selesaikan_eksak(baris[:3], baris[3:])
+        kelas["cramer_eksak"].append(status)
+        salah["cramer_eksak"].append(status == STATUS_UNIK and (Fraction(*solusi_x), Fraction(*solusi_y)) != (x_benar, y_benar))
+        jejak = solve_spldv_substitusi(*baris, eksak=True)
+        kelas["substitusi_eksak"].append(_kelas_jejak(jejak))
+        salah["substitusi_eksak"].append(jejak.berhasil and (jejak.x, jejak.y) != (x_benar, y_benar))
+    tanpa_tak_hingga = np.zeros(len(basis), dtype=bool)
+    return {nama: kategorikan(status_eksak, np.array(kelas[nama], dtype=np.int8), tanpa_tak_hingga, np.array(salah[nama]))
+            for nama in kelas}
+
+
+def periksa_cermin(koefisien):
+    """Baris yang hasil substitusi_batch-nya berbeda dari solve_spldv_substitusi skalar (harus kosong)."""
+    alasan, x, y = substitusi_batch(koefisien)
+    berbeda = []
+    for i, baris in enumerate(koefisien.tolist()):
+        jejak = solve_spldv_substitusi(*baris)
+        x_skalar = np.nan if jejak.x is None else jejak.x
+        y_skalar = np.nan if jejak.y is None else jejak.y
+        if (_ALASAN[alasan[i]] != jejak.alasan_gagal
+                or not np.array_equal([x_skalar, y_skalar], [x[i], y[i]], equal_nan=True)):
+            berbeda.append(baris)
+    return berbeda
+
+
+# --- Pengecilan kasus ---
+
+def kategori_baris(basis, eksponen):
+    """Kategori semua implementasi untuk satu kasus; solver eksak hanya untuk kasus tanpa skala."""
+    basis = np.array([basis], dtype=np.int64)
+    eksponen = np.array([eksponen], dtype=np.int64)
+    hasil = {nama: int(kode[0]) for nama, kode in evaluasi_float(basis, eksponen).items()}
+    if not eksponen.any():
+        hasil.update({nama: int(kode[0]) for nama, kode in evaluasi_eksak(basis).items()})
+    return hasil
+
+
+def _calon_lebih_sederhana(basis, eksponen):
+    for i, e in enumerate(eksponen):
+        if e != 0:
+            yield basis, eksponen[:i] + [0] + eksponen[i + 1:]
+            if abs(e) > 1:
+                yield basis, eksponen[:i] + [int(e / 2)] + eksponen[i + 1:]
+    for i, v in enumerate(basis):
+        if v == 0:
+            continue
+        calon = [0]
+        if abs(v) > 1:
+            calon += [1 if v > 0 else -1, int(v / 2), v - (1 if v > 0 else -1)]
+        if v < 0:
+            calon.append(-v)
+        for baru in calon:
+            yield basis[:i] + [baru] + basis[i + 1:], eksponen
+
+
+def kecilkan(basis, eksponen, implementasi, kategori, batas_langkah=5000):
+    """Mengecilkan kasus selama kategori implementasi tersebut tetap muncul (pencarian rakus)."""
+    basis, eksponen = list(basis), list(eksponen)
+    for _ in range(batas_langkah):
+        for calon in _calon_lebih_sederhana(basis, eksponen):
+            if kategori_baris(*calon).get(implementasi) == kategori:
+                basis, eksponen = calon
+                break
+        else:
+            break
+    return basis, eksponen
+
+
+def _angka_json(nilai):
+    if nilai is None:
+        return None
+    nilai = float(nilai)
+    return nilai if math.isfinite(nilai) else repr(nilai)
+
+
+def rincian_kasus(basis, eksponen):
+    """Hasil setiap solver sungguhan (versi skalar) untuk satu kasus, untuk laporan."""
+    koefisien = ke_float(np.array([basis]), np.array([eksponen]))[0].tolist()
+    status, x, y = (nilai[0] for nilai in jawaban_eksak(np.array([basis]))[:3])
+    if status != STATUS_UNIK:
+        x = y = None
+    with np.errstate(invalid="ignore", over="ignore"):
+        x_cramer, y_cramer = hitung_solusi_spldv(koefisien[:3], koefisien[3:])
+    jejak = solve_spldv_substitusi(*koefisien)
+    return {
+        "koefisien": koefisien,
+        "basis": list(basis),
+        "eksponen": list(eksponen),
+        "eksak": {"status": NAMA_STATUS[int(status)], "x": _angka_json(x), "y": _angka_json(y)},
+        "cramer": {"x": _angka_json(x_cramer), "y": _angka_json(y_cramer)},
+        "substitusi": {"x": _angka_json(jejak.x), "y": _angka_json(jejak.y), "alasan_gagal": jejak.alasan_gagal},
+    }
+
+
+# --- Run ---
+
+def jalankan_fuzz(jumlah, generator=tuple(GENERATOR), seed=0, ukuran_potongan=UKURAN_POTONGAN):
+    """
+    Menjalankan `jumlah` sistem dibagi rata ke generator-generator terpilih.
+    Mengembalikan laporan (dict) berisi jumlah per generator, throughput, temuan beserta
+    contoh yang sudah dikecilkan, dan hasil pemeriksaan salinan ter-vektorisasi.
+    """
+    rng = np.random.default_rng(seed)
+    per_generator = -(-jumlah // len(generator))
+    hitungan = {} # (implementasi, kategori) -> {generator: jumlah}
+    contoh = {} # (implementasi, kategori, generator) -> (basis, eksponen)
+    sampel_cermin, sampel_eksak = [], []
+    mulai = time.perf_counter()
+
+    for nama_generator in generator:
+        sisa = per_generator
+        while sisa > 0:
+            n = min(sisa, ukuran_potongan)
+            sisa -= n
+            basis, eksponen = GENERATOR[nama_generator](rng, n)
+            for implementasi, kode in evaluasi_float(basis, eksponen).items():
+                for kategori in np.unique(kode[kode != 0]).tolist():
+                    baris = np.flatnonzero(kode == kategori)
+                    kunci = (implementasi, KATEGORI[kategori])
+                    per_gen = hitungan.setdefault(kunci, {})
+                    per_gen[nama_generator] = per_gen.get(nama_generator, 0) + len(baris)
+                    contoh.setdefault((*kunci, nama_generator), (basis[baris[0]].tolist(), eksponen[baris[0]].tolist()))
+            # Sampel untuk pemeriksaan skalar diambil merata dari setiap potongan
+            ambil = rng.choice(n, min(n, max(1, SAMPEL_CERMIN * n // jumlah)), replace=False)
+            sampel_cermin.append(ke_float(basis[ambil], eksponen[ambil]))
+            tanpa_skala = ambil[~eksponen[ambil].any(axis=1)]
+            sampel_eksak.append(basis[tanpa_skala[:max(1, SAMPEL_EKSAK * n // jumlah)]])
+    detik_float = time.perf_counter() - mulai
+
+    # Solver eksak skalar pada sampel baris bulat
+    basis_eksak = np.concatenate(sampel_eksak)
+    for implementasi, kode in evaluasi_eksak(basis_eksak).items():
+        for kategori in np.unique(kode[kode != 0]).tolist():
+            baris = np.flatnonzero(kode == kategori)
+            kunci = (implementasi, KATEGORI[kategori])
+            hitungan.setdefault(kunci, {})["sampel_bulat"] = len(baris)
+            contoh.setdefault((*kunci, "sampel_bulat"), (basis_eksak[baris[0]].tolist(), [0, 0]))
+
+    koefisien_cermin = np.concatenate(sampel_cermin)
+    cermin_berbeda = periksa_cermin(koefisien_cermin)
+
+    temuan = []
+    for (implementasi, kategori), per_gen in sorted(hitungan.items()):
+        kasus = []
+        for (impl, kat, _), (basis, eksponen) in contoh.items():
+            if (impl, kat) != (implementasi, kategori):
+                continue
+            kecil = kecilkan(basis, eksponen, implementasi, _KODE_KATEGORI[kategori])
+            if kecil not in kasus:
+                kasus.append(kecil)
+        generator_wajar, alasan = DIKETAHUI.get((implementasi, kategori), ((), None))
+        temuan.append({
+            "implementasi": implementasi,
+            "kategori": kategori,
+            "jumlah": sum(per_gen.values()),
+            "per_generator": per_gen,
+            "diketahui": alasan,
+            "generator_baru": [nama for nama in per_gen if generator_wajar is not None and nama not in generator_wajar],
+            "contoh": [rincian_kasus(*k) for k in kasus],
+        })
+
+    total = per_generator * len(generator)
+    return {
+        "jumlah": total,
+        "seed": seed,
+        "generator": {nama: per_generator for nama in generator},
+        "detik": time.perf_counter() - mulai,
+        "sistem_per_detik": total / detik_float,
+        "sampel_eksak": len(basis_eksak),
+        "cermin": {"diperiksa": len(koefisien_cermin), "berbeda": cermin_berbeda[:10]},
+        "temuan": temuan,
+    }
+
+
+def temuan_baru(laporan, abaikan=()):
+    """Temuan yang membuat run gagal: muncul dari generator di luar DIKETAHUI dan tidak ada di `abaikan`."""
+    return [t for t in laporan["temuan"]
+            if t["generator_baru"] and f"{t['implementasi']}:{t['kategori']}" not in abaikan]
+
+
+def cetak_laporan(laporan, abaikan=()):
+    print(f"{laporan['jumlah']:,} sistem, {laporan['sistem_per_detik']:,.0f} sistem/detik (float), "
+          f"total {laporan['detik']:.1f} detik; {laporan['sampel_eksak']:,} baris bulat untuk solver eksak")
+    cermin = laporan["cermin"]
+    print(f"Salinan ter-vektorisasi substitusi: {cermin['diperiksa']:,} baris diperiksa, "
+          f"{len(cermin['berbeda'])} berbeda dari versi skalar")
+    if not laporan["temuan"]:
+        print("Tidak ada ketidaksesuaian.")
+    baru = temuan_baru(laporan, abaikan)
+    for t in laporan["temuan"]:
+        if t in baru:
+            tanda = "BARU: " + ", ".join(t["generator_baru"])
+        else:
+            tanda = "diabaikan" if t["generator_baru"] else "diketahui"
+        rincian = ", ".join(f"{nama} {jumlah:,}" for nama, jumlah in t["per_generator"].items())
+        print(f"\n[{tanda}] {t['implementasi']} / {t['kategori']}: {t['jumlah']:,} ({rincian})")
+        if t["diketahui"]:
+            print(f"  {t['diketahui']}")
+        for c in t["contoh"]:
+            print(f"  basis {c['basis']} x 2^{c['eksponen']}")
+            print(f"    eksak {c['eksak']} | cramer {c['cramer']} | substitusi {c['substitusi']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji diferensial solver SPLDV (Cramer, substitusi, eksak).")
+    parser.add_argument("--jumlah", type=int, default=2_000_000, help="Jumlah sistem, dibagi rata ke generator")
+    parser.add_argument("--generator", default=",".join(GENERATOR), help="Generator yang dipakai, dipisah koma")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--abaikan", action="append", default=[], metavar="IMPLEMENTASI:KATEGORI",
+                        help="Temuan yang tidak membuat run gagal (boleh diulang)")
+    parser.add_argument("--keluaran", type=Path, help="File JSON untuk menyimpan laporan lengkap")
+    args = parser.parse_args(argv)
+
+    laporan = jalankan_fuzz(args.jumlah, tuple(args.generator.split(",")), args.seed)
+    cetak_laporan(laporan, args.abaikan)
+    if args.keluaran:
+        args.keluaran.write_text(json.dumps(laporan, indent=2))
+
+    return 1 if temuan_baru(laporan, args.abaikan) or laporan["cermin"]["berbeda"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,104 +1,65 @@
+import io
+import sys
+from pathlib import Path
+
 import streamlit as st
-import matplotlib.pyplot as plt
 import numpy as np
 import time
 
+# Akar repositori ditambahkan ke sys.path agar paket bersama `spldv` dapat diimpor
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spldv.plotting import PenggambarGaris, render_plot_garis
+from spldv.cache_solusi import hitung_solusi_spldv_cache
+from spldv.kelas_streamlit import catat_percobaan_sesi, dasbor_guru_aktif, tampilkan_dasbor_guru, tandai_x_coba_digeser
+from spldv.latihan_streamlit import tampilkan_pilihan_soal
+from spldv.metrik import catat_bagian, tambah_hitungan, ukur_bagian
+from spldv.metrik_streamlit import panel_debug_aktif, tampilkan_panel_debug
+from spldv.solver import hitung_y
+
 # --- Fungsi-fungsi Utama ---
 
-def hitung_y(persamaan, x_val):
-    """
-    Menghitung nilai y berdasarkan persamaan dan nilai x.
-    Persamaan diberikan dalam bentuk (a, b, c) untuk ax + by = c.
-    """
-    a, b, c = persamaan
-    if b == 0:
-        return np.full_like(x_val, np.nan) # Mengembalikan NaN untuk y jika b=0
-    return (c - a * x_val) / b
+def catat_durasi(nama, mulai):
+    """Menyimpan lama eksekusi terakhir satu bagian halaman ke session_state dan ke metrik proses."""
+    detik = time.perf_counter() - mulai
+    st.session_state.setdefault("durasi_bagian", {})[nama] = detik
+    catat_bagian(f"kalkulatorspldv/{nama}", detik)
+
 
-def plot_garis(persamaan1, persamaan2, x_range, color1, color2, point_x=None, point_y=None, show_exact_point=False):
+def laporkan_rerun_parsial(nama):
     """
-    Membuat plot dua garis dan menandai titik potong jika ada.
+    Jika fragmen `nama` dijalankan ulang sendirian (bukan bagian dari rerun penuh), catat
+    perkiraan pekerjaan bagian lain yang dilewati berdasarkan durasi terakhirnya. Keterangannya
+    hanya ditampilkan dengan ?debug=1; totalnya juga muncul di panel debug.
     """
-    fig, ax = plt.subplots(figsize=(10, 7)) # Ukuran plot lebih besar
-
-    a1, b1, c1 = persamaan1
-    a2, b2, c2 = persamaan2
-
-    # Plot Persamaan 1
-    if b1 != 0:
-        y1 = hitung_y(persamaan1, x_range)
-        ax.plot(x_range, y1, label=f'{a1:.0f}x + {b1:.0f}y = {c1:.0f} (Garis 1)', color=color1, linewidth=2)
-    else: # Garis vertikal
-        if a1 != 0:
-            ax.axvline(x=c1/a1, color=color1, linestyle='--', label=f'x = {c1/a1:.0f} (Garis 1)', linewidth=2)
-
-    # Plot Persamaan 2
-    if b2 != 0:
-        y2 = hitung_y(persamaan2, x_range)
-        ax.plot(x_range, y2, label=f'{a2:.0f}x + {b2:.0f}y = {c2:.0f} (Garis 2)', color=color2, linewidth=2)
-    else: # Garis vertikal
-        if a2 != 0:
-            ax.axvline(x=c2/a2, color=color2, linestyle='--', label=f'x = {c2/a2:.0f} (Garis 2)', linewidth=2)
-
-    # Plot titik coba atau titik solusi yang ditemukan
-    if point_x is not None and point_y is not None and not np.isnan(point_x) and not np.isinf(point_x) and not np.isnan(point_y) and not np.isinf(point_y):
-        marker_color = 'purple' if not show_exact_point else 'green'
-        label_text = f'Titik Coba ({point_x:.0f}, {point_y:.0f})' if not show_exact_point else f'Solusi Akurat ({point_x:.0f}, {point_y:.0f})'
-        ax.scatter(point_x, point_y, color=marker_color, s=150, zorder=5, label=label_text, edgecolor='black', linewidth=1.5)
-
-    ax.set_xlabel("Nilai X", fontsize=12)
-    ax.set_ylabel("Nilai Y", fontsize=12)
-    ax.set_title("Grafik Persamaan Linear", fontsize=14, fontweight='bold')
-    ax.axhline(0, color='grey', linewidth=0.7, linestyle=':')
-    ax.axvline(0, color='grey', linewidth=0.7, linestyle=':')
-    ax.grid(True, linestyle='--', alpha=0.6)
-    ax.legend(fontsize=10)
-    ax.set_xlim(x_range.min(), x_range.max())
-
-    # Auto-adjust Y limits, handling inf/nan values from vertical lines
-    all_y_vals = []
-    if b1 != 0:
-        valid_y1 = y1[~np.isnan(y1) & ~np.isinf(y1)]
-        if valid_y1.size > 0: all_y_vals.extend(valid_y1)
-    if b2 != 0:
-        valid_y2 = y2[~np.isnan(y2) & ~np.isinf(y2)]
-        if valid_y2.size > 0: all_y_vals.extend(valid_y2)
-
-    if all_y_vals:
-        min_y = np.min(all_y_vals) - 1.5
-        max_y = np.max(all_y_vals) + 1.5
-        # Prevent very narrow or inverted Y limits
-        if max_y - min_y < 5:
-            mid_y = (min_y + max_y) / 2
-            min_y = mid_y - 2.5
-            max_y = mid_y + 2.5
-        ax.set_ylim(min_y, max_y)
-    else: # Default range if no valid Y values (e.g., both vertical)
-        ax.set_ylim(-5, 5)
-
-    plt.tight_layout() # Memperbaiki layout plot
-    return fig
-
-def hitung_solusi_spldv(persamaan1, persamaan2):
+    if st.session_state.get("_rerun_penuh", False):
+        return
+    tambah_hitungan(f"rerun_fragmen/kalkulatorspldv/{nama}")
+    dilewati = sum(detik for bagian, detik in st.session_state.get("durasi_bagian", {}).items() if bagian != nama)
+    st.session_state["jumlah_rerun_parsial"] = st.session_state.get("jumlah_rerun_parsial", 0) + 1
+    st.session_state["total_dilewati"] = st.session_state.get("total_dilewati", 0.0) + dilewati
+    if not panel_debug_aktif():
+        return
+    # Fragmen tidak boleh menulis ke sidebar, jadi keterangan per rerun tetap di dalam fragmen
+    st.caption(f"⚡ Rerun parsial: hanya bagian ini yang dijalankan ulang, sekitar {dilewati * 1000:.0f} ms "
+               f"pekerjaan bagian lain dilewati (total {st.session_state['total_dilewati']:.2f} detik dari "
+               f"{st.session_state['jumlah_rerun_parsial']} rerun parsial di sesi ini).")
+
+
+def penggambar_sesi():
     """
-    Menghitung solusi SPLDV menggunakan metode eliminasi/substitusi.
-    Mengembalikan (x, y) atau (None, None) jika paralel/identik, atau (float('inf'), float('inf')) untuk vertikal identik.
+    PenggambarGaris milik sesi ini, dibuat sekali pada pemakaian pertama.
+    Figure-nya dipakai ulang di setiap rerun dan ikut dibebaskan saat session_state sesi dibuang.
     """
-    a1, b1, c1 = persamaan1
-    a2, b2, c2 = persamaan2
+    if "penggambar_garis" not in st.session_state:
+        st.session_state["penggambar_garis"] = PenggambarGaris()
+    return st.session_state["penggambar_garis"]
 
-    determinant = a1 * b2 - a2 * b1
 
-    if abs(determinant) < 1e-9: # Perbandingan dengan toleransi untuk floating point
-        # Garis paralel atau identik
-        if abs(a1 * c2 - a2 * c1) < 1e-9 and abs(b1 * c2 - b2 * c1) < 1e-9:
-            return float('inf'), float('inf') # Mengindikasikan tak terhingga solusi
-        else:
-            return None, None # Garis paralel
-    else:
-        x = (c1 * b2 - c2 * b1) / determinant
-        y = (a1 * c2 - a2 * c1) / determinant
-        return x, y
+@st.cache_resource
+def muat_ikon():
+    """Ikon sidebar dari berkas lokal; dibaca sekali lalu dipakai bersama oleh semua sesi."""
+    return (Path(__file__).resolve().parent / "assets" / "ikon_grafik.svg").read_text()
 
 # --- Konfigurasi Halaman Streamlit ---
 st.set_page_config(
@@ -107,9 +68,19 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Dasbor guru (?guru=1) berjalan di server yang sama agar dapat membaca rekap semua sesi siswa
+if dasbor_guru_aktif():
+    tampilkan_dasbor_guru()
+    st.stop()
+
+# Bagian di luar fragmen hanya berjalan saat rerun penuh; fragmen memakai penanda ini untuk membedakannya
+st.session_state["_rerun_penuh"] = True
+mulai_halaman = time.perf_counter()
+tambah_hitungan("rerun/kalkulatorspldv")
+
 # --- Sidebar ---
 with st.sidebar:
-    st.image("https://www.freeiconspng.com/uploads/graph-icon-png-1.png", width=100)
+    st.image(muat_ikon(), width=100)
     st.header("Pengaturan Aplikasi")
     st.markdown("""
         Selamat datang di Kalkulator SPLDV Interaktif!
@@ -121,10 +92,17 @@ with st.sidebar:
     line1_color = st.color_picker("Warna Garis 1", "#4CAF50") # Hijau
     line2_color = st.color_picker("Warna Garis 2", "#FF5733") # Oranye
 
+    st.subheader("Mode Eksplorasi")
+    mode_cepat = st.toggle("Eksplorasi cepat", value=False,
+                           help="Nilai Y untuk semua posisi slider dihitung sekali, lalu slider, nilai Y, "
+                                "dan titik coba diperbarui langsung di browser tanpa memuat ulang halaman.")
+
+    tampilkan_pilihan_soal(("a1_main", "b1_main", "c1_main", "a2_main", "b2_main", "c2_main"), (1, -1, 2, 2, 1, 7))
+
     st.markdown("---")
     st.write("Dibuat dengan ❤️ oleh Mahasiswa/i")
     if st.button("Reset Aplikasi"):
-        st.experimental_rerun()
+        st.rerun()
 
 # --- Judul dan Deskripsi Utama ---
 st.title("✨ Kalkulator SPLDV (Metode Discovery Learning)")
@@ -142,16 +120,16 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Persamaan 1")
-    a1 = st.number_input("Koefisien a1 (untuk x):", value=1.0, key="a1_main", help="Koefisien variabel x pada Persamaan 1")
-    b1 = st.number_input("Koefisien b1 (untuk y):", value=-1.0, key="b1_main", help="Koefisien variabel y pada Persamaan 1")
-    c1 = st.number_input("Konstanta c1:", value=2.0, key="c1_main", help="Nilai konstanta pada Persamaan 1")
+    a1 = st.number_input("Koefisien a1 (untuk x):", key="a1_main", help="Koefisien variabel x pada Persamaan 1")
+    b1 = st.number_input("Koefisien b1 (untuk y):", key="b1_main", help="Koefisien variabel y pada Persamaan 1")
+    c1 = st.number_input("Konstanta c1:", key="c1_main", help="Nilai konstanta pada Persamaan 1")
     st.info(f"**Persamaan 1:** ${a1:.0f}x + {b1:.0f}y = {c1:.0f}$")
 
 with col2:
     st.subheader("Persamaan 2")
-    a2 = st.number_input("Koefisien a2 (untuk x):", value=2.0, key="a2_main", help="Koefisien variabel x pada Persamaan 2")
-    b2 = st.number_input("Koefisien b2 (untuk y):", value=1.0, key="b2_main", help="Koefisien variabel y pada Persamaan 2")
-    c2 = st.number_input("Konstanta c2:", value=7.0, key="c2_main", help="Nilai konstanta pada Persamaan 2")
+    a2 = st.number_input("Koefisien a2 (untuk x):", key="a2_main", help="Koefisien variabel x pada Persamaan 2")
+    b2 = st.number_input("Koefisien b2 (untuk y):", key="b2_main", help="Koefisien variabel y pada Persamaan 2")
+    c2 = st.number_input("Konstanta c2:", key="c2_main", help="Nilai konstanta pada Persamaan 2")
     st.info(f"**Persamaan 2:** ${a2:.0f}x + {b2:.0f}y = {c2:.0f}$")
 
 persamaan1 = (a1, b1, c1)
@@ -165,158 +143,300 @@ if (b2 == 0 and a2 == 0):
     st.error("🚨 Kesalahan: Koefisien 'a2' dan 'b2' tidak boleh keduanya nol untuk Persamaan 2. Harap perbaiki input Anda.")
     st.stop()
 
-# --- Bagian Discovery Learning ---
-st.header("2. Temukan Titik Potong dengan Eksplorasi!")
-st.markdown("""
-    Geser slider **Nilai X Coba** di bawah ini dan perhatikan bagaimana nilai Y berubah untuk kedua garis di plot.
-    **Tujuan Anda adalah menemukan nilai X di mana kedua garis berpotongan, yaitu saat nilai Y dari kedua garis sama!**
-""")
+catat_durasi("input", mulai_halaman)
+x_range = np.linspace(-10, 10, 400) # Range X untuk plotting
 
-# Slider untuk nilai X yang dicoba
-x_coba = st.slider("➡️ Geser Nilai X Coba:", min_value=-10.0, max_value=10.0, value=0.0, step=0.1,
-                   help="Geser slider ini untuk mencoba berbagai nilai X.")
+# --- Bagian Discovery Learning ---
+@st.fragment
+def bagian_discovery(persamaan1, persamaan2, line1_color, line2_color, mode_cepat):
+    """
+    Bagian 2 (eksplorasi) dan 3 (visualisasi) sebagai satu fragmen.
+    Slider X coba berada di dalam fragmen ini, sehingga menggesernya hanya menjalankan ulang
+    metrik dan plot eksplorasi, bukan input maupun bagian solusi matematis.
+    """
+    mulai = time.perf_counter()
+    a1, b1, c1 = persamaan1
+    a2, b2, c2 = persamaan2
 
-with st.spinner('Menghitung nilai Y...'):
-    y1_coba_raw = hitung_y(persamaan1, np.array([x_coba]))[0]
-    y2_coba_raw = hitung_y(persamaan2, np.array([x_coba]))[0]
-    time.sleep(0.1) # Sedikit delay untuk melihat spinner
+    st.header("2. Temukan Titik Potong dengan Eksplorasi!")
+    st.markdown("""
+        Geser slider **Nilai X Coba** di bawah ini dan perhatikan bagaimana nilai Y berubah untuk kedua garis di plot.
+        **Tujuan Anda adalah menemukan nilai X di mana kedua garis berpotongan, yaitu saat nilai Y dari kedua garis sama!**
+    """)
 
-st.subheader("📊 Hasil Percobaan Anda:")
 
-col_res1, col_res2, col_diff = st.columns(3)
+    # Mode eksplorasi cepat hanya untuk dua garis non-vertikal; garis vertikal tetap memakai alur biasa
+    if mode_cepat and b1 != 0 and b2 != 0:
+        # Altair dan pandas baru dimuat saat mode eksplorasi benar-benar dipakai
+        from spldv.eksplorasi import chart_eksplorasi, hitung_grid_eksplorasi
 
-with col_res1:
-    if b1 == 0:
-        if a1 != 0:
-            st.code(f"Persamaan 1: x = {c1/a1:.0f} (Garis Vertikal)")
-        else:
-            st.error("Persamaan 1 tidak valid.")
+        grid_eksplorasi = hitung_grid_eksplorasi(persamaan1, persamaan2)
+        st.altair_chart(chart_eksplorasi(grid_eksplorasi, persamaan1, persamaan2, line1_color, line2_color),
+                        width="stretch")
+        st.caption("Titik ungu pada grafik menunjukkan perkiraan titik potong berdasarkan nilai X coba Anda. "
+                   "Nilai Y dan titik coba diperbarui langsung di browser.")
     else:
-        st.metric(label="Y1 (dari Persamaan 1)", value=f"{y1_coba_raw:.0f}")
+        # Slider untuk nilai X yang dicoba
+        x_coba = st.slider("➡️ Geser Nilai X Coba:", min_value=-10.0, max_value=10.0, value=0.0, step=0.1,
+                           on_change=tandai_x_coba_digeser, help="Geser slider ini untuk mencoba berbagai nilai X.")
+
+        with ukur_bagian("kalkulatorspldv/spinner"), st.spinner('Menghitung nilai Y...'):
+            with ukur_bagian("kalkulatorspldv/hitung_y"):
+                y1_coba_raw = hitung_y(persamaan1, np.array([x_coba]))[0]
+                y2_coba_raw = hitung_y(persamaan2, np.array([x_coba]))[0]
+            time.sleep(0.1) # Sedikit delay untuk melihat spinner
+
+        st.subheader("📊 Hasil Percobaan Anda:")
+
+        col_res1, col_res2, col_diff = st.columns(3)
+
+        with col_res1:
+            if b1 == 0:
+                if a1 != 0:
+                    st.code(f"Persamaan 1: x = {c1/a1:.0f} (Garis Vertikal)")
+                else:
+                    st.error("Persamaan 1 tidak valid.")
+            else:
+                st.metric(label="Y1 (dari Persamaan 1)", value=f"{y1_coba_raw:.0f}")
+
+        with col_res2:
+            if b2 == 0:
+                if a2 != 0:
+                    st.code(f"Persamaan 2: x = {c2/a2:.0f} (Garis Vertikal)")
+                else:
+                    st.error("Persamaan 2 tidak valid.")
+            else:
+                st.metric(label="Y2 (dari Persamaan 2)", value=f"{y2_coba_raw:.0f}")
+
+        with col_diff:
+            tolerance = 0.05 # Toleransi untuk dianggap "sama"
+            diff_y = abs(y1_coba_raw - y2_coba_raw) if b1 != 0 and b2 != 0 else float('inf')
+
+            if b1 != 0 and b2 != 0:
+                if diff_y < tolerance:
+                    st.metric(label="Perbedaan |Y1 - Y2|", value=f"{diff_y:.0f}", delta="✅ Sangat dekat!", delta_color="normal")
+                else:
+                    st.metric(label="Perbedaan |Y1 - Y2|", value=f"{diff_y:.0f}", delta="Perlu disesuaikan", delta_color="inverse")
+            else:
+                st.markdown("Perbedaan Y tidak relevan untuk garis vertikal.")
+
+
+        # Umpan Balik / Petunjuk
+        is_solution_found_by_discovery = False
+
+        if b1 != 0 and b2 != 0: # Kedua garis non-vertikal
+            if abs(y1_coba_raw - y2_coba_raw) < tolerance:
+                st.success(f"🎉 **SELAMAT!** Anda telah menemukan titik di mana $y_1$ dan $y_2$ sangat dekat!")
+                st.balloons()
+                st.markdown(f"**Titik potong kira-kira adalah:** $({x_coba:.0f}, {(y1_coba_raw + y2_coba_raw) / 2:.0f})$")
+                is_solution_found_by_discovery = True
+            else:
+                st.warning(f"**Petunjuk:** $y_1$ dan $y_2$ belum sama. ")
+                if y1_coba_raw < y2_coba_raw:
+                    st.info("💡 **Tips:** Coba geser **Nilai X Coba** ke kanan untuk membuat $y_1$ dan $y_2$ bertemu.")
+                else:
+                    st.info("💡 **Tips:** Coba geser **Nilai X Coba** ke kiri untuk membuat $y_1$ dan $y_2$ bertemu.")
+            catat_percobaan_sesi(persamaan1, persamaan2, x_coba, is_solution_found_by_discovery)
+        elif b1 == 0 and b2 == 0: # Kedua garis vertikal
+            if a1 != 0 and a2 != 0 and abs(c1/a1 - c2/a2) < tolerance:
+                st.success("🎉 **SELAMAT!** Kedua persamaan adalah garis vertikal yang sama. Terdapat **tak terhingga solusi**.")
+                is_solution_found_by_discovery = True
+            else:
+                st.error("🚨 Kedua persamaan adalah garis vertikal yang paralel. **Tidak ada solusi**.")
+                is_solution_found_by_discovery = True
+        elif b1 == 0 and a1 != 0: # Persamaan 1 vertikal, Persamaan 2 non-vertikal
+            x_intersect_p1 = c1 / a1
+            y_from_p2 = hitung_y(persamaan2, np.array([x_intersect_p1]))[0]
+            st.success(f"🎉 **SELAMAT!** Persamaan 1 adalah garis vertikal $x = {x_intersect_p1:.0f}$.")
+            st.markdown(f"Jika $x = {x_intersect_p1:.0f}$, maka $y_2$ dari Persamaan 2 adalah $\\mathbf{{{y_from_p2:.0f}}}$.")
+            st.markdown(f"**Titik potongnya adalah:** $({x_intersect_p1:.0f}, {y_from_p2:.0f})$")
+            is_solution_found_by_discovery = True
+        elif b2 == 0 and a2 != 0: # Persamaan 2 vertikal, Persamaan 1 non-vertikal
+            x_intersect_p2 = c2 / a2
+            y_from_p1 = hitung_y(persamaan1, np.array([x_intersect_p2]))[0]
+            st.success(f"🎉 **SELAMAT!** Persamaan 2 adalah garis vertikal $x = {x_intersect_p2:.0f}$.")
+            st.markdown(f"Jika $x = {x_intersect_p2:.0f}$, maka $y_1$ dari Persamaan 1 adalah $\\mathbf{{{y_from_p1:.0f}}}$.")
+            st.markdown(f"**Titik potongnya adalah:** $({x_intersect_p2:.0f}, {y_from_p1:.0f})$")
+            is_solution_found_by_discovery = True
+
+
+        # --- Bagian Visualisasi ---
+        st.header("3. Visualisasi Grafik")
+        st.markdown("Perhatikan bagaimana kedua garis berinteraksi saat Anda mengubah nilai X.")
+
+        # Tentukan titik yang akan ditandai di plot
+        plot_x_marker = x_coba
+        plot_y_marker = None
+
+        # Logika penentuan plot_x_marker dan plot_y_marker
+        if b1 == 0 and a1 != 0: # Persamaan 1 vertikal
+            plot_x_marker = c1 / a1
+            if b2 != 0: # Jika P2 non-vertikal
+                plot_y_marker = hitung_y(persamaan2, np.array([plot_x_marker]))[0]
+            # Jika P2 juga vertikal, plot_y_marker tetap None
+        elif b2 == 0 and a2 != 0: # Persamaan 2 vertikal
+            plot_x_marker = c2 / a2
+            if b1 != 0: # Jika P1 non-vertikal
+                plot_y_marker = hitung_y(persamaan1, np.array([plot_x_marker]))[0]
+            # Jika P1 juga vertikal, plot_y_marker tetap None
+        else: # Kedua garis non-vertikal
+            if abs(y1_coba_raw - y2_coba_raw) < tolerance: # Jika sudah dekat
+                plot_y_marker = (y1_coba_raw + y2_coba_raw) / 2
+            else: # Jika belum dekat, plot di titik coba x
+                plot_y_marker = (y1_coba_raw + y2_coba_raw) / 2
+
+        # Pastikan plot_y_marker bukan NaN atau Inf
+        if plot_y_marker is not None and (np.isnan(plot_y_marker) or np.isinf(plot_y_marker)):
+            plot_y_marker = None
+        if plot_x_marker is not None and (np.isnan(plot_x_marker) or np.isinf(plot_x_marker)):
+            plot_x_marker = None
+
+
+        with ukur_bagian("kalkulatorspldv/plot"):
+            gambar_plot = render_plot_garis(persamaan1, persamaan2, x_range, line1_color, line2_color,
+                                            point_x=plot_x_marker, point_y=plot_y_marker, show_exact_point=False,
+                                            penggambar=penggambar_sesi())
+        with ukur_bagian("kalkulatorspldv/kirim_gambar"):
+            st.image(gambar_plot, width="stretch")
+        st.caption("Titik ungu pada grafik menunjukkan perkiraan titik potong berdasarkan nilai X coba Anda.")
+
+    catat_durasi("discovery", mulai)
+    laporkan_rerun_parsial("discovery")
+
+
+bagian_discovery(persamaan1, persamaan2, line1_color, line2_color, mode_cepat)
 
-with col_res2:
-    if b2 == 0:
-        if a2 != 0:
-            st.code(f"Persamaan 2: x = {c2/a2:.0f} (Garis Vertikal)")
-        else:
-            st.error("Persamaan 2 tidak valid.")
-    else:
-        st.metric(label="Y2 (dari Persamaan 2)", value=f"{y2_coba_raw:.0f}")
 
-with col_diff:
-    tolerance = 0.05 # Toleransi untuk dianggap "sama"
-    diff_y = abs(y1_coba_raw - y2_coba_raw) if b1 != 0 and b2 != 0 else float('inf')
+# --- Bagian Solusi Matematis (untuk konfirmasi) ---
+@st.fragment
+def bagian_solusi(persamaan1, persamaan2, line1_color, line2_color):
+    """Bagian 4 tidak bergantung pada slider, sehingga tidak ikut dijalankan ulang saat slider digeser."""
+    mulai = time.perf_counter()
+    st.header("4. Konfirmasi Solusi Matematis (Opsional)")
+    st.markdown("Jika Anda ingin mengkonfirmasi jawaban atau kesulitan menemukannya, Anda bisa melihat solusi matematisnya di sini.")
+
+    with st.expander("Klik untuk Menampilkan Solusi Matematis"):
+        # Sistem yang setara (kelipatan atau urutan ditukar) berbagi satu entri cache lintas sesi
+        solusi_x, solusi_y = hitung_solusi_spldv_cache(persamaan1, persamaan2, eksak=True)
+
+        if solusi_x is not None and solusi_y is not None:
+            if solusi_x == float('inf') and solusi_y == float('inf'):
+                st.info("ℹ️ Kedua persamaan adalah **garis yang sama**. Terdapat **tak terhingga solusi**.")
+            else:
+                st.success(f"✅ Secara matematis, titik potongnya adalah: $x = \\mathbf{{{solusi_x:.0f}}}$, $y = \\mathbf{{{solusi_y:.0f}}}$")
+                st.markdown(f"**Titik potong akurat:** $\\left({solusi_x:.0f}, {solusi_y:.0f}\\right)$")
+                # Tambahkan plot solusi matematis
+                st.markdown("---")
+                st.subheader("Plot dengan Titik Solusi Akurat")
+                gambar_sol = render_plot_garis(persamaan1, persamaan2, x_range, line1_color, line2_color,
+                                               point_x=solusi_x, point_y=solusi_y, show_exact_point=True,
+                                               penggambar=penggambar_sesi())
+                st.image(gambar_sol, width="stretch")
+                st.caption("Titik hijau pada grafik ini menunjukkan titik potong yang akurat secara matematis.")
 
-    if b1 != 0 and b2 != 0:
-        if diff_y < tolerance:
-            st.metric(label="Perbedaan |Y1 - Y2|", value=f"{diff_y:.0f}", delta="✅ Sangat dekat!", delta_color="normal")
         else:
-            st.metric(label="Perbedaan |Y1 - Y2|", value=f"{diff_y:.0f}", delta="Perlu disesuaikan", delta_color="inverse")
-    else:
-        st.markdown("Perbedaan Y tidak relevan untuk garis vertikal.")
+            st.error("❌ Tidak ada solusi unik. Kedua garis **paralel** dan tidak berpotongan.")
 
+    catat_durasi("solusi", mulai)
 
-# Umpan Balik / Petunjuk
-is_solution_found_by_discovery = False
 
-if b1 != 0 and b2 != 0: # Kedua garis non-vertikal
-    if abs(y1_coba_raw - y2_coba_raw) < tolerance:
-        st.success(f"🎉 **SELAMAT!** Anda telah menemukan titik di mana $y_1$ dan $y_2$ sangat dekat!")
-        st.balloons()
-        st.markdown(f"**Titik potong kira-kira adalah:** $({x_coba:.0f}, {(y1_coba_raw + y2_coba_raw) / 2:.0f})$")
-        is_solution_found_by_discovery = True
-    else:
-        st.warning(f"**Petunjuk:** $y_1$ dan $y_2$ belum sama. ")
-        if y1_coba_raw < y2_coba_raw:
-            st.info("💡 **Tips:** Coba geser **Nilai X Coba** ke kanan untuk membuat $y_1$ dan $y_2$ bertemu.")
-        else:
-            st.info("💡 **Tips:** Coba geser **Nilai X Coba** ke kiri untuk membuat $y_1$ dan $y_2$ bertemu.")
-elif b1 == 0 and b2 == 0: # Kedua garis vertikal
-    if a1 != 0 and a2 != 0 and abs(c1/a1 - c2/a2) < tolerance:
-        st.success("🎉 **SELAMAT!** Kedua persamaan adalah garis vertikal yang sama. Terdapat **tak terhingga solusi**.")
-        is_solution_found_by_discovery = True
-    else:
-        st.error("🚨 Kedua persamaan adalah garis vertikal yang paralel. **Tidak ada solusi**.")
-        is_solution_found_by_discovery = True
-elif b1 == 0 and a1 != 0: # Persamaan 1 vertikal, Persamaan 2 non-vertikal
-    x_intersect_p1 = c1 / a1
-    y_from_p2 = hitung_y(persamaan2, np.array([x_intersect_p1]))[0]
-    st.success(f"🎉 **SELAMAT!** Persamaan 1 adalah garis vertikal $x = {x_intersect_p1:.0f}$.")
-    st.markdown(f"Jika $x = {x_intersect_p1:.0f}$, maka $y_2$ dari Persamaan 2 adalah $\\mathbf{{{y_from_p2:.0f}}}$.")
-    st.markdown(f"**Titik potongnya adalah:** $({x_intersect_p1:.0f}, {y_from_p2:.0f})$")
-    is_solution_found_by_discovery = True
-elif b2 == 0 and a2 != 0: # Persamaan 2 vertikal, Persamaan 1 non-vertikal
-    x_intersect_p2 = c2 / a2
-    y_from_p1 = hitung_y(persamaan1, np.array([x_intersect_p2]))[0]
-    st.success(f"🎉 **SELAMAT!** Persamaan 2 adalah garis vertikal $x = {x_intersect_p2:.0f}$.")
-    st.markdown(f"Jika $x = {x_intersect_p2:.0f}$, maka $y_1$ dari Persamaan 1 adalah $\\mathbf{{{y_from_p1:.0f}}}$.")
-    st.markdown(f"**Titik potongnya adalah:** $({x_intersect_p2:.0f}, {y_from_p1:.0f})$")
-    is_solution_found_by_discovery = True
-
-
-# --- Bagian Visualisasi ---
-st.header("3. Visualisasi Grafik")
-st.markdown("Perhatikan bagaimana kedua garis berinteraksi saat Anda mengubah nilai X.")
-x_range = np.linspace(-10, 10, 400) # Range X untuk plotting
+bagian_solusi(persamaan1, persamaan2, line1_color, line2_color)
 
-# Tentukan titik yang akan ditandai di plot
-plot_x_marker = x_coba
-plot_y_marker = None
-
-# Logika penentuan plot_x_marker dan plot_y_marker
-if b1 == 0 and a1 != 0: # Persamaan 1 vertikal
-    plot_x_marker = c1 / a1
-    if b2 != 0: # Jika P2 non-vertikal
-        plot_y_marker = hitung_y(persamaan2, np.array([plot_x_marker]))[0]
-    # Jika P2 juga vertikal, plot_y_marker tetap None
-elif b2 == 0 and a2 != 0: # Persamaan 2 vertikal
-    plot_x_marker = c2 / a2
-    if b1 != 0: # Jika P1 non-vertikal
-        plot_y_marker = hitung_y(persamaan1, np.array([plot_x_marker]))[0]
-    # Jika P1 juga vertikal, plot_y_marker tetap None
-else: # Kedua garis non-vertikal
-    if abs(y1_coba_raw - y2_coba_raw) < tolerance: # Jika sudah dekat
-        plot_y_marker = (y1_coba_raw + y2_coba_raw) / 2
-    else: # Jika belum dekat, plot di titik coba x
-        plot_y_marker = (y1_coba_raw + y2_coba_raw) / 2
-
-# Pastikan plot_y_marker bukan NaN atau Inf
-if plot_y_marker is not None and (np.isnan(plot_y_marker) or np.isinf(plot_y_marker)):
-    plot_y_marker = None
-if plot_x_marker is not None and (np.isnan(plot_x_marker) or np.isinf(plot_x_marker)):
-    plot_x_marker = None
-
-
-fig = plot_garis(persamaan1, persamaan2, x_range, line1_color, line2_color,
-                 point_x=plot_x_marker, point_y=plot_y_marker, show_exact_point=False)
-st.pyplot(fig)
-st.caption("Titik ungu pada grafik menunjukkan perkiraan titik potong berdasarkan nilai X coba Anda.")
 
+# --- Bagian Pemeriksaan Bank Soal ---
+@st.fragment
+def bagian_bank_soal():
+    """Bagian 5: unggah dan unduh bank soal hanya menjalankan ulang fragmen ini."""
+    mulai = time.perf_counter()
+    st.header("5. Periksa Banyak Soal Sekaligus (Opsional)")
+    st.markdown("Unggah bank soal untuk diperiksa sekaligus. Soal dibaca dan diselesaikan per potongan, sehingga file besar tetap aman.")
 
-# --- Bagian Solusi Matematis (untuk konfirmasi) ---
-st.header("4. Konfirmasi Solusi Matematis (Opsional)")
-st.markdown("Jika Anda ingin mengkonfirmasi jawaban atau kesulitan menemukannya, Anda bisa melihat solusi matematisnya di sini.")
+    with st.expander("Klik untuk Mengunggah File Bank Soal"):
+        st.markdown("File **CSV** atau **Parquet** harus memiliki kolom `a1, b1, c1, a2, b2, c2` (satu SPLDV per baris).")
+        file_soal = st.file_uploader("File bank soal", type=["csv", "parquet"], key="file_bank_soal")
+
+        if file_soal is not None and st.button("Periksa Semua Soal"):
+            from spldv.bulk import format_dari_nama, jumlah_baris, proses_bulk # pandas/pyarrow hanya untuk bagian ini
+
+            format_masuk = format_dari_nama(file_soal.name)
+            total_baris = jumlah_baris(file_soal, format_masuk)
+            file_soal.seek(0)
+            progres_bar = st.progress(0.0, text="Memulai pemeriksaan...")
 
-with st.expander("Klik untuk Menampilkan Solusi Matematis"):
-    solusi_x, solusi_y = hitung_solusi_spldv(persamaan1, persamaan2)
+            def perbarui_progres(baris, detik):
+                # Tanpa metadata jumlah baris (CSV), progres diperkirakan dari posisi baca file
+                fraksi = baris / total_baris if total_baris else file_soal.tell() / max(file_soal.size, 1)
+                progres_bar.progress(min(fraksi, 1.0), text=f"{baris:,} baris | {baris / max(detik, 1e-9):,.0f} baris/detik")
 
-    if solusi_x is not None and solusi_y is not None:
-        if solusi_x == float('inf') and solusi_y == float('inf'):
-            st.info("ℹ️ Kedua persamaan adalah **garis yang sama**. Terdapat **tak terhingga solusi**.")
+            # Hasil ditulis ke memori, bukan file sementara yang tertinggal di disk setelah sesi berakhir;
+            # st.download_button juga menyimpan seluruh isinya di memori
+            file_hasil = io.BytesIO()
+            ringkasan = proses_bulk(file_soal, file_hasil, format_masuk, "csv", progres=perbarui_progres)
+            progres_bar.progress(1.0, text="Selesai!")
+            st.session_state["hasil_bank_soal"] = {"data": file_hasil.getvalue(), "nama": file_soal.name,
+                                                   "ringkasan": ringkasan}
+
+        hasil_bank_soal = st.session_state.get("hasil_bank_soal")
+        if hasil_bank_soal is not None:
+            ringkasan = hasil_bank_soal["ringkasan"]
+            col_baris, col_waktu, col_laju = st.columns(3)
+            col_baris.metric("Jumlah Soal", f"{ringkasan['baris']:,}")
+            col_waktu.metric("Waktu Proses", f"{ringkasan['detik']:.2f} detik")
+            col_laju.metric("Throughput", f"{ringkasan['baris_per_detik']:,.0f} baris/detik")
+            st.markdown(" | ".join(f"**{nama}**: {jumlah:,}" for nama, jumlah in ringkasan["per_status"].items()))
+            st.download_button("⬇️ Unduh Hasil (CSV)", data=hasil_bank_soal["data"],
+                               file_name=f"hasil_{Path(hasil_bank_soal['nama']).stem}.csv", mime="text/csv")
+
+    catat_durasi("bank_soal", mulai)
+    laporkan_rerun_parsial("bank_soal")
+
+
+bagian_bank_soal()
+
+
+# --- Bagian Sapuan Parameter ---
+@st.fragment
+def bagian_sapuan(persamaan1, persamaan2, line1_color, line2_color):
+    """
+    Bagian 6: satu koefisien diubah bertahap dan lintasan titik potongnya ditampilkan.
+    Mengubah pengaturan sapuan hanya menjalankan ulang fragmen ini; menggeser slider sapuan tidak memicu rerun.
+    """
+    mulai = time.perf_counter()
+    st.header("6. Apa yang Terjadi Jika...? (Opsional)")
+    st.markdown("Ubah satu koefisien sedikit demi sedikit dan amati bagaimana titik potong kedua garis berpindah.")
+
+    if st.toggle("Aktifkan mode sapuan parameter", key="sapuan_aktif"):
+        from spldv.sapuan import NAMA_KOEFISIEN, spesifikasi_sapuan # Altair dan pandas hanya untuk bagian ini
+
+        col_param, col_awal, col_akhir, col_langkah = st.columns(4)
+        parameter = col_param.selectbox("Koefisien yang diubah", NAMA_KOEFISIEN, index=2, key="sapuan_parameter")
+        awal = col_awal.number_input("Dari", value=-10.0, key="sapuan_awal")
+        akhir = col_akhir.number_input("Sampai", value=10.0, key="sapuan_akhir")
+        langkah = col_langkah.number_input("Langkah", value=0.1, min_value=0.01, step=0.05, key="sapuan_langkah")
+
+        try:
+            with ukur_bagian("kalkulatorspldv/sapuan"):
+                spesifikasi = spesifikasi_sapuan(persamaan1, persamaan2, parameter, awal, akhir, langkah,
+                                                 line1_color, line2_color)
+        except ValueError as e:
+            st.error(f"🚨 {e}")
         else:
-            st.success(f"✅ Secara matematis, titik potongnya adalah: $x = \\mathbf{{{solusi_x:.0f}}}$, $y = \\mathbf{{{solusi_y:.0f}}}$")
-            st.markdown(f"**Titik potong akurat:** $\\left({solusi_x:.0f}, {solusi_y:.0f}\\right)$")
-            # Tambahkan plot solusi matematis
-            st.markdown("---")
-            st.subheader("Plot dengan Titik Solusi Akurat")
-            fig_sol = plot_garis(persamaan1, persamaan2, x_range, line1_color, line2_color,
-                                 point_x=solusi_x, point_y=solusi_y, show_exact_point=True)
-            st.pyplot(fig_sol)
-            st.caption("Titik hijau pada grafik ini menunjukkan titik potong yang akurat secara matematis.")
+            # Salinan dangkal, karena Streamlit memindahkan data keluar dari spesifikasi yang diberikan
+            st.vega_lite_chart(spec=dict(spesifikasi), width="stretch")
+            st.caption("Titik ungu adalah titik potong pada langkah terpilih, titik-titik samar adalah lintasannya. "
+                       "Pita di bawah grafik menandai langkah saat garis sejajar (merah) atau berhimpit (biru).")
+
+    catat_durasi("sapuan", mulai)
+    laporkan_rerun_parsial("sapuan")
 
-    else:
-        st.error("❌ Tidak ada solusi unik. Kedua garis **paralel** dan tidak berpotongan.")
+
+bagian_sapuan(persamaan1, persamaan2, line1_color, line2_color)
 
 st.markdown("---")
 st.markdown("Dibuat dengan Python oleh **rarayuniaini** | Universitas Pekalongan")
 st.markdown("---")
+
+catat_bagian("kalkulatorspldv/halaman", time.perf_counter() - mulai_halaman)
+tampilkan_panel_debug() # Hanya tampil dengan ?debug=1
+
+st.session_state["_rerun_penuh"] = False
@@ -0,0 +1,57 @@
+"""
+Pemeriksa bank soal SPLDV dari baris perintah, tanpa menjalankan Streamlit.
+
+Memakai logika yang sama dengan hitung_solusi_spldv (versi batch) dan
+membagi file masukan ke beberapa proses sekaligus.
+
+Contoh:
+    python kalkulatorspldv/spldv_cli.py soal.csv hasil.csv --pekerja 8 --ukuran-potongan 200000
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Akar repositori ditambahkan ke sys.path agar paket bersama `spldv` dapat diimpor
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spldv.bulk import UKURAN_POTONGAN, format_dari_nama, proses_bulk
+from spldv.paralel import proses_paralel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Menyelesaikan file soal SPLDV (CSV/Parquet/bank .spldv) dengan banyak proses.")
+    parser.add_argument("masukan", help="File soal dengan kolom a1,b1,c1,a2,b2,c2 (.csv, .parquet, atau .spldv)")
+    parser.add_argument("keluaran", help="File hasil (.csv atau .parquet), urutan baris sama dengan masukan")
+    parser.add_argument("-j", "--pekerja", type=int, default=os.cpu_count(),
+                        help="Jumlah proses pekerja (bawaan: jumlah inti CPU); 1 berarti tanpa pool proses")
+    parser.add_argument("--ukuran-potongan", type=int, default=UKURAN_POTONGAN,
+                        help=f"Perkiraan jumlah baris per tugas (bawaan {UKURAN_POTONGAN})")
+    parser.add_argument("-q", "--diam", action="store_true", help="Tidak menampilkan progres")
+    args = parser.parse_args(argv)
+
+    def cetak_progres(baris, detik):
+        print(f"\r{baris:,} baris | {baris / detik if detik > 0 else 0:,.0f} baris/detik",
+              end="", flush=True, file=sys.stderr)
+
+    progres = None if args.diam else cetak_progres
+    format_masuk = format_dari_nama(args.masukan)
+    format_keluar = format_dari_nama(args.keluaran)
+    if args.pekerja == 1:
+        ringkasan = proses_bulk(args.masukan, args.keluaran, format_masuk, format_keluar,
+                                args.ukuran_potongan, progres=progres)
+    else:
+        ringkasan = proses_paralel(args.masukan, args.keluaran, format_masuk, format_keluar,
+                                   args.ukuran_potongan, pekerja=args.pekerja, progres=progres)
+    if progres is not None:
+        print(file=sys.stderr)
+
+    print(f"Selesai: {ringkasan['baris']:,} baris dalam {ringkasan['detik']:.2f} detik "
+          f"({ringkasan['baris_per_detik']:,.0f} baris/detik)")
+    for nama, jumlah in ringkasan["per_status"].items():
+        print(f"  {nama}: {jumlah:,}")
+
+
+if __name__ == "__main__":
+    main()
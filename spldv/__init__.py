@@ -0,0 +1,43 @@
+"""
+Inti perhitungan bersama untuk aplikasi-aplikasi Kalkulator SPLDV.
+
+Selain modul berakhiran `_streamlit`, modul-modul di paket ini tidak
+bergantung pada Streamlit sehingga dapat dipakai dari skrip, pekerjaan
+batch, maupun ketiga aplikasi Streamlit.
+
+Nama-nama di bawah diimpor dari submodulnya saat pertama kali diakses,
+sehingga mengimpor satu submodul ringan (misalnya spldv.substitusi) tidak
+ikut memuat NumPy.
+"""
+
+import importlib
+
+_ASAL_EKSPOR = {
+    "JejakSubstitusi": "spldv.substitusi",
+    "NAMA_STATUS": "spldv.status",
+    "STATUS_BERHIMPIT": "spldv.status",
+    "STATUS_PARALEL": "spldv.status",
+    "STATUS_TIDAK_VALID": "spldv.status",
+    "STATUS_UNIK": "spldv.status",
+    "hitung_solusi_spldv": "spldv.solver",
+    "hitung_solusi_spldv_batch": "spldv.solver",
+    "hitung_solusi_spldv_campuran": "spldv.solver",
+    "hitung_solusi_spldv_eksak": "spldv.eksak",
+    "hitung_y": "spldv.solver",
+    "selesaikan_sistem_batch": "spldv.sistem_linear",
+    "solve_spldv_substitusi": "spldv.substitusi",
+}
+
+__all__ = sorted(_ASAL_EKSPOR)
+
+
+def __getattr__(nama):
+    if nama not in _ASAL_EKSPOR:
+        raise AttributeError(f"module {__name__!r} has no attribute {nama!r}")
+    nilai = getattr(importlib.import_module(_ASAL_EKSPOR[nama]), nama)
+    globals()[nama] = nilai # Akses berikutnya tidak lagi melewati __getattr__
+    return nilai
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,239 @@
+"""
+Layanan JSON lokal (ASGI) untuk solver SPLDV, tanpa Streamlit.
+
+Endpoint:
+    GET  /kesehatan          -> {"status": "ok"}
+    POST /selesaikan         -> satu sistem, opsional beserta langkah metode substitusi
+    POST /selesaikan/batch   -> banyak sistem dalam satu panggilan hitung_solusi_spldv_batch
+
+Contoh permintaan:
+    POST /selesaikan        {"persamaan1": [2, 1, 5], "persamaan2": [3, -2, 4], "eksak": true, "langkah": true}
+    POST /selesaikan/batch  {"a1": [2, 1], "b1": [1, 1], "c1": [5, 2], "a2": [3, 1], "b2": [-2, -1], "c2": [4, 0]}
+                            atau {"sistem": [[2, 1, 5, 3, -2, 4], [1, 1, 2, 1, -1, 0]]}
+
+Semua handler bersifat async. Untuk batch, parse JSON, validasi, penyelesaian,
+dan encoding jawaban dikerjakan bersama di thread pool, sehingga event loop
+hanya membaca isi permintaan dan mengirim bytes jawaban, dan tetap melayani
+permintaan lain. Menjalankan layanan:
+    python -m spldv.api --port 8000
+"""
+
+import argparse
+import dataclasses
+import itertools
+import json
+import math
+from fractions import Fraction
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from spldv.bulk import KOLOM_KOEFISIEN
+from spldv.cache_solusi import solve_spldv_substitusi_cache
+from spldv.eksak import selesaikan_eksak
+from spldv.solver import hitung_solusi_spldv_batch
+from spldv.status import NAMA_STATUS, STATUS_TIDAK_VALID, STATUS_UNIK
+
+BATAS_BATCH = 1_000_000 # Jumlah sistem maksimum per permintaan batch
+
+
+class PermintaanTidakValid(ValueError):
+    """Isi permintaan tidak sesuai format; dijawab dengan HTTP 400 (atau 413 untuk batch terlalu besar)."""
+
+    def __init__(self, pesan, kode=400):
+        super().__init__(pesan)
+        self.kode = kode
+
+
+def _ke_json(nilai):
+    """Mengubah nilai hasil hitungan menjadi nilai JSON: Fraction menjadi float, NaN/inf dan nilai di luar rentang float menjadi null."""
+    if nilai is None or isinstance(nilai, (str, bool)):
+        return nilai
+    try:
+        nilai = float(nilai)
+    except OverflowError:
+        return None
+    return nilai if math.isfinite(nilai) else None
+
+
+_TIPE_ANGKA = {int, float} # Tipe angka hasil json.loads; bool sengaja tidak termasuk
+
+
+def _periksa_angka(nilai, nama):
+    """Memeriksa bahwa semua anggota `nilai` adalah angka JSON (bukan string atau bool)."""
+    if not set(map(type, nilai)) <= _TIPE_ANGKA:
+        raise PermintaanTidakValid(f"'{nama}' hanya boleh berisi angka")
+
+
+def _galat_tidak_hingga(nama):
+    return PermintaanTidakValid(f"'{nama}' harus berisi angka hingga yang dapat dinyatakan sebagai float")
+
+
+def _persamaan(isi, nama):
+    persamaan = isi.get(nama)
+    if not isinstance(persamaan, list) or len(persamaan) != 3:
+        raise PermintaanTidakValid(f"'{nama}' harus berupa daftar tiga angka [a, b, c]")
+    _periksa_angka(persamaan, nama)
+    try:
+        hingga = all(math.isfinite(v) for v in persamaan)
+    except OverflowError: # Bilangan bulat yang terlalu besar untuk float
+        hingga = False
+    if not hingga:
+        raise _galat_tidak_hingga(nama)
+    return tuple(persamaan)
+
+
+def _pilihan(isi, nama):
+    """Opsi ya/tidak pada permintaan; harus berupa bool JSON agar string seperti "false" tidak dianggap benar."""
+    nilai = isi.get(nama, False)
+    if not isinstance(nilai, bool):
+        raise PermintaanTidakValid(f"'{nama}' harus berupa true atau false")
+    return nilai
+
+
+def selesaikan_satu(isi):
+    """Menjawab permintaan /selesaikan dari isi JSON yang sudah di-parse."""
+    persamaan1 = _persamaan(isi, "persamaan1")
+    persamaan2 = _persamaan(isi, "persamaan2")
+    eksak = _pilihan(isi, "eksak")
+    dengan_langkah = _pilihan(isi, "langkah")
+
+    if eksak:
+        status, solusi_x, solusi_y = selesaikan_eksak(persamaan1, persamaan2)
+        hasil = {"status": NAMA_STATUS[status], "x": None, "y": None}
+        if status == STATUS_UNIK:
+            try:
+                hasil.update(x=solusi_x[0] / solusi_x[1], y=solusi_y[0] / solusi_y[1],
+                             x_pecahan=str(Fraction(*solusi_x)), y_pecahan=str(Fraction(*solusi_y)))
+            except OverflowError: # Solusi eksak di luar rentang float, seperti pada hitung_solusi_spldv
+                hasil = {"status": NAMA_STATUS[STATUS_TIDAK_VALID], "x": None, "y": None}
+    else:
+        x, y, status = hitung_solusi_spldv_batch([persamaan1], [persamaan2])
+        hasil = {"status": NAMA_STATUS[int(status[0])], "x": _ke_json(x[0]), "y": _ke_json(y[0])}
+
+    if dengan_langkah:
+        jejak = solve_spldv_substitusi_cache(*persamaan1, *persamaan2, eksak=eksak)
+        langkah = {nama: _ke_json(nilai) for nama, nilai in dataclasses.asdict(jejak).items()}
+        langkah["berhasil"] = jejak.berhasil
+        hasil["langkah"] = langkah
+    return hasil
+
+
+def koefisien_batch(isi):
+    """
+    Mengambil array koefisien (N, 6) dari isi permintaan /selesaikan/batch.
+    Setiap koefisien diperiksa seperti pada /selesaikan; batch kosong menghasilkan array (0, 6).
+    """
+    if "sistem" in isi:
+        nama, sistem = "sistem", isi["sistem"]
+        if not isinstance(sistem, list) or set(map(type, sistem)) - {list} or set(map(len, sistem)) - {6}:
+            raise PermintaanTidakValid("'sistem' harus berupa daftar baris berisi enam angka [a1, b1, c1, a2, b2, c2]")
+        if len(sistem) > BATAS_BATCH:
+            raise PermintaanTidakValid(f"Paling banyak {BATAS_BATCH:,} sistem per permintaan", kode=413)
+        _periksa_angka(itertools.chain.from_iterable(sistem), nama)
+        daftar = [sistem]
+    else:
+        nama = "a1, b1, c1, a2, b2, c2"
+        for kolom in KOLOM_KOEFISIEN:
+            if kolom not in isi:
+                raise PermintaanTidakValid(f"Kolom {kolom} tidak ada; kirim 'sistem' atau kolom a1, b1, c1, a2, b2, c2")
+            if not isinstance(isi[kolom], list):
+                raise PermintaanTidakValid(f"'{kolom}' harus berupa daftar angka")
+        daftar = [isi[kolom] for kolom in KOLOM_KOEFISIEN]
+        if len({len(nilai) for nilai in daftar}) != 1:
+            raise PermintaanTidakValid("Kolom a1, b1, c1, a2, b2, c2 harus sama panjang")
+        if len(daftar[0]) > BATAS_BATCH:
+            raise PermintaanTidakValid(f"Paling banyak {BATAS_BATCH:,} sistem per permintaan", kode=413)
+        for kolom, nilai in zip(KOLOM_KOEFISIEN, daftar):
+            _periksa_angka(nilai, kolom)
+
+    try:
+        if "sistem" in isi:
+            koefisien = np.array(daftar[0], dtype=float).reshape(-1, 6)
+        else:
+            koefisien = np.column_stack([np.array(nilai, dtype=float) for nilai in daftar]).reshape(-1, 6)
+    except OverflowError: # Bilangan bulat yang terlalu besar untuk float
+        raise _galat_tidak_hingga(nama)
+    if not np.isfinite(koefisien).all():
+        raise _galat_tidak_hingga(nama)
+    return koefisien
+
+
+def selesaikan_banyak(koefisien):
+    """Menyelesaikan (N, 6) koefisien dengan satu panggilan ter-vektorisasi; NaN dijadikan null."""
+    x, y, status = hitung_solusi_spldv_batch(koefisien.reshape(-1, 2, 3))
+    nama_status = [NAMA_STATUS[kode] for kode in range(len(NAMA_STATUS))]
+    return {
+        "jumlah": len(koefisien),
+        "x": [v if v == v else None for v in x.tolist()],
+        "y": [v if v == v else None for v in y.tolist()],
+        "status": [nama_status[kode] for kode in status.tolist()],
+    }
+
+
+def _urai_json(isi_mentah):
+    try:
+        isi = json.loads(isi_mentah)
+    except ValueError:
+        raise PermintaanTidakValid("Isi permintaan harus berupa JSON")
+    if not isinstance(isi, dict):
+        raise PermintaanTidakValid("Isi permintaan harus berupa objek JSON")
+    return isi
+
+
+def jawab_batch(isi_mentah):
+    """
+    Menjawab permintaan /selesaikan/batch dari bytes isi permintaan sampai bytes JSON jawaban,
+    dengan encoding yang sama seperti JSONResponse. Dipanggil di thread pool.
+    """
+    hasil = selesaikan_banyak(koefisien_batch(_urai_json(isi_mentah)))
+    return json.dumps(hasil, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+async def _baca_json(request):
+    return _urai_json(await request.body())
+
+
+async def kesehatan(request):
+    return JSONResponse({"status": "ok"})
+
+
+async def selesaikan(request):
+    return JSONResponse(selesaikan_satu(await _baca_json(request)))
+
+
+async def selesaikan_batch(request):
+    isi_mentah = await request.body()
+    return Response(await run_in_threadpool(jawab_batch, isi_mentah), media_type="application/json")
+
+
+async def _tangani_permintaan_tidak_valid(request, exc):
+    return JSONResponse({"galat": str(exc)}, status_code=exc.kode)
+
+
+app = Starlette(
+    routes=[
+        Route("/kesehatan", kesehatan, methods=["GET"]),
+        Route("/selesaikan", selesaikan, methods=["POST"]),
+        Route("/selesaikan/batch", selesaikan_batch, methods=["POST"]),
+    ],
+    exception_handlers={PermintaanTidakValid: _tangani_permintaan_tidak_valid},
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Menjalankan layanan JSON solver SPLDV.")
+    parser.add_argument("--host", default="127.0.0.1", help="Alamat yang didengarkan (bawaan hanya lokal)")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Bank soal SPLDV dalam format biner yang dibuka lewat np.memmap.
+
+Susunan file (little-endian, setiap blok dimulai di kelipatan PERATAAN byte):
+    header UKURAN_HEADER byte : FORMAT_HEADER (magic, versi, kode dtype, flag,
+                                jumlah soal, offset koefisien, x, y, status)
+    koefisien                 : array (N, 6) berurutan a1, b1, c1, a2, b2, c2
+    x, y (opsional)           : float64 (N,), hasil hitung_solusi_spldv_campuran
+    status (opsional)         : int8 (N,), kode spldv.status
+
+Membuka bank hanya membaca header; potongan soal dibaca langsung dari page
+cache sistem operasi tanpa salinan dan tanpa memuat seluruh file, sehingga
+bank berukuran gigabyte terbuka seketika dan beberapa proses yang membuka file
+yang sama berbagi halaman memori yang sama.
+
+Contoh:
+    python -m spldv.bank_biner soal.csv soal.spldv --dtype int16 --hasil
+    BankSoal("soal.spldv").soal(41)
+"""
+
+import argparse
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from spldv.solver import hitung_solusi_spldv_campuran
+from spldv.status import NAMA_STATUS
+
+EKSTENSI = ".spldv"
+MAGIC = b"SPLDVBNK"
+VERSI = 1
+FORMAT_HEADER = "<8sHBBQQQQQ"
+UKURAN_HEADER = 64
+PERATAAN = 64 # Awal setiap blok, agar potongan baris selalu selaras untuk operasi vektor
+FLAG_HASIL = 1 # Bank berisi kolom x, y, dan status
+UKURAN_POTONGAN = 1_000_000
+
+# Urutan menentukan kode dtype di header; jangan diubah, hanya boleh ditambah di akhir
+DTYPE_KOEFISIEN = {"float64": "<f8", "float32": "<f4", "int32": "<i4", "int16": "<i2"}
+_KODE_DTYPE = list(DTYPE_KOEFISIEN)
+
+
+class HeaderBank(NamedTuple):
+    dtype: str # Kunci DTYPE_KOEFISIEN
+    jumlah: int
+    offset_koefisien: int
+    offset_x: int # 0 jika bank tidak berisi hasil
+    offset_y: int
+    offset_status: int
+
+    @property
+    def ada_hasil(self):
+        return self.offset_status > 0
+
+
+def _rata(offset):
+    return -(-offset // PERATAAN) * PERATAAN
+
+
+def _tulis_header(f, header):
+    flag = FLAG_HASIL if header.ada_hasil else 0
+    data = struct.pack(FORMAT_HEADER, MAGIC, VERSI, _KODE_DTYPE.index(header.dtype), flag, header.jumlah,
+                       header.offset_koefisien, header.offset_x, header.offset_y, header.offset_status)
+    f.seek(0)
+    f.write(data.ljust(UKURAN_HEADER, b"\0"))
+
+
+def baca_header(path):
+    """Membaca dan memeriksa header bank soal; ValueError jika file bukan bank soal yang valid."""
+    with open(path, "rb") as f:
+        data = f.read(UKURAN_HEADER)
+        ukuran_file = f.seek(0, os.SEEK_END)
+    if len(data) < UKURAN_HEADER or data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} bukan file bank soal {EKSTENSI}")
+    _, versi, kode_dtype, flag, jumlah, *offset = struct.unpack_from(FORMAT_HEADER, data)
+    if versi != VERSI:
+        raise ValueError(f"Versi bank soal {versi} tidak didukung (didukung: {VERSI})")
+    if kode_dtype >= len(_KODE_DTYPE):
+        raise ValueError(f"Kode dtype koefisien {kode_dtype} tidak dikenal")
+    if not flag & FLAG_HASIL:
+        offset[1:] = [0, 0, 0]
+    header = HeaderBank(_KODE_DTYPE[kode_dtype], jumlah, *offset)
+    akhir = header.offset_koefisien + jumlah * 6 * np.dtype(DTYPE_KOEFISIEN[header.dtype]).itemsize
+    if header.ada_hasil:
+        akhir = max(akhir, header.offset_status + jumlah)
+    if ukuran_file < akhir:
+        raise ValueError(f"{path} terpotong: {ukuran_file:,} byte, seharusnya paling sedikit {akhir:,} byte")
+    return header
+
+
+def _memmap(path, dtype, mode, offset, shape):
+    if shape[0] == 0: # mmap tidak dapat memetakan nol byte
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=shape)
+
+
+def _petakan(path, header, mode):
+    """Memmap (koefisien, x, y, status) sesuai susunan `header`; kolom hasil None jika tidak ada."""
+    h = header
+    koefisien = _memmap(path, DTYPE_KOEFISIEN[h.dtype], mode, h.offset_koefisien, (h.jumlah, 6))
+    if not h.ada_hasil:
+        return koefisien, None, None, None
+    return (koefisien, _memmap(path, "<f8", mode, h.offset_x, (h.jumlah,)),
+            _memmap(path, "<f8", mode, h.offset_y, (h.jumlah,)), _memmap(path, "i1", mode, h.offset_status, (h.jumlah,)))
+
+
+class BankSoal:
+    """
+    Bank soal yang dipetakan ke memori. `koefisien` adalah array (N, 6) dan, jika bank berisi hasil,
+    `x`, `y`, `status` adalah array (N,); semuanya memmap, bukan salinan.
+    """
+
+    def __init__(self, path, mode="r"):
+        self.path = Path(path)
+        self.header = baca_header(path)
+        self.koefisien, self.x, self.y, self.status = _petakan(path, self.header, mode)
+
+    def __len__(self):
+        return self.header.jumlah
+
+    def soal(self, indeks):
+        """Koefisien soal ke-`indeks` (mulai 0) sebagai ((a1, b1, c1), (a2, b2, c2)) bertipe float."""
+        baris = [float(nilai) for nilai in self.koefisien[indeks]]
+        return tuple(baris[:3]), tuple(baris[3:])
+
+    def sistem(self, awal=0, akhir=None):
+        """Potongan soal sebagai view (n, 2, 3), siap untuk solver batch tanpa salinan."""
+        return self.koefisien[awal:akhir].reshape(-1, 2, 3)
+
+    def selesaikan(self, awal=0, akhir=None):
+        """
+        (x, y, status) untuk potongan [awal, akhir). Kolom hasil yang tersimpan dikembalikan
+        sebagai view; jika tidak ada, potongan diselesaikan dengan hitung_solusi_spldv_campuran.
+        """
+        if self.header.ada_hasil:
+            return self.x[awal:akhir], self.y[awal:akhir], self.status[awal:akhir]
+        x, y, status, _ = hitung_solusi_spldv_campuran(self.sistem(awal, akhir))
+        return x, y, status
+
+
+class PenulisBank:
+    """
+    Menulis koefisien bank soal potongan demi potongan, sehingga file sumber sebesar apa pun
+    tidak perlu dimuat sekaligus. Header ditulis saat ditutup, ketika jumlah soal sudah diketahui.
+    Data ditulis ke file sementara di sebelah `path` yang baru menggantikan `path` setelah header
+    ditulis; jika konteks `with` berakhir karena exception, file sementara dihapus dan `path` tidak berubah.
+    """
+
+    def __init__(self, path, dtype="float64"):
+        if dtype not in DTYPE_KOEFISIEN:
+            raise ValueError(f"dtype harus salah satu dari {tuple(DTYPE_KOEFISIEN)}, bukan {dtype!r}")
+        self.path = path
+        self.dtype = dtype
+        self.jumlah = 0
+        self._dtype = np.dtype(DTYPE_KOEFISIEN[dtype])
+        self._path_sementara = Path(f"{os.fspath(path)}.sementara")
+        self._file = open(self._path_sementara, "wb")
+        self._file.write(b"\0" * UKURAN_HEADER)
+
+    def tulis(self, koefisien):
+        """Menambahkan soal (n, 6) atau (n, 2, 3); ValueError jika nilainya berubah saat diubah ke dtype bank."""
+        koefisien = np.asarray(koefisien).reshape(-1, 6)
+        with np.errstate(invalid="ignore", over="ignore"):
+            data = np.ascontiguousarray(koefisien, dtype=self._dtype)
+        if not np.array_equal(data, koefisien, equal_nan=data.dtype.kind == "f"):
+            raise ValueError(f"Koefisien tidak dapat disimpan tepat sebagai {self.dtype}; gunakan dtype yang lebih lebar")
+        data.tofile(self._file)
+        self.jumlah += len(data)
+
+    def tutup(self):
+        """Menulis header lalu memindahkan file sementara ke `path`."""
+        if self._file.closed:
+            return
+        _tulis_header(self._file, HeaderBank(self.dtype, self.jumlah, UKURAN_HEADER, 0, 0, 0))
+        self._file.close()
+        os.replace(self._path_sementara, self.path)
+
+    def batalkan(self):
+        """Menutup tanpa menulis header dan menghapus file sementara; `path` tidak disentuh."""
+        self._file.close()
+        self._path_sementara.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.tutup()
+        else:
+            self.batalkan()
+
+
+def _kerjakan_hasil(path, header, awal, akhir):
+    """Tugas pekerja: menyelesaikan soal [awal, akhir) dan menulisnya langsung ke kolom hasil di file."""
+    koefisien, x, y, status = _petakan(path, header, "r+")
+    x[awal:akhir], y[awal:akhir], status[awal:akhir], _ = hitung_solusi_spldv_campuran(
+        koefisien[awal:akhir].reshape(-1, 2, 3))
+    for kolom in (x, y, status):
+        kolom.flush()
+    return np.bincount(status[awal:akhir], minlength=len(NAMA_STATUS))
+
+
+def tambahkan_hasil(path, pekerja=1, ukuran_potongan=UKURAN_POTONGAN):
+    """
+    Menghitung x, y, dan status seluruh soal lalu menyimpannya sebagai kolom hasil di bank.
+    Dengan `pekerja` > 1, setiap proses memetakan file yang sama dan menulis rentangnya sendiri.
+    Header baru ditulis setelah semua rentang selesai, sehingga bank yang terputus di tengah
+    jalan tetap terbaca sebagai bank tanpa hasil. Mengembalikan jumlah soal per nama status.
+    """
+    header = baca_header(path)
+    if header.jumlah == 0:
+        return {nama: 0 for nama in NAMA_STATUS.values()}
+    ukuran_koefisien = header.jumlah * 6 * np.dtype(DTYPE_KOEFISIEN[header.dtype]).itemsize
+    offset_x = _rata(header.offset_koefisien + ukuran_koefisien)
+    offset_y = _rata(offset_x + 8 * header.jumlah)
+    offset_status = _rata(offset_y + 8 * header.jumlah)
+    header = header._replace(offset_x=offset_x, offset_y=offset_y, offset_status=offset_status)
+    os.truncate(path, offset_status + header.jumlah)
+
+    rentang = [(awal, min(awal + ukuran_potongan, header.jumlah)) for awal in range(0, header.jumlah, ukuran_potongan)]
+    per_status = np.zeros(len(NAMA_STATUS), dtype=np.int64)
+    if pekerja > 1 and len(rentang) > 1:
+        with ProcessPoolExecutor(max_workers=pekerja) as executor:
+            for hasil in executor.map(_kerjakan_hasil, *zip(*((path, header, awal, akhir) for awal, akhir in rentang))):
+                per_status += hasil
+    else:
+        for awal, akhir in rentang:
+            per_status += _kerjakan_hasil(path, header, awal, akhir)
+    with open(path, "r+b") as f:
+        _tulis_header(f, header)
+    return {NAMA_STATUS[kode]: int(jumlah) for kode, jumlah in enumerate(per_status)}
+
+
+def tulis_bank(path, koefisien, dtype="float64", dengan_hasil=False):
+    """Menyimpan array soal (n, 6) atau (n, 2, 3) sebagai bank soal, opsional beserta kolom hasilnya."""
+    with PenulisBank(path, dtype) as penulis:
+        penulis.tulis(koefisien)
+    if dengan_hasil:
+        tambahkan_hasil(path)
+
+
+def main(argv=None):
+    from spldv.bulk import baca_potongan, format_dari_nama # pandas/pyarrow hanya untuk konversi
+
+    parser = argparse.ArgumentParser(description=f"Mengubah file soal CSV/Parquet menjadi bank soal biner {EKSTENSI}.")
+    parser.add_argument("masukan", help="File soal dengan kolom a1,b1,c1,a2,b2,c2 (.csv atau .parquet)")
+    parser.add_argument("keluaran", help=f"File bank soal ({EKSTENSI})")
+    parser.add_argument("--dtype", choices=list(DTYPE_KOEFISIEN), default="float64",
+                        help="Tipe koefisien; int16/float32 memperkecil file dan dapat diselesaikan dalam float32")
+    parser.add_argument("--hasil", action="store_true", help="Ikut menyimpan kolom x, y, dan status")
+    parser.add_argument("--pekerja", type=int, default=1, help="Jumlah proses untuk menghitung kolom hasil")
+    args = parser.parse_args(argv)
+
+    mulai = time.perf_counter()
+    with PenulisBank(args.keluaran, args.dtype) as penulis:
+        for koefisien in baca_potongan(args.masukan, format_dari_nama(args.masukan)):
+            penulis.tulis(koefisien)
+    print(f"{penulis.jumlah:,} soal ditulis ke {args.keluaran} dalam {time.perf_counter() - mulai:.2f} detik")
+    if args.hasil:
+        mulai = time.perf_counter()
+        per_status = tambahkan_hasil(args.keluaran, args.pekerja)
+        print(f"Kolom hasil dihitung dalam {time.perf_counter() - mulai:.2f} detik")
+        for nama, jumlah in per_status.items():
+            print(f"  {nama}: {jumlah:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Pemeriksaan bank soal SPLDV dalam jumlah besar, potongan demi potongan.
+
+File masukan (CSV, Parquet, atau bank soal biner .spldv dari spldv.bank_biner)
+berisi kolom a1, b1, c1, a2, b2, c2. Setiap
+potongan diselesaikan dengan hitung_solusi_spldv_batch lalu langsung ditulis
+ke file keluaran, sehingga pemakaian memori hanya bergantung pada ukuran
+potongan, bukan ukuran file.
+
+Contoh:
+    python -m spldv.bulk soal.csv hasil.csv --ukuran-potongan 200000
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from spldv.solver import hitung_solusi_spldv_batch
+from spldv.status import NAMA_STATUS
+
+KOLOM_KOEFISIEN = ["a1", "b1", "c1", "a2", "b2", "c2"]
+UKURAN_POTONGAN = 100_000
+
+_NAMA_STATUS = np.array([NAMA_STATUS[kode] for kode in sorted(NAMA_STATUS)])
+
+
+def format_dari_nama(nama_file):
+    """Menentukan format ('csv', 'parquet', atau 'bank') dari akhiran nama file."""
+    akhiran = Path(str(nama_file)).suffix.lower()
+    if akhiran == ".spldv":
+        return "bank"
+    if akhiran in (".parquet", ".pq"):
+        return "parquet"
+    if akhiran in (".csv", ".txt"):
+        return "csv"
+    raise ValueError(f"Format file tidak dikenali: {nama_file} (gunakan .csv, .parquet, atau .spldv)")
+
+
+def jumlah_baris(sumber, format):
+    """Jumlah baris jika bisa diketahui tanpa membaca data (metadata Parquet, header bank), selain itu None."""
+    if format == "bank":
+        from spldv.bank_biner import baca_header
+
+        return baca_header(sumber).jumlah
+    if format != "parquet":
+        return None
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(sumber).metadata.num_rows
+
+
+def baca_potongan(sumber, format, ukuran_potongan=UKURAN_POTONGAN):
+    """
+    Membaca file soal sebagai potongan array float (n, 6) berurutan a1, b1, c1, a2, b2, c2.
+    `sumber` boleh berupa path atau objek file; bank soal harus berupa path karena dibuka lewat memmap.
+    """
+    if format == "csv":
+        for potongan in pd.read_csv(sumber, usecols=KOLOM_KOEFISIEN, chunksize=ukuran_potongan):
+            yield potongan[KOLOM_KOEFISIEN].to_numpy(dtype=float)
+    elif format == "parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(sumber).iter_batches(batch_size=ukuran_potongan, columns=KOLOM_KOEFISIEN):
+            yield np.column_stack([batch.column(nama).to_numpy(zero_copy_only=False) for nama in KOLOM_KOEFISIEN]).astype(float)
+    elif format == "bank":
+        from spldv.bank_biner import BankSoal
+
+        koefisien = BankSoal(sumber).koefisien
+        for awal in range(0, len(koefisien), ukuran_potongan):
+            # Tanpa salinan untuk bank float64; dtype lain diubah per potongan
+            yield np.asarray(koefisien[awal:awal + ukuran_potongan], dtype=float)
+    else:
+        raise ValueError(f"Format tidak didukung: {format}")
+
+
+def selesaikan_potongan(koefisien):
+    """
+    Menyelesaikan satu potongan (n, 6).
+    Mengembalikan (DataFrame koefisien beserta kolom x, y, status, array kode status).
+    """
+    x, y, status = hitung_solusi_spldv_batch(koefisien.reshape(-1, 2, 3))
+    hasil = pd.DataFrame(koefisien, columns=KOLOM_KOEFISIEN)
+    hasil["x"] = x
+    hasil["y"] = y
+    hasil["status"] = _NAMA_STATUS[status]
+    return hasil, status
+
+
+class _PenulisArrow:
+    """Menulis potongan hasil secara bertahap ke CSV atau Parquet lewat writer streaming pyarrow."""
+
+    def __init__(self, tujuan, format):
+        self._tujuan = tujuan
+        self._format = format
+        self._writer = None
+
+    def tulis(self, hasil):
+        import pyarrow as pa
+
+        tabel = pa.Table.from_pandas(hasil, preserve_index=False)
+        if self._writer is None:
+            if self._format == "parquet":
+                import pyarrow.parquet as pq
+
+                self._writer = pq.ParquetWriter(self._tujuan, tabel.schema)
+            else:
+                import pyarrow.csv as pa_csv
+
+                self._writer = pa_csv.CSVWriter(self._tujuan, tabel.schema)
+        self._writer.write_table(tabel)
+
+    def tutup(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def proses_bulk(sumber, tujuan, format_masuk, format_keluar="csv", ukuran_potongan=UKURAN_POTONGAN, progres=None):
+    """
+    Membaca, menyelesaikan, dan menulis file soal potongan demi potongan.
+
+    `progres`, jika diberikan, dipanggil setelah setiap potongan dengan
+    (baris_selesai, detik_berlalu). Mengembalikan ringkasan berupa dict
+    berisi jumlah baris, durasi, throughput (baris/detik), dan jumlah per status.
+    """
+    if format_keluar not in ("csv", "parquet"):
+        raise ValueError(f"Format keluaran tidak didukung: {format_keluar} (gunakan .csv atau .parquet)")
+    penulis = _PenulisArrow(tujuan, format_keluar)
+    per_status = np.zeros(len(_NAMA_STATUS), dtype=np.int64)
+    baris_selesai = 0
+    mulai = time.perf_counter()
+    try:
+        for koefisien in baca_potongan(sumber, format_masuk, ukuran_potongan):
+            hasil, status = selesaikan_potongan(koefisien)
+            penulis.tulis(hasil)
+            per_status += np.bincount(status, minlength=len(_NAMA_STATUS))
+            baris_selesai += len(hasil)
+            if progres is not None:
+                progres(baris_selesai, time.perf_counter() - mulai)
+    finally:
+        penulis.tutup()
+
+    durasi = time.perf_counter() - mulai
+    return {
+        "baris": baris_selesai,
+        "detik": durasi,
+        "baris_per_detik": baris_selesai / durasi if durasi > 0 else float("inf"),
+        "per_status": {NAMA_STATUS[kode]: int(jumlah) for kode, jumlah in enumerate(per_status)},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Menyelesaikan file soal SPLDV (CSV/Parquet/bank .spldv) potongan demi potongan.")
+    parser.add_argument("masukan", help="File soal dengan kolom a1,b1,c1,a2,b2,c2 (.csv, .parquet, atau .spldv)")
+    parser.add_argument("keluaran", help="File hasil (.csv atau .parquet)")
+    parser.add_argument("--ukuran-potongan", type=int, default=UKURAN_POTONGAN,
+                        help=f"Jumlah baris per potongan (bawaan {UKURAN_POTONGAN})")
+    args = parser.parse_args(argv)
+
+    def cetak_progres(baris, detik):
+        print(f"\r{baris:,} baris | {baris / detik if detik > 0 else 0:,.0f} baris/detik", end="", flush=True)
+
+    ringkasan = proses_bulk(args.masukan, args.keluaran, format_dari_nama(args.masukan),
+                            format_dari_nama(args.keluaran), args.ukuran_potongan, progres=cetak_progres)
+    print()
+    print(f"Selesai: {ringkasan['baris']:,} baris dalam {ringkasan['detik']:.2f} detik "
+          f"({ringkasan['baris_per_detik']:,.0f} baris/detik)")
+    for nama, jumlah in ringkasan["per_status"].items():
+        print(f"  {nama}: {jumlah:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+_TIDAK_ADA = object()
+
+
+class LRUCache:
+    """
+    Cache LRU berukuran tetap yang aman dipakai bersama oleh banyak sesi (thread).
+    Menyimpan jumlah hit, miss, dan eviksi untuk dipantau.
+    """
+
+    def __init__(self, kapasitas):
+        if kapasitas < 1:
+            raise ValueError("Kapasitas cache minimal 1")
+        self.kapasitas = kapasitas
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, kunci, default=None):
+        with self._lock:
+            try:
+                nilai = self._data[kunci]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(kunci)
+            self.hits += 1
+            return nilai
+
+    def put(self, kunci, nilai):
+        with self._lock:
+            self._data[kunci] = nilai
+            self._data.move_to_end(kunci)
+            while len(self._data) > self.kapasitas:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, kunci):
+        return kunci in self._data
+
+    def statistik(self):
+        """Mengembalikan ringkasan isi dan rasio hit cache dalam bentuk dict."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "ukuran": len(self._data),
+                "kapasitas": self.kapasitas,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+class CacheTersimpan:
+    """
+    LRUCache di memori dengan lapisan kedua opsional berupa file SQLite lokal.
+
+    Kunci berupa str dan nilai disimpan ke SQLite dengan pickle, sehingga
+    hanya cocok untuk file cache milik aplikasi sendiri di disk lokal. Tanpa
+    `path`, objek ini hanya berupa LRUCache biasa. Lapisan SQLite dibatasi
+    `kapasitas_disk` baris; baris yang paling lama tidak dipakai dibuang lebih dulu.
+    """
+
+    def __init__(self, kapasitas, path=None, kapasitas_disk=100_000):
+        if kapasitas_disk < 1:
+            raise ValueError("Kapasitas disk minimal 1")
+        self.memori = LRUCache(kapasitas)
+        self.path = path
+        self.kapasitas_disk = kapasitas_disk
+        self.hits_disk = 0
+        self._lock = threading.Lock()
+        self._koneksi = None
+        self._jumlah_disk = 0
+        if path is not None:
+            self._koneksi = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._koneksi.execute("PRAGMA journal_mode=WAL") # Pembaca tidak terhalang penulis dari proses lain
+            self._koneksi.execute(
+                "CREATE TABLE IF NOT EXISTS cache (kunci TEXT PRIMARY KEY, nilai BLOB NOT NULL, dipakai REAL NOT NULL)")
+            self._koneksi.execute("CREATE INDEX IF NOT EXISTS cache_dipakai ON cache (dipakai)")
+            self._jumlah_disk = self._koneksi.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def get(self, kunci, default=None):
+        nilai = self.memori.get(kunci, _TIDAK_ADA)
+        if nilai is not _TIDAK_ADA or self._koneksi is None:
+            return default if nilai is _TIDAK_ADA else nilai
+
+        with self._lock:
+            baris = self._koneksi.execute("SELECT nilai FROM cache WHERE kunci = ?", (kunci,)).fetchone()
+            if baris is None:
+                return default
+            self._koneksi.execute("UPDATE cache SET dipakai = ? WHERE kunci = ?", (time.time(), kunci))
+            self.hits_disk += 1
+        nilai = pickle.loads(baris[0])
+        self.memori.put(kunci, nilai)
+        return nilai
+
+    def put(self, kunci, nilai):
+        self.memori.put(kunci, nilai)
+        if self._koneksi is None:
+            return
+        data = pickle.dumps(nilai, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            diperbarui = self._koneksi.execute(
+                "UPDATE cache SET nilai = ?, dipakai = ? WHERE kunci = ?", (data, time.time(), kunci)).rowcount
+            if not diperbarui:
+                self._koneksi.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (kunci, data, time.time()))
+                self._jumlah_disk += 1
+            if self._jumlah_disk > self.kapasitas_disk:
+                self._koneksi.execute(
+                    "DELETE FROM cache WHERE kunci IN (SELECT kunci FROM cache ORDER BY dipakai LIMIT ?)",
+                    (self._jumlah_disk - self.kapasitas_disk,))
+                # Dihitung ulang karena file yang sama boleh dipakai beberapa proses
+                self._jumlah_disk = self._koneksi.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def clear(self):
+        self.memori.clear()
+        with self._lock:
+            self.hits_disk = 0
+            if self._koneksi is not None:
+                self._koneksi.execute("DELETE FROM cache")
+                self._jumlah_disk = 0
+
+    def tutup(self):
+        with self._lock:
+            if self._koneksi is not None:
+                self._koneksi.close()
+                self._koneksi = None
+
+    def statistik(self):
+        """Statistik LRUCache di memori ditambah hit dari SQLite; hit_rate menghitung keduanya."""
+        hasil = self.memori.statistik()
+        total = hasil["hits"] + hasil["misses"]
+        hasil["hits_disk"] = self.hits_disk
+        hasil["ukuran_disk"] = self._jumlah_disk
+        hasil["hit_rate"] = (hasil["hits"] + self.hits_disk) / total if total else 0.0
+        return hasil
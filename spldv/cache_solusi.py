@@ -0,0 +1,92 @@
+"""
+Cache hasil penyelesaian SPLDV yang dipakai bersama oleh semua sesi dalam satu proses.
+
+Pada mode eksak, solusi (x, y) disimpan dengan kunci sistem kanonik: setiap
+persamaan dinormalisasi dengan kanonikkan_persamaan lalu kedua persamaan
+diurutkan, sehingga 2x + 2y = 4 / x - y = 0 dan x - y = 0 / x + y = 2 memakai
+satu entri, dan solusinya dihitung dari bentuk kanonik itu, yang hasilnya tepat
+sama untuk semua variasi setara. Pada mode float, toleransi determinan yang
+mutlak dapat mengklasifikasikan dua sistem setara secara berbeda (misalnya
+kelipatan 1e-5 dan 1), sehingga kuncinya koefisien apa adanya dan hasilnya
+selalu sama dengan hitung_solusi_spldv tanpa cache.
+
+Jejak metode substitusi menampilkan angka persis seperti yang diketik dan
+cabangnya bergantung pada persamaan mana yang pertama, sehingga jejak disimpan
+dengan kunci koefisien apa adanya.
+
+Cache dapat disimpan ke file SQLite lokal dengan variabel lingkungan
+SPLDV_CACHE_SQLITE atau lewat atur_cache_solusi().
+"""
+
+import os
+
+from spldv.cache import CacheTersimpan
+from spldv.eksak import kanonikkan_persamaan
+from spldv.metrik import daftarkan_sumber
+from spldv.substitusi import solve_spldv_substitusi
+
+KAPASITAS_CACHE_SOLUSI = 4096 # Jumlah entri di memori (solusi dan jejak bersama-sama)
+KAPASITAS_DISK_SOLUSI = 100_000 # Jumlah baris maksimum di file SQLite
+
+_cache_solusi = CacheTersimpan(KAPASITAS_CACHE_SOLUSI, os.environ.get("SPLDV_CACHE_SQLITE") or None,
+                               KAPASITAS_DISK_SOLUSI)
+
+
+def atur_cache_solusi(kapasitas=KAPASITAS_CACHE_SOLUSI, path_sqlite=None, kapasitas_disk=KAPASITAS_DISK_SOLUSI):
+    """Mengganti cache bersama, misalnya untuk mengaktifkan penyimpanan SQLite; cache lama ditutup."""
+    global _cache_solusi
+    lama = _cache_solusi
+    _cache_solusi = CacheTersimpan(kapasitas, path_sqlite, kapasitas_disk)
+    lama.tutup()
+
+
+def kunci_sistem(persamaan1, persamaan2):
+    """Pasangan persamaan kanonik yang sudah diurutkan, atau None jika ada koefisien NaN/inf."""
+    try:
+        return tuple(sorted((kanonikkan_persamaan(persamaan1), kanonikkan_persamaan(persamaan2))))
+    except (ValueError, OverflowError):
+        return None
+
+
+def hitung_solusi_spldv_cache(persamaan1, persamaan2, eksak=False):
+    """
+    Seperti hitung_solusi_spldv, tetapi hasilnya diambil dari cache bersama. Pada mode eksak,
+    sistem yang setara (kelipatan atau urutan persamaan ditukar) memakai entri yang sama;
+    pada mode float hanya koefisien yang persis sama.
+    """
+    from spldv.solver import hitung_solusi_spldv # NumPy hanya dimuat jika solver ini dipakai
+
+    if eksak:
+        sistem = kunci_sistem(persamaan1, persamaan2)
+    else:
+        try:
+            sistem = (tuple(map(float, persamaan1)), tuple(map(float, persamaan2)))
+        except (TypeError, ValueError, OverflowError):
+            sistem = None
+    if sistem is None:
+        return hitung_solusi_spldv(persamaan1, persamaan2, eksak=eksak)
+
+    kunci = f"solusi:{int(eksak)}:{sistem!r}"
+    hasil = _cache_solusi.get(kunci)
+    if hasil is None:
+        hasil = hitung_solusi_spldv(*sistem, eksak=eksak)
+        _cache_solusi.put(kunci, hasil)
+    return hasil
+
+
+def solve_spldv_substitusi_cache(a1, b1, c1, a2, b2, c2, eksak=False):
+    """Seperti solve_spldv_substitusi, tetapi JejakSubstitusi (yang tidak dapat diubah) diambil dari cache bersama."""
+    kunci = f"jejak:{int(eksak)}:{(a1, b1, c1, a2, b2, c2)!r}"
+    jejak = _cache_solusi.get(kunci)
+    if jejak is None:
+        jejak = solve_spldv_substitusi(a1, b1, c1, a2, b2, c2, eksak=eksak)
+        _cache_solusi.put(kunci, jejak)
+    return jejak
+
+
+def statistik_cache_solusi():
+    """Statistik cache solusi bersama (ukuran, hits, misses, evictions, hits_disk, hit_rate)."""
+    return _cache_solusi.statistik()
+
+
+daftarkan_sumber("cache_solusi", statistik_cache_solusi)
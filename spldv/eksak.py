@@ -0,0 +1,108 @@
+from fractions import Fraction
+from math import gcd, lcm
+
+from spldv.status import STATUS_BERHIMPIT, STATUS_PARALEL, STATUS_TIDAK_VALID, STATUS_UNIK
+
+
+def ke_rasional(nilai):
+    """
+    Mengubah koefisien menjadi bilangan eksak: int untuk bilangan bulat, Fraction selain itu.
+    Float diubah lewat representasi desimalnya, sehingga 0.1 menjadi 1/10 seperti yang diketik pengguna.
+    """
+    if isinstance(nilai, bool):
+        return int(nilai)
+    if isinstance(nilai, int):
+        return nilai
+    if isinstance(nilai, float):
+        if nilai.is_integer():
+            return int(nilai)
+        return Fraction(repr(nilai))
+    pecahan = Fraction(nilai)
+    return pecahan.numerator if pecahan.denominator == 1 else pecahan
+
+
+def _sederhanakan(pembilang, penyebut):
+    """Membagi pasangan pembilang/penyebut bulat dengan FPB-nya; penyebut dibuat positif."""
+    fpb = gcd(pembilang, penyebut)
+    if penyebut < 0:
+        fpb = -fpb
+    return pembilang // fpb, penyebut // fpb
+
+
+def kanonikkan_persamaan(persamaan):
+    """
+    Bentuk kanonik satu persamaan (a, b, c) sebagai tiga int: dikalikan agar bulat,
+    dibagi FPB-nya, dan koefisien tak nol pertama dibuat positif.
+    Persamaan yang merupakan kelipatan satu sama lain, misalnya 2x + 2y = 4 dan
+    -x - y = -2, menghasilkan bentuk yang sama. Koefisien NaN/inf memunculkan ValueError/OverflowError.
+    """
+    bulat = [ke_rasional(v) for v in persamaan]
+    if not all(type(v) is int for v in bulat):
+        pengali = lcm(*(v.denominator for v in bulat))
+        bulat = [int(v * pengali) for v in bulat]
+    fpb = gcd(*bulat)
+    if fpb == 0:
+        return (0, 0, 0)
+    if next(v for v in bulat if v != 0) < 0:
+        fpb = -fpb
+    return tuple(v // fpb for v in bulat)
+
+
+def cramer_bulat(a1, b1, c1, a2, b2, c2):
+    """
+    Jalur cepat aturan Cramer untuk koefisien bulat, hanya dengan aritmetika int.
+    Mengembalikan (status, (pembilang_x, penyebut_x), (pembilang_y, penyebut_y));
+    pasangan pecahan sudah disederhanakan dan bernilai None jika tidak ada solusi unik.
+    """
+    if (a1 == 0 and b1 == 0) or (a2 == 0 and b2 == 0):
+        return STATUS_TIDAK_VALID, None, None
+
+    determinant = a1 * b2 - a2 * b1
+    det_x = c1 * b2 - c2 * b1
+    det_y = a1 * c2 - a2 * c1
+    if determinant == 0:
+        if det_x == 0 and det_y == 0:
+            return STATUS_BERHIMPIT, None, None
+        return STATUS_PARALEL, None, None
+    return STATUS_UNIK, _sederhanakan(det_x, determinant), _sederhanakan(det_y, determinant)
+
+
+def _cramer_pecahan(a1, b1, c1, a2, b2, c2):
+    """Aturan Cramer dengan Fraction untuk koefisien yang tidak semuanya bulat."""
+    if (a1 == 0 and b1 == 0) or (a2 == 0 and b2 == 0):
+        return STATUS_TIDAK_VALID, None, None
+
+    determinant = a1 * b2 - a2 * b1
+    det_x = c1 * b2 - c2 * b1
+    det_y = a1 * c2 - a2 * c1
+    if determinant == 0:
+        if det_x == 0 and det_y == 0:
+            return STATUS_BERHIMPIT, None, None
+        return STATUS_PARALEL, None, None
+    x = Fraction(det_x) / determinant
+    y = Fraction(det_y) / determinant
+    return STATUS_UNIK, (x.numerator, x.denominator), (y.numerator, y.denominator)
+
+
+def selesaikan_eksak(persamaan1, persamaan2):
+    """
+    Menyelesaikan SPLDV secara eksak tanpa toleransi floating point.
+    Mengembalikan (status, (pembilang_x, penyebut_x), (pembilang_y, penyebut_y)) seperti cramer_bulat.
+    """
+    koefisien = [ke_rasional(v) for v in (*persamaan1, *persamaan2)]
+    if all(isinstance(v, int) for v in koefisien):
+        return cramer_bulat(*koefisien)
+    return _cramer_pecahan(*koefisien)
+
+
+def hitung_solusi_spldv_eksak(persamaan1, persamaan2):
+    """
+    Versi eksak dari hitung_solusi_spldv dengan kontrak nilai kembali yang sama,
+    tetapi x dan y berupa Fraction. Sistem dianggap sejajar hanya jika determinannya tepat nol.
+    """
+    status, solusi_x, solusi_y = selesaikan_eksak(persamaan1, persamaan2)
+    if status == STATUS_UNIK:
+        return Fraction(*solusi_x), Fraction(*solusi_y)
+    if status == STATUS_BERHIMPIT:
+        return float('inf'), float('inf') # Mengindikasikan tak terhingga solusi
+    return None, None # Garis paralel atau persamaan tidak valid
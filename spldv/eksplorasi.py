@@ -0,0 +1,74 @@
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from spldv.plotting import hitung_batas_y
+from spldv.solver import hitung_y
+
+# Posisi slider "Nilai X Coba": -10..10 dengan langkah 0.1 (201 posisi)
+LANGKAH_X_COBA = 0.1
+GRID_X_COBA = np.arange(-100, 101) / 10
+TOLERANSI_SAMA = 0.05 # Toleransi untuk dianggap "sama", sama dengan halaman discovery
+
+
+def hitung_grid_eksplorasi(persamaan1, persamaan2, x_grid=GRID_X_COBA):
+    """
+    Menghitung y1, y2, dan |y1 - y2| untuk semua posisi slider sekaligus.
+    Mengembalikan DataFrame dengan kolom x, y1, y2, selisih.
+    """
+    y1 = hitung_y(persamaan1, x_grid)
+    y2 = hitung_y(persamaan2, x_grid)
+    return pd.DataFrame({"x": x_grid, "y1": y1, "y2": y2, "selisih": np.abs(y1 - y2)})
+
+
+def _batas_y(grid):
+    """Batas sumbu Y dengan aturan yang sama seperti plot_garis."""
+    return hitung_batas_y(grid[["y1", "y2"]].to_numpy())
+
+
+def chart_eksplorasi(grid, persamaan1, persamaan2, color1, color2, x_awal=0.0):
+    """
+    Membuat grafik Altair dengan slider "Nilai X Coba" yang berjalan sepenuhnya di browser.
+    Titik coba dan nilai Y1, Y2, |Y1 - Y2| dipilih dari grid yang sudah dihitung,
+    sehingga menggeser slider tidak memicu rerun skrip di server.
+    """
+    a1, b1, c1 = persamaan1
+    a2, b2, c2 = persamaan2
+    label1 = f'{a1:.0f}x + {b1:.0f}y = {c1:.0f} (Garis 1)'
+    label2 = f'{a2:.0f}x + {b2:.0f}y = {c2:.0f} (Garis 2)'
+
+    x_coba = alt.param(
+        name="x_coba",
+        value=x_awal,
+        bind=alt.binding_range(min=float(grid["x"].min()), max=float(grid["x"].max()), step=LANGKAH_X_COBA,
+                               name="➡️ Geser Nilai X Coba: "),
+    )
+    dasar = alt.Chart(grid)
+    sumbu_x = alt.X("x:Q", title="Nilai X", scale=alt.Scale(domain=[float(grid["x"].min()), float(grid["x"].max())]))
+    sumbu_y = alt.Y("y:Q", title="Nilai Y", scale=alt.Scale(domain=list(_batas_y(grid))))
+
+    garis = dasar.transform_fold(["y1", "y2"], as_=["garis", "y"]).transform_calculate(
+        label=f"datum.garis == 'y1' ? '{label1}' : '{label2}'"
+    ).mark_line(strokeWidth=2).encode(
+        x=sumbu_x,
+        y=sumbu_y,
+        color=alt.Color("label:N", title=None, scale=alt.Scale(domain=[label1, label2], range=[color1, color2]),
+                        legend=alt.Legend(orient="top-left")),
+    )
+
+    # Baris grid yang paling dekat dengan posisi slider: dalam setengah langkah slider
+    terpilih = dasar.transform_filter(f"abs(datum.x - x_coba) < {LANGKAH_X_COBA / 2}").transform_calculate(
+        y="(datum.y1 + datum.y2) / 2",
+        info=("'Y1 = ' + format(datum.y1, '.0f') + '   Y2 = ' + format(datum.y2, '.0f')"
+              " + '   |Y1 - Y2| = ' + format(datum.selisih, '.0f')"
+              f" + (datum.selisih < {TOLERANSI_SAMA} ? '   ✅ Sangat dekat!' : '   Perlu disesuaikan')"),
+    )
+    titik = terpilih.mark_point(filled=True, size=150, color="purple", stroke="black", strokeWidth=1.5,
+                                opacity=1).encode(x=sumbu_x, y=sumbu_y)
+    info = terpilih.mark_text(align="left", baseline="top", fontSize=14, fontWeight="bold").encode(
+        x=alt.value(5), y=alt.value(-22), text="info:N"
+    )
+
+    return (garis + titik + info).add_params(x_coba).properties(
+        title=alt.Title("Grafik Persamaan Linear", offset=30), height=450
+    )
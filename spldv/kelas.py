@@ -0,0 +1,197 @@
+"""
+Rekap kelas: percobaan eksplorasi semua siswa yang memakai aplikasi dalam satu proses.
+
+Setiap percobaan X coba dicatat ke satu PengumpulKelas bersama. Memorinya tetap
+berapa pun lamanya pelajaran: percobaan terbaru disimpan di ring buffer berukuran
+tetap, sebaran X coba, jarak ke titik potong, dan jumlah percobaan sampai berhasil
+dijumlahkan ke histogram dengan bin yang sudah ditentukan, dan jumlah siswa yang
+dilacak dibatasi KAPASITAS_SESI. Pencatatan hanya memegang lock untuk pembaruan
+O(1); potret untuk dasbor guru disalin singkat di bawah lock lalu diolah di luarnya.
+
+Contoh:
+    catat_percobaan("3f2a9c1e", (1, -1, 2), (2, 1, 7), x_coba=2.5, berhasil=False)
+    potret_kelas()["belum_menemukan"]
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from spldv.metrik import daftarkan_sumber
+from spldv.solver import hitung_solusi_spldv
+
+UKURAN_RIWAYAT = 5000 # Percobaan terbaru untuk grafik aktivitas
+KAPASITAS_SESI = 500 # Siswa yang dilacak; yang paling lama tidak mencoba dibuang lebih dulu
+BATAS_AKTIF = 300.0 # Detik tanpa percobaan sebelum siswa dianggap tidak aktif
+LEBAR_MENIT_AKTIVITAS = 15 # Jumlah menit terakhir pada grafik percobaan per menit
+
+RENTANG_X = (-10.0, 10.0) # Sama dengan rentang slider X coba
+JUMLAH_BIN_X = 40
+# Tepi bin selisih X coba terhadap X titik potong; bin pertama dan terakhir terbuka
+TEPI_JARAK = (-10.0, -5.0, -2.0, -1.0, -0.5, -0.1, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0)
+# Tepi bin jumlah percobaan sampai berhasil: 1, 2, 3-5, 6-10, 11-20, >20
+TEPI_PERCOBAAN = (2, 3, 6, 11, 21)
+
+
+def _label_bin(tepi, format_nilai="{:g}"):
+    """Label teks setiap bin untuk tepi terurut; bin pertama dan terakhir terbuka."""
+    teks = [format_nilai.format(t) for t in tepi]
+    return [f"< {teks[0]}"] + [f"{kiri} s.d. {kanan}" for kiri, kanan in zip(teks, teks[1:])] + [f"≥ {teks[-1]}"]
+
+
+LABEL_X = [f"{kiri:g}" for kiri in np.linspace(*RENTANG_X, JUMLAH_BIN_X + 1)[:-1]]
+LABEL_JARAK = _label_bin(TEPI_JARAK)
+LABEL_PERCOBAAN = ["1", "2", "3-5", "6-10", "11-20", "> 20"]
+
+
+class StatusSiswa(NamedTuple):
+    """Keadaan terakhir satu siswa; tidak pernah diubah di tempat, sehingga potret cukup menyalin referensinya."""
+
+    soal: tuple
+    percobaan: int
+    berhasil: bool
+    x_coba: float
+    jarak: Optional[float] # X coba dikurangi X titik potong; None jika sistem tidak bersolusi unik
+    waktu: float
+    soal_selesai: int
+
+
+def _bin_x(x_coba):
+    posisi = (x_coba - RENTANG_X[0]) / (RENTANG_X[1] - RENTANG_X[0]) * JUMLAH_BIN_X
+    return min(max(int(posisi), 0), JUMLAH_BIN_X - 1)
+
+
+def _per_menit(waktu, sekarang):
+    """Jumlah kejadian per menit untuk LEBAR_MENIT_AKTIVITAS menit terakhir."""
+    menit = (np.clip(sekarang - np.asarray(waktu, dtype=float), 0, None) // 60).astype(int)
+    return np.bincount(menit[menit < LEBAR_MENIT_AKTIVITAS], minlength=LEBAR_MENIT_AKTIVITAS).tolist()
+
+
+def _x_potong(persamaan1, persamaan2):
+    x, _ = hitung_solusi_spldv(persamaan1, persamaan2)
+    return x if x is not None and math.isfinite(x) else None
+
+
+class PengumpulKelas:
+    """Mengumpulkan percobaan X coba dari banyak sesi sekaligus; aman dipakai banyak thread."""
+
+    def __init__(self, ukuran_riwayat=UKURAN_RIWAYAT, kapasitas_sesi=KAPASITAS_SESI, batas_aktif=BATAS_AKTIF):
+        self.kapasitas_sesi = kapasitas_sesi
+        self.batas_aktif = batas_aktif
+        self._riwayat = deque(maxlen=ukuran_riwayat) # (waktu, x_coba, jarak, berhasil)
+        self._sesi = OrderedDict() # id sesi -> StatusSiswa, urut dari yang paling lama tidak mencoba
+        self._histogram_x = np.zeros(JUMLAH_BIN_X, dtype=np.int64)
+        self._histogram_jarak = np.zeros(len(TEPI_JARAK) + 1, dtype=np.int64)
+        self._histogram_percobaan = np.zeros(len(TEPI_PERCOBAAN) + 1, dtype=np.int64)
+        self._total_percobaan = 0
+        self._total_berhasil = 0
+        self._lock = threading.Lock()
+
+    def catat(self, sesi, persamaan1, persamaan2, x_coba, berhasil, waktu=None):
+        """
+        Mencatat satu percobaan X coba siswa `sesi` pada sistem (persamaan1, persamaan2).
+        Percobaan pada soal yang berbeda dari sebelumnya memulai hitungan percobaan baru untuk siswa itu.
+        """
+        waktu = time.time() if waktu is None else waktu
+        soal = (tuple(persamaan1), tuple(persamaan2))
+        x_potong = _x_potong(persamaan1, persamaan2)
+        jarak = None if x_potong is None else x_coba - x_potong
+        bin_x = _bin_x(x_coba)
+        bin_jarak = None if jarak is None else int(np.searchsorted(TEPI_JARAK, jarak, side="right"))
+
+        with self._lock:
+            lama = self._sesi.pop(sesi, None)
+            soal_selesai = lama.soal_selesai if lama is not None else 0
+            if lama is None or lama.soal != soal:
+                percobaan, sudah_berhasil = 1, False
+            else:
+                percobaan, sudah_berhasil = lama.percobaan + 1, lama.berhasil
+            if berhasil and not sudah_berhasil:
+                soal_selesai += 1
+                self._total_berhasil += 1
+                self._histogram_percobaan[np.searchsorted(TEPI_PERCOBAAN, percobaan, side="right")] += 1
+            self._sesi[sesi] = StatusSiswa(soal, percobaan, sudah_berhasil or berhasil, x_coba, jarak, waktu,
+                                           soal_selesai)
+            if len(self._sesi) > self.kapasitas_sesi:
+                self._sesi.popitem(last=False)
+
+            self._riwayat.append((waktu, x_coba, jarak, berhasil))
+            self._histogram_x[bin_x] += 1
+            if bin_jarak is not None and not berhasil:
+                self._histogram_jarak[bin_jarak] += 1
+            self._total_percobaan += 1
+
+    def potret(self, sekarang=None):
+        """
+        Ringkasan kelas saat ini (dict): jumlah siswa aktif, yang sudah dan belum menemukan titik potong,
+        sebaran posisi siswa yang belum menemukan, histogram kumulatif, dan percobaan per menit.
+        """
+        sekarang = time.time() if sekarang is None else sekarang
+        with self._lock:
+            siswa = list(self._sesi.values())
+            riwayat = list(self._riwayat)
+            histogram_x = self._histogram_x.copy()
+            histogram_jarak = self._histogram_jarak.copy()
+            histogram_percobaan = self._histogram_percobaan.copy()
+            total_percobaan, total_berhasil = self._total_percobaan, self._total_berhasil
+
+        aktif = [s for s in siswa if sekarang - s.waktu <= self.batas_aktif]
+        belum = [s for s in aktif if not s.berhasil]
+        jarak_belum = [s.jarak for s in belum if s.jarak is not None]
+        posisi_belum = np.bincount(np.searchsorted(TEPI_JARAK, jarak_belum, side="right"),
+                                   minlength=len(TEPI_JARAK) + 1)
+
+        return {
+            "waktu": sekarang,
+            "siswa_aktif": len(aktif),
+            "sudah_menemukan": len(aktif) - len(belum),
+            "belum_menemukan": len(belum),
+            "tanpa_solusi_unik": len(belum) - len(jarak_belum),
+            "soal_selesai": sum(s.soal_selesai for s in siswa),
+            "total_percobaan": total_percobaan,
+            "total_berhasil": total_berhasil,
+            "posisi_belum_menemukan": posisi_belum.tolist(), # Per bin TEPI_JARAK
+            "histogram_x": histogram_x.tolist(),
+            "histogram_jarak": histogram_jarak.tolist(),
+            "histogram_percobaan": histogram_percobaan.tolist(),
+            # Indeks 0 = menit berjalan, 1 = satu menit sebelumnya, dan seterusnya
+            "percobaan_per_menit": _per_menit([w for w, *_ in riwayat], sekarang),
+            "berhasil_per_menit": _per_menit([w for w, _, _, ok in riwayat if ok], sekarang),
+        }
+
+    def statistik(self):
+        """Penghitung singkat untuk panel debug."""
+        with self._lock:
+            return {"siswa_dilacak": len(self._sesi), "total_percobaan": self._total_percobaan,
+                    "total_berhasil": self._total_berhasil, "riwayat": len(self._riwayat)}
+
+    def reset(self):
+        with self._lock:
+            self._riwayat.clear()
+            self._sesi.clear()
+            self._histogram_x[:] = 0
+            self._histogram_jarak[:] = 0
+            self._histogram_percobaan[:] = 0
+            self._total_percobaan = self._total_berhasil = 0
+
+
+_pengumpul = PengumpulKelas()
+
+
+def catat_percobaan(sesi, persamaan1, persamaan2, x_coba, berhasil):
+    _pengumpul.catat(sesi, persamaan1, persamaan2, x_coba, berhasil)
+
+
+def potret_kelas():
+    return _pengumpul.potret()
+
+
+def reset_kelas():
+    _pengumpul.reset()
+
+
+daftarkan_sumber("kelas", _pengumpul.statistik)
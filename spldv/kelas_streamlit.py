@@ -0,0 +1,115 @@
+import hmac
+import uuid
+
+import streamlit as st
+
+from spldv.kelas import BATAS_AKTIF, LABEL_JARAK, LABEL_PERCOBAAN, LABEL_X, catat_percobaan, potret_kelas
+
+PARAMETER_GURU = "guru" # Dasbor guru ditampilkan jika URL berisi ?guru=1
+SECRET_TOKEN_GURU = "token_guru" # Kunci di .streamlit/secrets.toml; tanpa kunci ini dasbor guru dinonaktifkan
+INTERVAL_SEGAR = 5 # Detik antar pembaruan dasbor guru
+
+
+def dasbor_guru_aktif():
+    return st.query_params.get(PARAMETER_GURU) == "1"
+
+
+def tandai_x_coba_digeser():
+    """Callback on_change slider X coba: sejak saat ini percobaan sesi boleh dicatat."""
+    st.session_state["_x_coba_digeser"] = True
+
+
+def catat_percobaan_sesi(persamaan1, persamaan2, x_coba, berhasil):
+    """
+    Mencatat percobaan X coba sesi ini ke rekap kelas. Nilai awal slider saat halaman pertama dibuka
+    belum dihitung sebagai percobaan sampai siswa menggesernya (lihat tandai_x_coba_digeser). Rerun
+    tanpa perubahan soal maupun X coba (misalnya karena warna garis diganti) juga tidak dihitung.
+    """
+    if not st.session_state.get("_x_coba_digeser"):
+        return
+    percobaan = (tuple(persamaan1), tuple(persamaan2), x_coba)
+    if st.session_state.get("_percobaan_terakhir") == percobaan:
+        return
+    st.session_state["_percobaan_terakhir"] = percobaan
+    sesi = st.session_state.setdefault("id_siswa", uuid.uuid4().hex[:8])
+    catat_percobaan(sesi, persamaan1, persamaan2, x_coba, berhasil)
+
+
+def _grafik_batang(judul, label, nilai, nama_nilai="Jumlah"):
+    import pandas as pd
+
+    st.markdown(f"**{judul}**")
+    data = pd.DataFrame({"Kelompok": pd.Categorical(label, categories=label, ordered=True), nama_nilai: nilai})
+    st.bar_chart(data, x="Kelompok", y=nama_nilai, height=220)
+
+
+@st.fragment(run_every=INTERVAL_SEGAR)
+def _isi_dasbor_guru():
+    potret = potret_kelas()
+
+    kolom = st.columns(4)
+    kolom[0].metric("Siswa aktif", potret["siswa_aktif"])
+    kolom[1].metric("Sudah menemukan", potret["sudah_menemukan"])
+    kolom[2].metric("Belum menemukan", potret["belum_menemukan"])
+    kolom[3].metric("Total percobaan", potret["total_percobaan"])
+    if potret["tanpa_solusi_unik"]:
+        st.caption(f"{potret['tanpa_solusi_unik']} siswa yang belum menemukan sedang mengerjakan sistem tanpa "
+                   f"solusi unik (garis sejajar atau berhimpit).")
+
+    kiri, kanan = st.columns(2)
+    with kiri:
+        _grafik_batang("Posisi siswa yang belum menemukan (X coba − X titik potong)",
+                       LABEL_JARAK, potret["posisi_belum_menemukan"], "Siswa")
+        _grafik_batang("Jumlah percobaan sampai menemukan", LABEL_PERCOBAAN, potret["histogram_percobaan"], "Siswa")
+    with kanan:
+        _grafik_batang("Semua percobaan yang belum tepat (X coba − X titik potong)",
+                       LABEL_JARAK, potret["histogram_jarak"], "Percobaan")
+        _grafik_batang("Sebaran nilai X coba", LABEL_X, potret["histogram_x"], "Percobaan")
+
+    import pandas as pd # Hanya dimuat di dasbor guru, bukan di halaman siswa
+
+    st.markdown("**Aktivitas per menit**")
+    aktivitas = pd.DataFrame({"Percobaan": potret["percobaan_per_menit"],
+                              "Percobaan berhasil": potret["berhasil_per_menit"]})
+    aktivitas.index.name = "Menit lalu"
+    st.line_chart(aktivitas, height=200)
+    st.caption(f"Diperbarui otomatis setiap {INTERVAL_SEGAR} detik. Siswa dianggap aktif jika mencoba dalam "
+               f"{BATAS_AKTIF / 60:g} menit terakhir.")
+
+
+def _token_guru():
+    try:
+        return st.secrets.get(SECRET_TOKEN_GURU)
+    except FileNotFoundError: # Belum ada secrets.toml sama sekali
+        return None
+
+
+def _guru_terverifikasi():
+    """Meminta token guru sekali per sesi dan membandingkannya dengan st.secrets."""
+    if st.session_state.get("_guru_terverifikasi"):
+        return True
+    token = _token_guru()
+    if not token:
+        st.error(f"Dasbor guru belum diaktifkan. Isi `{SECRET_TOKEN_GURU}` di `.streamlit/secrets.toml` server.")
+        return False
+    masukan = st.text_input("Token guru", type="password")
+    if not masukan:
+        return False
+    if not hmac.compare_digest(masukan.encode(), str(token).encode()):
+        st.error("Token guru salah.")
+        return False
+    st.session_state["_guru_terverifikasi"] = True
+    return True
+
+
+def tampilkan_dasbor_guru():
+    """
+    Halaman rekap kelas: berapa siswa yang sudah menemukan titik potong dan di mana sisanya tertahan.
+    Hanya bisa dibuka dengan token guru dari st.secrets. Hanya bagian rekap yang diperbarui berkala,
+    sehingga rerun siswa lain tidak ikut terpicu.
+    """
+    st.title("📋 Dasbor Guru: Rekap Eksplorasi Kelas")
+    if not _guru_terverifikasi():
+        return
+    st.markdown("Ringkasan percobaan **Nilai X Coba** dari semua siswa yang membuka kalkulator di server ini.")
+    _isi_dasbor_guru()
@@ -0,0 +1,216 @@
+"""
+Templat langkah-langkah metode substitusi untuk sebuah JejakSubstitusi.
+
+Tidak bergantung pada Streamlit: templat yang sama ditampilkan oleh
+spldv.substitusi_streamlit dan diekspor ke HTML/LaTeX/SVG oleh spldv.lembar_kerja.
+"""
+
+import decimal
+import functools
+import textwrap
+
+from spldv.substitusi import (
+    GAGAL_A1_NOL,
+    GAGAL_B1_NOL,
+    GAGAL_DETERMINAN_NOL,
+    GAGAL_PERSAMAAN1_TIDAK_VALID,
+)
+
+# --- Templat langkah-langkah substitusi ---
+# Setiap segmen berisi pasangan (jenis elemen, templat str.format); angka diisi dari nilai_templat(jejak).
+_SEGMEN = {
+    "mulai": (
+        ("markdown", "### Memulai Perhitungan"),
+        ("info", "Persamaan 1: **{a1}x + {b1}y = {c1}**"),
+        ("info", "Persamaan 2: **{a2}x + {b2}y = {c2}**"),
+        ("markdown", "---"),
+        ("markdown", "### Langkah 1: Ubah salah satu persamaan"),
+        ("write", "Kita akan mencoba mengubah Persamaan 1 untuk menyatakan `x` dalam bentuk `y`."),
+    ),
+    "langkah1_a1_nol": (
+        ("warning", "Koefisien A1 adalah 0. Tidak bisa menyatakan x dari Persamaan 1 dengan mudah."),
+        ("write", "Mari kita coba menyatakan `y` dari Persamaan 1: $y = (c_1 - a_1x) / b_1$"),
+    ),
+    "gagal_persamaan1": (
+        ("error", "Kedua koefisien A1 dan B1 adalah 0. Persamaan 1 tidak valid sebagai persamaan linear."),
+        ("error", "Tidak dapat melanjutkan. Harap periksa input Anda."),
+    ),
+    "langkah1_y": (
+        ("code", "y = ({c1} - {a1}x) / {b1}"),
+        ("success", "Jadi, y = {m_val:.2f}x + {c_val:.2f}"),
+    ),
+    "langkah1_x": (
+        ("code", "x = ({c1} - {b1}y) / {a1}"),
+        ("success", "Jadi, x = {m_val:.2f}y + {c_val:.2f}"),
+    ),
+    "langkah2": (
+        ("markdown", "---"),
+        ("markdown", "### Langkah 2 & 3: Substitusi dan Selesaikan"),
+        ("write", "Sekarang, kita akan substitusikan ekspresi untuk **{variabel}** ke Persamaan 2."),
+    ),
+    "gagal_determinan": (
+        ("error", "Determinan sistem mendekati nol. Sistem ini mungkin tidak memiliki solusi unik (sejajar atau berhimpit)."),
+    ),
+    "langkah2_x": (
+        ("markdown", """
+        Setelah substitusi $x = \\frac{{{c1} - {b1}y}}{{{a1}}}$ ke persamaan 2:
+        $ {a2} \\left( \\frac{{{c1} - {b1}y}}{{{a1}}} \\right) + {b2}y = {c2} $
+        """),
+        ("code", "y * ({b2} * {a1} - {a2} * {b1}) = ({c2} * {a1} - {a2} * {c1})"),
+        ("code", "y * ({penyebut:.2f}) = ({pembilang:.2f})"),
+        ("success", "Maka, **y = {nilai_pertama:.2f}**"),
+    ),
+    "langkah2_y": (
+        ("markdown", """
+        Setelah substitusi $y = \\frac{{{c1} - {a1}x}}{{{b1}}}$ ke persamaan 2:
+        $ {a2}x + {b2} \\left( \\frac{{{c1} - {a1}x}}{{{b1}}} \\right) = {c2} $
+        """),
+        ("code", "x * ({a2} * {b1} - {b2} * {a1}) = ({c2} * {b1} - {b2} * {c1})"),
+        ("code", "x * ({penyebut:.2f}) = ({pembilang:.2f})"),
+        ("success", "Maka, **x = {nilai_pertama:.2f}**"),
+    ),
+    "langkah4": (
+        ("markdown", "---"),
+        ("markdown", "### Langkah 4: Substitusi Balik"),
+        ("write", "Setelah kita menemukan {variabel_lain} = {nilai_pertama:.2f},"),
+        ("write", "kita akan substitusikan nilai ini kembali ke Persamaan 1 untuk menemukan nilai variabel yang tersisa."),
+    ),
+    "gagal_b1": (
+        ("error", "Koefisien B1 adalah 0. Tidak dapat menemukan y dari Persamaan 1."),
+    ),
+    "gagal_a1": (
+        ("error", "Koefisien A1 adalah 0. Tidak dapat menemukan x dari Persamaan 1."),
+    ),
+    "langkah4_x": (
+        ("code", "{a1} * {x:.2f} + {b1}y = {c1}"),
+        ("code", "{suku_balik:.2f} + {b1}y = {c1}"),
+        ("code", "{b1}y = {c1} - {suku_balik:.2f}"),
+        ("code", "{b1}y = {sisa_balik:.2f}"),
+        ("code", "y = {sisa_balik:.2f} / {b1:.2f}"),
+        ("success", "Didapatkan **y = {y:.2f}**"),
+    ),
+    "langkah4_y": (
+        ("code", "{a1}x + {b1} * {y:.2f} = {c1}"),
+        ("code", "{a1}x + {suku_balik:.2f} = {c1}"),
+        ("code", "{a1}x = {c1} - {suku_balik:.2f}"),
+        ("code", "{a1}x = {sisa_balik:.2f}"),
+        ("code", "x = {sisa_balik:.2f} / {a1:.2f}"),
+        ("success", "Didapatkan **x = {x:.2f}**"),
+    ),
+    # Solusi akhir dan verifikasi setelah langkah 4 (lihat bentuk_solusi_akhir);
+    # cek1 dan cek2 adalah ruas kiri kedua persamaan dari verifikasi_solusi
+    "solusi_akhir": (
+        ("markdown", "---"),
+        ("markdown", "## 🎉 Solusi Akhir 🎉"),
+        ("success", "Nilai **x = {x:.2f}**"),
+        ("success", "Nilai **y = {y:.2f}**"),
+        ("markdown", "---"),
+        ("markdown", "### Verifikasi Solusi"),
+        ("markdown", "**Persamaan 1**: `{a1} * {x:.2f} + {b1} * {y:.2f} = {cek1:.2f}` (Seharusnya `{c1:.2f}`)"),
+        ("markdown", "**Persamaan 2**: `{a2} * {x:.2f} + {b2} * {y:.2f} = {cek2:.2f}` (Seharusnya `{c2:.2f}`)"),
+    ),
+    "verifikasi_tepat": (
+        ("success", "🎉 Solusi Anda TEPAT! 🎉"),
+    ),
+    "verifikasi_selisih": (
+        ("warning", "Ada sedikit perbedaan dalam verifikasi. Mungkin karena pembulatan, atau ada kasus khusus."),
+    ),
+    # Pengganti seluruh langkah untuk soal yang tidak dapat diselesaikan, misalnya koefisien NaN/inf pada file soal
+    "input_tidak_valid": (
+        ("info", "Persamaan 1: **{a1}x + {b1}y = {c1}**"),
+        ("info", "Persamaan 2: **{a2}x + {b2}y = {c2}**"),
+        ("error", "Input tidak valid: semua koefisien harus berupa bilangan hingga. Soal ini tidak dapat diselesaikan."),
+    ),
+}
+
+# Presisi angka di luar rentang float saat ditampilkan; setara dengan digit bermakna float64
+_KONTEKS_TAMPILAN = decimal.Context(prec=17)
+
+# Jenis elemen yang dapat digabung ke dalam satu blok markdown tanpa mengubah tampilannya
+_JENIS_MARKDOWN = {"markdown", "write", "code"}
+
+
+def bentuk_jejak(jejak):
+    """Urutan nama segmen templat yang dilalui sebuah jejak, sesuai cabang perhitungannya."""
+    bentuk = ["mulai"]
+    if jejak.a1 == 0:
+        bentuk.append("langkah1_a1_nol")
+        if jejak.alasan_gagal == GAGAL_PERSAMAAN1_TIDAK_VALID:
+            bentuk.append("gagal_persamaan1")
+            return tuple(bentuk)
+        bentuk.append("langkah1_y")
+    else:
+        bentuk.append("langkah1_x")
+
+    bentuk.append("langkah2")
+    if jejak.alasan_gagal == GAGAL_DETERMINAN_NOL:
+        bentuk.append("gagal_determinan")
+        return tuple(bentuk)
+    bentuk.append("langkah2_x" if jejak.variabel_substitusi == 'x' else "langkah2_y")
+
+    bentuk.append("langkah4")
+    if jejak.alasan_gagal == GAGAL_B1_NOL:
+        bentuk.append("gagal_b1")
+    elif jejak.alasan_gagal == GAGAL_A1_NOL:
+        bentuk.append("gagal_a1")
+    else:
+        bentuk.append("langkah4_x" if jejak.variabel_substitusi == 'x' else "langkah4_y")
+    return tuple(bentuk)
+
+
+def bentuk_solusi_akhir(tepat):
+    """Nama segmen solusi akhir beserta hasil verifikasinya, untuk jejak yang berhasil diselesaikan."""
+    return ("solusi_akhir", "verifikasi_tepat" if tepat else "verifikasi_selisih")
+
+
+def _ke_markdown(jenis, teks):
+    """Menulis satu elemen sebagai potongan markdown; st.code bawaan memakai penyorotan Python."""
+    if jenis == "code":
+        return f"```python\n{teks}\n```"
+    return textwrap.dedent(teks).strip() # Sama seperti pembersihan teks oleh st.markdown
+
+
+@functools.cache
+def templat_jejak(bentuk, gabung=False):
+    """
+    Menyusun daftar (jenis, templat) untuk satu bentuk jejak.
+    Dengan gabung=True, elemen markdown/write/code yang berurutan disatukan menjadi satu blok markdown.
+    Hasilnya di-cache per bentuk, sehingga setiap perhitungan hanya perlu mengisi angka.
+    """
+    elemen = [item for nama in bentuk for item in _SEGMEN[nama]]
+    if not gabung:
+        return tuple(elemen)
+
+    hasil = []
+    for jenis, teks in elemen:
+        if jenis in _JENIS_MARKDOWN:
+            potongan = _ke_markdown(jenis, teks)
+            if hasil and hasil[-1][0] == "markdown":
+                hasil[-1] = ("markdown", hasil[-1][1] + "\n\n" + potongan)
+            else:
+                hasil.append(("markdown", potongan))
+        else:
+            hasil.append((jenis, teks))
+    return tuple(hasil)
+
+
+def angka_tampilan(angka):
+    """
+    Angka jejak (int, float, atau Fraction) dalam bentuk yang dapat diisi ke templat seperti {x:.2f}:
+    float jika muat, atau Decimal jika nilai eksaknya di luar rentang float.
+    """
+    try:
+        return float(angka)
+    except OverflowError:
+        return _KONTEKS_TAMPILAN.divide(decimal.Decimal(angka.numerator), decimal.Decimal(angka.denominator))
+
+
+def nilai_templat(jejak):
+    """Nilai pengisi templat; nilai antara diubah dengan angka_tampilan hanya untuk ditampilkan, sehingga jejak eksak juga didukung."""
+    nilai = dict(a1=jejak.a1, b1=jejak.b1, c1=jejak.c1, a2=jejak.a2, b2=jejak.b2, c2=jejak.c2,
+                 variabel=jejak.variabel_substitusi,
+                 variabel_lain='y' if jejak.variabel_substitusi == 'x' else 'x')
+    for nama in ("m_val", "c_val", "pembilang", "penyebut", "nilai_pertama", "suku_balik", "sisa_balik", "x", "y"):
+        angka = getattr(jejak, nama)
+        nilai[nama] = angka_tampilan(angka) if angka is not None else None
+    return nilai
@@ -0,0 +1,229 @@
+"""
+Pembuat soal latihan SPLDV acak dalam jumlah besar.
+
+Soal dibangun dari solusinya: solusi x = px/qx dan y = py/qy dipilih lebih
+dulu, koefisien x dibuat kelipatan qx dan koefisien y kelipatan qy, lalu
+konstanta dihitung sebagai c = a*x + b*y. Dengan begitu c selalu bulat dan
+solusinya dijamin berupa bilangan bulat atau pecahan sederhana. Satu batch
+dibangkitkan sekaligus dengan NumPy; sistem dengan determinan nol dibuang,
+dan sistem yang setara (kelipatan persamaan atau urutan persamaan ditukar)
+hanya disimpan sekali. Setiap soal diperiksa ulang dengan
+hitung_solusi_spldv_campuran sebelum dikembalikan.
+
+Contoh:
+    python -m spldv.latihan 50000 soal.csv --tingkat sedang --seed 1
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from spldv.solver import hitung_solusi_spldv_campuran
+from spldv.status import STATUS_UNIK
+
+# Parameter bawaan per tingkat kesulitan; setiap nilai dapat ditimpa lewat argumen buat_soal
+TINGKAT = {
+    "mudah": {"rentang_koefisien": (1, 5), "rentang_solusi": (-5, 5), "penyebut_maks": 1},
+    "sedang": {"rentang_koefisien": (-9, 9), "rentang_solusi": (-10, 10), "penyebut_maks": 1},
+    "sulit": {"rentang_koefisien": (-12, 12), "rentang_solusi": (-10, 10), "penyebut_maks": 4},
+}
+
+FAKTOR_LEBIH = 1.5 # Batch dibangkitkan lebih besar dari kebutuhan untuk menutup soal yang dibuang
+UKURAN_BATCH_MIN = 4096 # Batch sekecil ini tanpa soal baru berarti rentang sudah habis
+BATAS_PUTARAN = 20 # Jumlah batch maksimum sebelum rentang dianggap terlalu sempit
+
+
+def _acak_kelipatan(rng, penyebut, rentang, tanpa_nol):
+    """
+    Koefisien acak berupa kelipatan `penyebut` di dalam `rentang` (inklusif), satu per baris.
+    Mengembalikan (koefisien, valid); valid bernilai False jika rentang tidak memuat kelipatan yang boleh dipakai.
+    """
+    bawah = -(-rentang[0] // penyebut) # Pembagian dengan pembulatan ke atas
+    atas = rentang[1] // penyebut
+    banyak = atas - bawah + 1
+    if tanpa_nol:
+        # Nol dilewati dengan menggeser nilai >= 0 satu langkah ke atas
+        memuat_nol = (bawah <= 0) & (atas >= 0)
+        banyak = banyak - memuat_nol
+        faktor = bawah + np.floor(rng.random(penyebut.shape) * np.maximum(banyak, 1)).astype(np.int64)
+        faktor += memuat_nol & (faktor >= 0)
+    else:
+        faktor = bawah + np.floor(rng.random(penyebut.shape) * np.maximum(banyak, 1)).astype(np.int64)
+    return faktor * penyebut, banyak > 0
+
+
+def _bangkitkan_batch(rng, ukuran, rentang_koefisien, rentang_solusi, penyebut_maks, tanpa_nol):
+    """Satu batch calon soal: (koefisien (n, 6), solusi x (n, 2), solusi y (n, 2)) yang determinannya tidak nol."""
+    qx = rng.integers(1, penyebut_maks + 1, ukuran)
+    qy = rng.integers(1, penyebut_maks + 1, ukuran)
+    px = rng.integers(rentang_solusi[0] * qx, rentang_solusi[1] * qx + 1)
+    py = rng.integers(rentang_solusi[0] * qy, rentang_solusi[1] * qy + 1)
+
+    a1, valid_a1 = _acak_kelipatan(rng, qx, rentang_koefisien, tanpa_nol)
+    a2, valid_a2 = _acak_kelipatan(rng, qx, rentang_koefisien, tanpa_nol)
+    b1, valid_b1 = _acak_kelipatan(rng, qy, rentang_koefisien, tanpa_nol)
+    b2, valid_b2 = _acak_kelipatan(rng, qy, rentang_koefisien, tanpa_nol)
+    c1 = a1 // qx * px + b1 // qy * py
+    c2 = a2 // qx * px + b2 // qy * py
+
+    pakai = valid_a1 & valid_a2 & valid_b1 & valid_b2 & (a1 * b2 - a2 * b1 != 0)
+    koefisien = np.column_stack([a1, b1, c1, a2, b2, c2])[pakai]
+    return koefisien, _sederhanakan(px[pakai], qx[pakai]), _sederhanakan(py[pakai], qy[pakai])
+
+
+def _sederhanakan(pembilang, penyebut):
+    fpb = np.gcd(pembilang, penyebut)
+    return np.column_stack([pembilang // fpb, penyebut // fpb])
+
+
+def kunci_kanonik(koefisien):
+    """
+    Bentuk kanonik (n, 6) dari array koefisien bulat (n, 6), versi ter-vektorisasi dari kanonikkan_persamaan:
+    setiap persamaan dibagi FPB koefisiennya, koefisien tak nol pertama dibuat positif, lalu kedua persamaan diurutkan.
+    """
+    persamaan = koefisien.reshape(-1, 2, 3)
+    fpb = np.gcd.reduce(persamaan, axis=2, keepdims=True)
+    persamaan = persamaan // np.maximum(fpb, 1)
+    tanda = np.where(persamaan[..., 0] != 0, np.sign(persamaan[..., 0]), np.sign(persamaan[..., 1]))
+    persamaan = persamaan * np.where(tanda == 0, 1, tanda)[..., None]
+
+    selisih = persamaan[:, 0] - persamaan[:, 1]
+    pertama = np.argmax(selisih != 0, axis=1)
+    tukar = selisih[np.arange(len(selisih)), pertama] > 0
+    persamaan[tukar] = persamaan[tukar][:, ::-1]
+    return persamaan.reshape(-1, 6)
+
+
+def buat_soal(jumlah, tingkat="sedang", rentang_koefisien=None, rentang_solusi=None, penyebut_maks=None,
+              tanpa_nol=False, seed=None):
+    """
+    Membangkitkan `jumlah` SPLDV berbeda yang masing-masing memiliki tepat satu solusi.
+
+    Rentang koefisien dan solusi berupa pasangan (min, maks) inklusif; nilai yang tidak
+    diberikan diambil dari TINGKAT[tingkat]. penyebut_maks=1 berarti solusi selalu bulat.
+    Dengan tanpa_nol=True tidak ada koefisien x atau y yang bernilai nol, sehingga
+    langkah metode substitusi selalu dapat ditampilkan.
+
+    Mengembalikan (koefisien, solusi_x, solusi_y): koefisien berupa array int64 (jumlah, 6)
+    berurutan a1, b1, c1, a2, b2, c2, solusi berupa array (jumlah, 2) berisi pasangan
+    (pembilang, penyebut) yang sudah disederhanakan.
+    Melempar ValueError jika rentang terlalu sempit untuk menghasilkan `jumlah` soal berbeda.
+    """
+    if tingkat not in TINGKAT:
+        raise ValueError(f"Tingkat tidak dikenal: {tingkat} (pilih {', '.join(TINGKAT)})")
+    bawaan = TINGKAT[tingkat]
+    rentang_koefisien = rentang_koefisien or bawaan["rentang_koefisien"]
+    rentang_solusi = rentang_solusi or bawaan["rentang_solusi"]
+    penyebut_maks = penyebut_maks or bawaan["penyebut_maks"]
+    if rentang_koefisien[0] > rentang_koefisien[1] or rentang_solusi[0] > rentang_solusi[1]:
+        raise ValueError("Batas bawah rentang tidak boleh lebih besar dari batas atasnya")
+
+    rng = np.random.default_rng(seed)
+    koefisien = np.empty((0, 6), dtype=np.int64)
+    solusi_x = solusi_y = np.empty((0, 2), dtype=np.int64)
+    for _ in range(BATAS_PUTARAN):
+        jumlah_lama = len(koefisien)
+        ukuran = max(int((jumlah - len(koefisien)) * FAKTOR_LEBIH), UKURAN_BATCH_MIN)
+        batch = _bangkitkan_batch(rng, ukuran, rentang_koefisien, rentang_solusi, penyebut_maks, tanpa_nol)
+        koefisien, solusi_x, solusi_y = (np.concatenate([lama, baru]) for lama, baru in
+                                         zip((koefisien, solusi_x, solusi_y), batch))
+
+        # Soal setara hanya disimpan sekali; urutan kemunculan pertama dipertahankan
+        _, indeks = np.unique(kunci_kanonik(koefisien), axis=0, return_index=True)
+        indeks.sort()
+        koefisien, solusi_x, solusi_y = koefisien[indeks], solusi_x[indeks], solusi_y[indeks]
+        if len(koefisien) >= jumlah or len(koefisien) == jumlah_lama: # Cukup, atau semua soal di rentang ini sudah muncul
+            break
+    if len(koefisien) < jumlah:
+        raise ValueError(f"Rentang terlalu sempit: hanya {len(koefisien)} soal berbeda yang ditemukan "
+                         f"dari {jumlah} yang diminta")
+
+    koefisien, solusi_x, solusi_y = koefisien[:jumlah], solusi_x[:jumlah], solusi_y[:jumlah]
+    periksa_soal(koefisien, solusi_x, solusi_y)
+    return koefisien, solusi_x, solusi_y
+
+
+def periksa_soal(koefisien, solusi_x, solusi_y):
+    """
+    Memastikan setiap soal berstatus unik dan solusinya sama dengan hitung_solusi_spldv_batch.
+    Koefisien bulat kecil diselesaikan di jalur float32 yang hasilnya sama persis.
+    """
+    x, y, status, _ = hitung_solusi_spldv_campuran(koefisien.reshape(-1, 2, 3))
+    salah = ((status != STATUS_UNIK)
+             | ~np.isclose(x, solusi_x[:, 0] / solusi_x[:, 1])
+             | ~np.isclose(y, solusi_y[:, 0] / solusi_y[:, 1]))
+    if salah.any():
+        raise AssertionError(f"{int(salah.sum())} soal tidak lolos pemeriksaan, misalnya {koefisien[salah][0].tolist()}")
+
+
+def _teks_pecahan(pecahan):
+    teks = pecahan[:, 0].astype(str)
+    return np.where(pecahan[:, 1] == 1, teks, np.char.add(np.char.add(teks, "/"), pecahan[:, 1].astype(str)))
+
+
+def ke_dataframe(koefisien, solusi_x, solusi_y):
+    """DataFrame soal dengan kolom a1..c2 (dapat langsung dibaca spldv.bulk), x, y, dan bentuk pecahannya."""
+    import pandas as pd
+
+    from spldv.bulk import KOLOM_KOEFISIEN
+
+    hasil = pd.DataFrame(koefisien, columns=KOLOM_KOEFISIEN)
+    hasil["x"] = solusi_x[:, 0] / solusi_x[:, 1]
+    hasil["y"] = solusi_y[:, 0] / solusi_y[:, 1]
+    hasil["x_pecahan"] = _teks_pecahan(solusi_x)
+    hasil["y_pecahan"] = _teks_pecahan(solusi_y)
+    return hasil
+
+
+def simpan_soal(path, koefisien, solusi_x, solusi_y):
+    """
+    Menyimpan soal ke file .csv, .json (daftar objek, satu per soal), atau bank soal biner .spldv.
+    Bank soal hanya menyimpan koefisien (int32) beserta kolom hasil x, y, dan status.
+    """
+    akhiran = Path(str(path)).suffix.lower()
+    if akhiran not in (".csv", ".json", ".spldv"):
+        raise ValueError(f"Format file tidak dikenali: {path} (gunakan .csv, .json, atau .spldv)")
+    if akhiran == ".spldv":
+        from spldv.bank_biner import tulis_bank
+
+        tulis_bank(path, koefisien, dtype="int32", dengan_hasil=True)
+        return
+    hasil = ke_dataframe(koefisien, solusi_x, solusi_y)
+    if akhiran == ".csv":
+        hasil.to_csv(path, index=False)
+    else:
+        with open(path, "w") as f:
+            json.dump(hasil.to_dict(orient="records"), f, indent=1)
+
+
+def _rentang(teks):
+    bawah, atas = (int(nilai) for nilai in teks.split(","))
+    return bawah, atas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Membuat soal latihan SPLDV acak dengan solusi bulat atau pecahan sederhana.")
+    parser.add_argument("jumlah", type=int, help="Jumlah soal")
+    parser.add_argument("keluaran", help="File hasil (.csv, .json, atau bank soal .spldv)")
+    parser.add_argument("--tingkat", choices=list(TINGKAT), default="sedang")
+    parser.add_argument("--rentang-koefisien", type=_rentang, help="Rentang koefisien a dan b, misalnya -9,9")
+    parser.add_argument("--rentang-solusi", type=_rentang, help="Rentang nilai x dan y, misalnya -10,10")
+    parser.add_argument("--penyebut-maks", type=int, help="Penyebut terbesar solusi (1 = solusi bulat)")
+    parser.add_argument("--tanpa-nol", action="store_true", help="Koefisien a dan b tidak pernah nol")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    mulai = time.perf_counter()
+    soal = buat_soal(args.jumlah, args.tingkat, args.rentang_koefisien, args.rentang_solusi,
+                     args.penyebut_maks, args.tanpa_nol, args.seed)
+    detik_buat = time.perf_counter() - mulai
+    simpan_soal(args.keluaran, *soal)
+    print(f"{args.jumlah:,} soal dibuat dalam {detik_buat:.2f} detik ({args.jumlah / detik_buat:,.0f} soal/detik), "
+          f"disimpan ke {args.keluaran}")
+
+
+if __name__ == "__main__":
+    main()
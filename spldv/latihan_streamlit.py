@@ -0,0 +1,75 @@
+import os
+import random
+
+import streamlit as st
+
+# Path bank soal biner (.spldv, lihat spldv.bank_biner); jika diisi, sidebar menampilkan input "Muat Soal Nomor"
+PATH_BANK_SOAL = os.environ.get("SPLDV_BANK_SOAL") or None
+JUMLAH_BANK_LATIHAN = 1000 # Soal per tingkat yang dibuat sekali lalu dipakai bersama semua sesi
+PILIHAN_TINGKAT = ("mudah", "sedang", "sulit") # Kunci spldv.latihan.TINGKAT, ditulis ulang agar NumPy tidak dimuat
+
+
+@st.cache_resource(show_spinner=False)
+def bank_latihan(tingkat):
+    """Bank soal latihan satu tingkat (koefisien, solusi_x, solusi_y), dibuat sekali per proses."""
+    from spldv.latihan import buat_soal # NumPy hanya dimuat saat soal latihan pertama kali diminta
+
+    # Tanpa koefisien nol agar langkah metode substitusi selalu dapat ditampilkan
+    return buat_soal(JUMLAH_BANK_LATIHAN, tingkat, tanpa_nol=True, seed=0)
+
+
+def isi_soal_latihan(kunci_input, tingkat):
+    """Mengisi keenam input koefisien (urutan a1, b1, c1, a2, b2, c2) dengan satu soal acak dari bank latihan."""
+    koefisien, _, _ = bank_latihan(tingkat)
+    soal = koefisien[random.randrange(len(koefisien))]
+    for kunci, nilai in zip(kunci_input, soal.tolist()):
+        st.session_state[kunci] = float(nilai)
+
+
+@st.cache_resource(show_spinner=False)
+def bank_soal_berkas(path):
+    """Bank soal biner yang dipetakan ke memori sekali per proses; semua sesi membaca halaman yang sama."""
+    from spldv.bank_biner import BankSoal
+
+    return BankSoal(path)
+
+
+def isi_soal_bank(kunci_input, nomor):
+    """Mengisi keenam input koefisien dengan soal nomor `nomor` (mulai 1) dari bank soal biner."""
+    persamaan1, persamaan2 = bank_soal_berkas(PATH_BANK_SOAL).soal(nomor - 1) # Hanya satu baris yang dibaca dari file
+    for kunci, nilai in zip(kunci_input, persamaan1 + persamaan2):
+        st.session_state[kunci] = nilai
+
+
+def _tampilkan_muat_soal_bank(kunci_input):
+    try:
+        jumlah = len(bank_soal_berkas(PATH_BANK_SOAL))
+    except (OSError, ValueError) as e:
+        st.warning(f"Bank soal {PATH_BANK_SOAL} tidak dapat dibuka: {e}")
+        return
+    if jumlah == 0:
+        return
+    nomor = st.number_input(f"Nomor soal (1–{jumlah:,})", min_value=1, max_value=jumlah, value=1, step=1,
+                            key="nomor_soal_bank")
+    st.button("📂 Muat Soal Nomor Ini", on_click=isi_soal_bank, args=(kunci_input, int(nomor)),
+              help="Mengisi koefisien dengan soal bernomor tersebut dari bank soal server.")
+
+
+def tampilkan_pilihan_soal(kunci_input, nilai_awal):
+    """
+    Menampilkan pilihan tingkat dan tombol "Soal Acak" di sidebar, serta input nomor soal jika
+    SPLDV_BANK_SOAL menunjuk ke bank soal biner.
+    Harus dipanggil sebelum input koefisien dibuat, karena nilainya diisi lewat session_state.
+    Nilai awal input juga hanya diisi di sini (bukan lewat `value=` pada st.number_input), agar
+    Streamlit tidak memperingatkan widget yang nilainya diatur dua kali.
+    """
+    for kunci, nilai in zip(kunci_input, nilai_awal):
+        st.session_state.setdefault(kunci, float(nilai))
+    with st.sidebar:
+        st.subheader("Soal Latihan")
+        tingkat = st.selectbox("Tingkat kesulitan", PILIHAN_TINGKAT, index=1, key="tingkat_latihan",
+                               help="Mudah dan sedang selalu bersolusi bulat; sulit dapat bersolusi pecahan sederhana.")
+        st.button("🎲 Soal Acak", on_click=isi_soal_latihan, args=(kunci_input, tingkat),
+                  help="Mengisi koefisien dengan soal acak yang dijamin memiliki tepat satu solusi.")
+        if PATH_BANK_SOAL is not None:
+            _tampilkan_muat_soal_bank(kunci_input)
@@ -0,0 +1,504 @@
+"""
+Ekspor lembar kerja metode substitusi ke HTML, LaTeX, atau SVG untuk satu set soal.
+
+Setiap lembar berisi langkah yang sama dengan solve_spldv_substitusi_streamlit
+(langkah 1-4), lalu solusi akhir dan verifikasinya. Setiap bentuk jejak
+diterjemahkan sekali per format menjadi satu templat str.format: markdown,
+rumus, dan kode di spldv.langkah_substitusi diubah ke markup tujuan, dan untuk
+SVG tata letak barisnya sudah dihitung. Satu soal cukup diselesaikan lalu
+diisikan angkanya. Soal dibagi per potongan ke proses pekerja; proses utama
+menulis hasilnya sesuai urutan soal begitu potongan selesai, dengan jumlah
+tugas yang sedang berjalan dibatasi seperti spldv.paralel.
+
+HTML dan LaTeX ditulis sebagai satu dokumen (satu soal per halaman cetak),
+SVG sebagai satu file per soal di direktori keluaran. Keluaran ditulis ke
+path sementara dan baru menggantikan tujuan setelah semua soal selesai, dan
+soal yang tidak dapat diselesaikan (misalnya koefisien NaN/inf) mendapat
+lembar "input tidak valid" alih-alih menghentikan ekspor.
+
+Contoh:
+    python -m spldv.lembar_kerja soal.csv lembar.html --pekerja 4
+    python -m spldv.lembar_kerja soal.spldv lembar_svg --format svg
+"""
+
+import argparse
+import functools
+import html
+import math
+import os
+import re
+import shutil
+import string
+import textwrap
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from spldv.langkah_substitusi import angka_tampilan, bentuk_jejak, bentuk_solusi_akhir, nilai_templat, templat_jejak
+from spldv.substitusi import solve_spldv_substitusi, verifikasi_solusi
+
+FORMAT_LEMBAR = ("html", "latex", "svg")
+SOAL_PER_TUGAS = 200
+TUGAS_PER_PEKERJA = 2 # Jumlah tugas yang boleh mengantre per pekerja
+JUDUL = "Lembar Kerja SPLDV: Metode Substitusi"
+BENTUK_TIDAK_VALID = ("input_tidak_valid",)
+
+_JENIS_KOTAK = ("info", "success", "warning", "error")
+
+# --- Isian templat ---
+# Isian {nama:format} diganti penanda selama markup diubah, lalu dikembalikan setelah kurung kurawal di-escape
+_PENANDA = "\x00{}\x00"
+_POLA_PENANDA = re.compile("\x00(\\d+)\x00")
+_PANJANG_ISIAN = "000000" # Perkiraan panjang angka hasil isian, untuk memotong baris SVG
+
+
+def _pisahkan_isian(teks, isian):
+    bagian = []
+    for literal, nama, spesifikasi, konversi in string.Formatter().parse(teks):
+        bagian.append(literal)
+        if nama is not None:
+            isian.append("{" + nama + (f"!{konversi}" if konversi else "") + (f":{spesifikasi}" if spesifikasi else "") + "}")
+            bagian.append(_PENANDA.format(len(isian) - 1))
+    return "".join(bagian)
+
+
+def _satukan_isian(teks, isian):
+    teks = teks.replace("{", "{{").replace("}", "}}")
+    return _POLA_PENANDA.sub(lambda m: isian[int(m.group(1))], teks)
+
+
+# --- Markdown sederhana pada templat langkah ---
+_POLA_INLINE = re.compile(r"\*\*(?P<tebal>.+?)\*\*|`(?P<kode>[^`]+)`|\$(?P<rumus>[^$]+)\$")
+
+
+def _blok_markdown(teks):
+    """Memecah teks markdown menjadi blok (jenis, tingkat, isi): "judul", "garis", atau "paragraf"."""
+    blok = []
+    for paragraf in re.split(r"\n\s*\n", textwrap.dedent(teks).strip()):
+        isi = " ".join(baris.strip() for baris in paragraf.splitlines())
+        if isi == "---":
+            blok.append(("garis", 0, ""))
+        elif isi.startswith("#"):
+            tanda, _, judul = isi.partition(" ")
+            blok.append(("judul", len(tanda), judul))
+        else:
+            blok.append(("paragraf", 0, isi))
+    return blok
+
+
+def _potongan_inline(teks):
+    """Memecah teks menjadi potongan (gaya, isi) dengan gaya "teks", "tebal", "kode", atau "rumus"."""
+    hasil, posisi = [], 0
+    for m in _POLA_INLINE.finditer(teks):
+        if m.start() > posisi:
+            hasil.append(("teks", teks[posisi:m.start()]))
+        hasil.append((m.lastgroup, m.group(m.lastgroup)))
+        posisi = m.end()
+    if posisi < len(teks):
+        hasil.append(("teks", teks[posisi:]))
+    return hasil
+
+
+# --- HTML ---
+_INLINE_HTML = {"teks": "{}", "tebal": "<strong>{}</strong>", "kode": "<code>{}</code>", "rumus": "\\({}\\)"}
+
+
+def _inline_html(teks):
+    return "".join(_INLINE_HTML[gaya].format(html.escape(isi, quote=False)) for gaya, isi in _potongan_inline(teks))
+
+
+def _html_elemen(jenis, teks):
+    if jenis == "code":
+        return f"<pre><code>{html.escape(teks, quote=False)}</code></pre>"
+    if jenis in _JENIS_KOTAK:
+        return f'<div class="kotak {jenis}">{_inline_html(teks)}</div>'
+    bagian = []
+    for macam, tingkat, isi in _blok_markdown(teks):
+        if macam == "garis":
+            bagian.append("<hr>")
+        elif macam == "judul":
+            bagian.append(f"<h{tingkat}>{_inline_html(isi)}</h{tingkat}>")
+        else:
+            bagian.append(f"<p>{_inline_html(isi)}</p>")
+    return "\n".join(bagian)
+
+
+def _html_soal(elemen, nomor):
+    isi = "\n".join(_html_elemen(jenis, teks) for jenis, teks in elemen)
+    return f'<section class="soal">\n<h1>Soal {nomor}</h1>\n{isi}\n</section>\n'
+
+
+def _awal_html(judul):
+    # Rumus \( ... \) dirender MathJax saat dokumen dibuka dengan koneksi internet
+    return f"""<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(judul)}</title>
+<script defer src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-chtml.js"></script>
+<style>
+body {{ font-family: sans-serif; max-width: 46em; margin: 2em auto; line-height: 1.5; }}
+section.soal {{ break-after: page; }}
+pre {{ background: #f6f8fa; padding: .6em .8em; border-radius: 4px; }}
+.kotak {{ padding: .6em .9em; border-radius: 4px; margin: .6em 0; }}
+.info {{ background: #e8f1fb; }} .success {{ background: #e7f5ec; }}
+.warning {{ background: #fdf6e0; }} .error {{ background: #fdecec; }}
+</style>
+</head>
+<body>
+"""
+
+
+# --- LaTeX ---
+_ESKAPE_LATEX = str.maketrans({"\\": r"\textbackslash{}", "&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#",
+                               "_": r"\_", "{": r"\{", "}": r"\}", "~": r"\textasciitilde{}",
+                               "^": r"\textasciicircum{}"})
+_POLA_EMOJI = re.compile("[\U00010000-\U0010FFFF]\\s?") # pdflatex tidak dapat mencetak emoji
+_WARNA_KOTAK_LATEX = {"info": "blue", "success": "green", "warning": "orange", "error": "red"}
+_INLINE_LATEX = {"teks": "{}", "tebal": "\\textbf{{{}}}", "kode": "\\texttt{{{}}}"}
+
+
+def _inline_latex(teks):
+    return "".join(f"${isi}$" if gaya == "rumus" else _INLINE_LATEX[gaya].format(isi.translate(_ESKAPE_LATEX))
+                   for gaya, isi in _potongan_inline(_POLA_EMOJI.sub("", teks).strip()))
+
+
+def _latex_elemen(jenis, teks):
+    if jenis == "code":
+        return f"\\begin{{verbatim}}\n{teks}\n\\end{{verbatim}}"
+    if jenis in _JENIS_KOTAK:
+        return f"\\kotak{{{_WARNA_KOTAK_LATEX[jenis]}}}{{{_inline_latex(teks)}}}"
+    perintah_judul = {1: "section*", 2: "subsection*", 3: "subsubsection*"}
+    bagian = []
+    for macam, tingkat, isi in _blok_markdown(teks):
+        if macam == "garis":
+            bagian.append("\\noindent\\rule{\\linewidth}{0.4pt}")
+        elif macam == "judul":
+            bagian.append(f"\\{perintah_judul[tingkat]}{{{_inline_latex(isi)}}}")
+        else:
+            bagian.append(_inline_latex(isi))
+    return "\n\n".join(bagian)
+
+
+def _latex_soal(elemen, nomor):
+    isi = "\n\n".join(_latex_elemen(jenis, teks) for jenis, teks in elemen)
+    return f"\\section*{{Soal {nomor}}}\n\n{isi}\n\n\\clearpage\n"
+
+
+def _awal_latex(judul):
+    return f"""\\documentclass[11pt,a4paper]{{article}}
+\\usepackage[utf8]{{inputenc}}
+\\usepackage[T1]{{fontenc}}
+\\usepackage[margin=2cm]{{geometry}}
+\\usepackage{{xcolor}}
+\\setlength{{\\parindent}}{{0pt}}
+\\setlength{{\\parskip}}{{0.5em}}
+\\newcommand{{\\kotak}}[2]{{\\par\\noindent\\fcolorbox{{#1!60!black}}{{#1!8}}{{\\parbox{{\\dimexpr\\linewidth-2\\fboxsep-2\\fboxrule}}{{#2}}}}\\par}}
+\\title{{{judul.translate(_ESKAPE_LATEX)}}}
+\\date{{}}
+\\begin{{document}}
+\\maketitle
+\\thispagestyle{{empty}}
+\\clearpage
+
+"""
+
+
+# --- SVG ---
+LEBAR_SVG = 760
+_TEPI_SVG = 24
+_KARAKTER_PER_BARIS = 90 # Perkiraan untuk huruf 14px pada lebar LEBAR_SVG
+_TINGGI_BARIS = 20
+_TINGGI_BARIS_KODE = 18
+_SUBSKRIP = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+_GAYA_SVG = """<style>
+text { font-family: sans-serif; font-size: 14px; white-space: pre; fill: #262730; }
+.tebal { font-weight: bold; } .kode { font-family: monospace; } .rumus { font-family: serif; font-style: italic; }
+.judul1 { font-size: 22px; font-weight: bold; } .judul2 { font-size: 20px; font-weight: bold; }
+.judul3 { font-size: 17px; font-weight: bold; }
+.latar-kode { fill: #f6f8fa; } .info { fill: #e8f1fb; } .success { fill: #e7f5ec; }
+.warning { fill: #fdf6e0; } .error { fill: #fdecec; }
+</style>"""
+
+
+def _rumus_polos(teks):
+    """Rumus LaTeX pada templat sebagai teks biasa, karena SVG statis tidak dapat menata rumus."""
+    teks = re.sub(r"\\frac\{([^{}]*)\}\{([^{}]*)\}", r"(\1) / (\2)", teks)
+    teks = re.sub(r"_(\d)", lambda m: m.group(1).translate(_SUBSKRIP), teks)
+    return re.sub(r"\\(left|right)", "", teks).strip()
+
+
+def _bungkus(potongan, lebar):
+    """Membagi potongan inline menjadi baris berisi kira-kira paling banyak `lebar` karakter, dipotong di spasi."""
+    baris, sekarang, panjang = [], [], 0
+    for gaya, isi in potongan:
+        if gaya == "rumus":
+            isi = _rumus_polos(isi)
+        for kata in re.findall(r"\S*\s*", isi):
+            if not kata:
+                continue
+            panjang_kata = len(_POLA_PENANDA.sub(_PANJANG_ISIAN, kata))
+            if sekarang and panjang + panjang_kata - (len(kata) - len(kata.rstrip())) > lebar:
+                baris.append(sekarang)
+                sekarang, panjang = [], 0
+            if sekarang and sekarang[-1][0] == gaya:
+                sekarang[-1] = (gaya, sekarang[-1][1] + kata)
+            else:
+                sekarang.append((gaya, kata))
+            panjang += panjang_kata
+    if sekarang:
+        baris.append(sekarang)
+    return baris
+
+
+def _svg_teks(potongan, x, y, kelas=None):
+    isi = "".join(html.escape(teks, quote=False) if gaya == "teks" else
+                  f'<tspan class="{gaya}">{html.escape(teks, quote=False)}</tspan>' for gaya, teks in potongan)
+    atribut_kelas = f' class="{kelas}"' if kelas else ""
+    return f'<text x="{x}" y="{y}"{atribut_kelas}>{isi}</text>'
+
+
+def _svg_elemen(jenis, teks, y):
+    """Bagian SVG untuk satu elemen yang dimulai di ketinggian y; mengembalikan (daftar baris SVG, y berikutnya)."""
+    bagian = []
+    if jenis == "code":
+        baris = teks.splitlines()
+        tinggi = len(baris) * _TINGGI_BARIS_KODE + 12
+        bagian.append(f'<rect x="{_TEPI_SVG}" y="{y + 4}" width="{LEBAR_SVG - 2 * _TEPI_SVG}" height="{tinggi}" '
+                      f'rx="4" class="latar-kode"/>')
+        for i, isi in enumerate(baris):
+            bagian.append(_svg_teks([("kode", isi)], _TEPI_SVG + 12, y + 4 + (i + 1) * _TINGGI_BARIS_KODE))
+        return bagian, y + 4 + tinggi + 6
+    if jenis in _JENIS_KOTAK:
+        baris = _bungkus(_potongan_inline(teks), _KARAKTER_PER_BARIS - 4)
+        tinggi = len(baris) * _TINGGI_BARIS + 14
+        bagian.append(f'<rect x="{_TEPI_SVG}" y="{y + 4}" width="{LEBAR_SVG - 2 * _TEPI_SVG}" height="{tinggi}" '
+                      f'rx="4" class="{jenis}"/>')
+        for i, potongan in enumerate(baris):
+            bagian.append(_svg_teks(potongan, _TEPI_SVG + 14, y + 6 + (i + 1) * _TINGGI_BARIS))
+        return bagian, y + 4 + tinggi + 6
+    for macam, tingkat, isi in _blok_markdown(teks):
+        if macam == "garis":
+            bagian.append(f'<line x1="{_TEPI_SVG}" y1="{y + 12}" x2="{LEBAR_SVG - _TEPI_SVG}" y2="{y + 12}" '
+                          f'stroke="#d0d0d0"/>')
+            y += 22
+        elif macam == "judul":
+            y += 34 - 4 * tingkat
+            bagian.append(_svg_teks([("teks", isi)], _TEPI_SVG, y, f"judul{tingkat}"))
+            y += 8
+        else:
+            for potongan in _bungkus(_potongan_inline(isi), _KARAKTER_PER_BARIS):
+                y += _TINGGI_BARIS
+                bagian.append(_svg_teks(potongan, _TEPI_SVG, y))
+            y += 6
+    return bagian, y
+
+
+def _svg_soal(elemen, nomor):
+    bagian, y = _svg_elemen("markdown", f"# Soal {nomor}", _TEPI_SVG - 10)
+    for jenis, teks in elemen:
+        baru, y = _svg_elemen(jenis, teks, y)
+        bagian.extend(baru)
+    tinggi = y + _TEPI_SVG
+    isi = "\n".join(bagian)
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{LEBAR_SVG}" height="{tinggi}" '
+            f'viewBox="0 0 {LEBAR_SVG} {tinggi}">\n{_GAYA_SVG}\n'
+            f'<rect width="100%" height="100%" fill="white"/>\n{isi}\n</svg>\n')
+
+
+_SOAL = {"html": _html_soal, "latex": _latex_soal, "svg": _svg_soal}
+_AWAL_DOKUMEN = {"html": _awal_html, "latex": _awal_latex}
+_AKHIR_DOKUMEN = {"html": "</body>\n</html>\n", "latex": "\\end{document}\n"}
+
+
+# --- Lembar kerja ---
+def bentuk_lembar(jejak, tepat=None):
+    """Bentuk jejak ditambah solusi akhir dan hasil verifikasi jika jejak berhasil diselesaikan."""
+    bentuk = bentuk_jejak(jejak)
+    if not jejak.berhasil:
+        return bentuk
+    return bentuk + bentuk_solusi_akhir(tepat)
+
+
+@functools.cache
+def templat_lembar(bentuk, format):
+    """
+    Templat str.format satu lembar soal untuk sebuah bentuk dalam `format` (html, latex, atau svg).
+    Markup dan tata letak dihitung sekali per bentuk; isiannya sama dengan nilai_templat ditambah nomor, cek1, cek2.
+    """
+    if format not in FORMAT_LEMBAR:
+        raise ValueError(f"format harus salah satu dari {FORMAT_LEMBAR}, bukan {format!r}")
+    isian = ["{nomor}"]
+    elemen = [(jenis, _pisahkan_isian(teks, isian)) for jenis, teks in templat_jejak(bentuk)]
+    return _satukan_isian(_SOAL[format](elemen, _PENANDA.format(0)), isian)
+
+
+def _render_tidak_valid(koefisien, format, nomor):
+    nilai = dict(zip(("a1", "b1", "c1", "a2", "b2", "c2"), koefisien))
+    return templat_lembar(BENTUK_TIDAK_VALID, format).format(nomor=nomor, **nilai)
+
+
+def render_soal(koefisien, format, nomor=1):
+    """
+    Lembar kerja satu soal (a1, b1, c1, a2, b2, c2) sebagai teks dalam `format`.
+    Soal dengan koefisien NaN/inf, atau yang hitungan eksaknya meluap, mendapat lembar "input tidak valid".
+    """
+    if not all(math.isfinite(v) for v in koefisien):
+        return _render_tidak_valid(koefisien, format, nomor)
+    try:
+        jejak = solve_spldv_substitusi(*koefisien, eksak=True)
+        nilai = nilai_templat(jejak)
+        tepat = None
+        if jejak.berhasil:
+            # Verifikasi eksak seperti di aplikasi, sehingga input bulat tidak memunculkan selisih pembulatan
+            cek1, cek2, tepat = verifikasi_solusi(*koefisien, jejak.x, jejak.y, eksak=True)
+            nilai.update(cek1=angka_tampilan(cek1), cek2=angka_tampilan(cek2))
+    except OverflowError:
+        return _render_tidak_valid(koefisien, format, nomor)
+    return templat_lembar(bentuk_lembar(jejak, tepat), format).format(nomor=nomor, **nilai)
+
+
+def _render_potongan(koefisien, format, nomor_awal):
+    """Tugas pekerja: lembar kerja untuk satu potongan soal, satu teks per soal."""
+    return [render_soal(baris, format, nomor) for nomor, baris in enumerate(koefisien, nomor_awal)]
+
+
+class _PenulisLembar:
+    """
+    Menulis lembar kerja secara bertahap: ke satu dokumen HTML/LaTeX, atau satu file SVG per soal.
+    Semuanya ditulis ke path sementara di sebelah `tujuan`; tutup() memindahkannya ke `tujuan`,
+    batalkan() menghapusnya sehingga tujuan tidak pernah berisi keluaran yang terpotong.
+    """
+
+    def __init__(self, tujuan, format, judul):
+        self._format = format
+        self._file = None
+        self.jumlah = 0
+        self._tujuan = Path(tujuan)
+        self._sementara = Path(f"{os.fspath(tujuan)}.sementara")
+        if format == "svg":
+            self._direktori = self._sementara
+            self._direktori.mkdir(parents=True, exist_ok=True)
+        else:
+            self._file = open(self._sementara, "w", encoding="utf-8")
+            self._file.write(_AWAL_DOKUMEN[format](judul))
+
+    def tulis(self, lembar):
+        if self._file is not None:
+            self._file.writelines(lembar)
+            self.jumlah += len(lembar)
+            return
+        for teks in lembar:
+            self.jumlah += 1
+            (self._direktori / f"soal_{self.jumlah:06d}.svg").write_text(teks, encoding="utf-8")
+
+    def tutup(self):
+        if self._file is None:
+            self._tujuan.mkdir(parents=True, exist_ok=True)
+            for path in sorted(self._direktori.iterdir()):
+                os.replace(path, self._tujuan / path.name)
+            self._direktori.rmdir()
+            return
+        self._file.write(_AKHIR_DOKUMEN[self._format])
+        self._file.close()
+        os.replace(self._sementara, self._tujuan)
+
+    def batalkan(self):
+        if self._file is None:
+            shutil.rmtree(self._direktori, ignore_errors=True)
+            return
+        self._file.close()
+        self._sementara.unlink(missing_ok=True)
+
+
+def format_dari_nama(nama_file):
+    """Menentukan format lembar kerja ('html' atau 'latex') dari akhiran nama file keluaran."""
+    akhiran = Path(str(nama_file)).suffix.lower()
+    if akhiran in (".html", ".htm"):
+        return "html"
+    if akhiran == ".tex":
+        return "latex"
+    raise ValueError(f"Format lembar kerja tidak dikenali: {nama_file} (gunakan .html, .tex, atau --format svg)")
+
+
+def ekspor_lembar(sumber, tujuan, format_masuk, format_lembar, pekerja=None, soal_per_tugas=SOAL_PER_TUGAS,
+                  judul=JUDUL, progres=None):
+    """
+    Membuat lembar kerja untuk semua soal di file `sumber` (CSV, Parquet, atau bank soal .spldv).
+    Untuk format svg, `tujuan` adalah direktori. `pekerja` bawaan-nya jumlah inti CPU; 1 berarti tanpa pool proses.
+    `progres`, jika diberikan, dipanggil dengan (soal_selesai, detik_berlalu).
+    Mengembalikan ringkasan berisi jumlah soal, durasi, dan throughput (soal/detik).
+    """
+    from spldv.bulk import baca_potongan # pandas/pyarrow hanya untuk membaca file soal
+
+    if format_lembar not in FORMAT_LEMBAR:
+        raise ValueError(f"format harus salah satu dari {FORMAT_LEMBAR}, bukan {format_lembar!r}")
+    pekerja = pekerja or os.cpu_count() or 1
+    mulai = time.perf_counter()
+    penulis = _PenulisLembar(tujuan, format_lembar, judul)
+
+    def tulis(lembar):
+        penulis.tulis(lembar)
+        if progres is not None:
+            progres(penulis.jumlah, time.perf_counter() - mulai)
+
+    def daftar_potongan():
+        nomor = 1
+        for koefisien in baca_potongan(sumber, format_masuk, soal_per_tugas):
+            yield koefisien.tolist(), nomor
+            nomor += len(koefisien)
+
+    try:
+        if pekerja == 1:
+            for koefisien, nomor in daftar_potongan():
+                tulis(_render_potongan(koefisien, format_lembar, nomor))
+        else:
+            with ProcessPoolExecutor(max_workers=pekerja) as executor:
+                antrean = deque()
+                for koefisien, nomor in daftar_potongan():
+                    antrean.append(executor.submit(_render_potongan, koefisien, format_lembar, nomor))
+                    if len(antrean) >= pekerja * TUGAS_PER_PEKERJA:
+                        tulis(antrean.popleft().result())
+                while antrean:
+                    tulis(antrean.popleft().result())
+    except BaseException:
+        penulis.batalkan()
+        raise
+    penulis.tutup()
+
+    durasi = time.perf_counter() - mulai
+    return {
+        "soal": penulis.jumlah,
+        "detik": durasi,
+        "soal_per_detik": penulis.jumlah / durasi if durasi > 0 else float("inf"),
+    }
+
+
+def main(argv=None):
+    from spldv.bulk import format_dari_nama as format_masukan
+
+    parser = argparse.ArgumentParser(description="Membuat lembar kerja metode substitusi (HTML/LaTeX/SVG) untuk satu set soal.")
+    parser.add_argument("masukan", help="File soal dengan kolom a1,b1,c1,a2,b2,c2 (.csv, .parquet, atau .spldv)")
+    parser.add_argument("keluaran", help="Dokumen .html atau .tex, atau direktori untuk --format svg")
+    parser.add_argument("--format", choices=FORMAT_LEMBAR, help="Bawaan: ditentukan dari akhiran keluaran")
+    parser.add_argument("-j", "--pekerja", type=int, default=os.cpu_count(),
+                        help="Jumlah proses pekerja (bawaan: jumlah inti CPU); 1 berarti tanpa pool proses")
+    parser.add_argument("--soal-per-tugas", type=int, default=SOAL_PER_TUGAS,
+                        help=f"Jumlah soal per tugas pekerja (bawaan {SOAL_PER_TUGAS})")
+    parser.add_argument("--judul", default=JUDUL, help="Judul dokumen HTML/LaTeX")
+    args = parser.parse_args(argv)
+
+    def cetak_progres(soal, detik):
+        print(f"\r{soal:,} soal | {soal / detik if detik > 0 else 0:,.0f} soal/detik", end="", flush=True)
+
+    ringkasan = ekspor_lembar(args.masukan, args.keluaran, format_masukan(args.masukan),
+                              args.format or format_dari_nama(args.keluaran), args.pekerja,
+                              args.soal_per_tugas, args.judul, progres=cetak_progres)
+    print()
+    print(f"Selesai: {ringkasan['soal']:,} lembar kerja dalam {ringkasan['detik']:.2f} detik "
+          f"({ringkasan['soal_per_detik']:,.0f} soal/detik), disimpan ke {args.keluaran}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Instrumentasi ringan: durasi per bagian dan penghitung, dipakai bersama oleh semua sesi dalam satu proses.
+
+Setiap bagian menyimpan jendela bergulir berisi durasi terakhir, sehingga
+p50/p95 mencerminkan beban saat ini. Jika variabel lingkungan SPLDV_METRIK_FILE
+diisi, ringkasan ditulis ke file JSON tersebut paling sering setiap
+INTERVAL_TULIS detik (ditulis ke file sementara lalu diganti, sehingga
+pembaca tidak pernah melihat file setengah jadi).
+
+Contoh:
+    with ukur_bagian("kalkulatorspldv/plot"):
+        ...
+    tambah_hitungan("rerun/kalkulatorspldv")
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+UKURAN_JENDELA = 500 # Jumlah durasi terakhir per bagian untuk p50/p95
+INTERVAL_TULIS = 5.0 # Detik minimum antar penulisan file metrik
+
+
+def persentil(nilai_terurut, p):
+    """Persentil `p` (0-100) dengan interpolasi linear dari daftar yang sudah diurutkan."""
+    if not nilai_terurut:
+        return None
+    posisi = (len(nilai_terurut) - 1) * p / 100
+    bawah = int(posisi)
+    atas = min(bawah + 1, len(nilai_terurut) - 1)
+    return nilai_terurut[bawah] + (nilai_terurut[atas] - nilai_terurut[bawah]) * (posisi - bawah)
+
+
+class PencatatMetrik:
+    """Menyimpan durasi per bagian dalam jendela bergulir dan penghitung bebas; aman dipakai banyak thread."""
+
+    def __init__(self, ukuran_jendela=UKURAN_JENDELA, path=None, interval_tulis=INTERVAL_TULIS):
+        self.ukuran_jendela = ukuran_jendela
+        self.path = path
+        self.interval_tulis = interval_tulis
+        self._durasi = {}
+        self._jumlah_durasi = {}
+        self._hitungan = {}
+        self._sumber = {}
+        self._lock = threading.Lock()
+        self._terakhir_tulis = 0.0
+
+    def catat(self, nama, detik):
+        with self._lock:
+            jendela = self._durasi.get(nama)
+            if jendela is None:
+                jendela = self._durasi[nama] = deque(maxlen=self.ukuran_jendela)
+            jendela.append(detik)
+            self._jumlah_durasi[nama] = self._jumlah_durasi.get(nama, 0) + 1
+        self._tulis_berkala()
+
+    def tambah(self, nama, jumlah=1):
+        with self._lock:
+            self._hitungan[nama] = self._hitungan.get(nama, 0) + jumlah
+
+    @contextmanager
+    def ukur(self, nama):
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.catat(nama, time.perf_counter() - mulai)
+
+    def daftarkan_sumber(self, nama, fungsi):
+        """Menambahkan statistik dari luar (misalnya fungsi statistik cache) ke dalam ringkasan."""
+        self._sumber[nama] = fungsi
+
+    def ringkasan(self):
+        """Dict berisi p50/p95/terakhir (milidetik) per bagian, penghitung, dan statistik sumber terdaftar."""
+        with self._lock:
+            salinan = {nama: list(jendela) for nama, jendela in self._durasi.items()}
+            jumlah = dict(self._jumlah_durasi)
+            hitungan = dict(self._hitungan)
+        bagian = {}
+        for nama, nilai in sorted(salinan.items()):
+            terurut = sorted(nilai)
+            bagian[nama] = {
+                "jumlah": jumlah[nama],
+                "p50_ms": persentil(terurut, 50) * 1000,
+                "p95_ms": persentil(terurut, 95) * 1000,
+                "terakhir_ms": nilai[-1] * 1000,
+            }
+        return {
+            "waktu": time.time(),
+            "pid": os.getpid(),
+            "bagian": bagian,
+            "hitungan": dict(sorted(hitungan.items())),
+            "sumber": {nama: fungsi() for nama, fungsi in sorted(self._sumber.items())},
+        }
+
+    def tulis(self, path=None):
+        """Menulis ringkasan ke file JSON secara atomik."""
+        path = path or self.path
+        if path is None:
+            raise ValueError("Path file metrik belum diatur (SPLDV_METRIK_FILE)")
+        sementara = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(sementara, "w") as f:
+            json.dump(self.ringkasan(), f, indent=2)
+        os.replace(sementara, path)
+
+    def _tulis_berkala(self):
+        if self.path is None:
+            return
+        sekarang = time.monotonic()
+        with self._lock:
+            if sekarang - self._terakhir_tulis < self.interval_tulis:
+                return
+            self._terakhir_tulis = sekarang
+        try:
+            self.tulis()
+        except OSError:
+            pass # Metrik tidak boleh menggagalkan halaman
+
+    def reset(self):
+        with self._lock:
+            self._durasi.clear()
+            self._jumlah_durasi.clear()
+            self._hitungan.clear()
+
+
+_pencatat = PencatatMetrik(path=os.environ.get("SPLDV_METRIK_FILE") or None)
+
+
+def ukur_bagian(nama):
+    """Context manager yang mencatat lama eksekusi blok di dalamnya sebagai bagian `nama`."""
+    return _pencatat.ukur(nama)
+
+
+def catat_bagian(nama, detik):
+    _pencatat.catat(nama, detik)
+
+
+def tambah_hitungan(nama, jumlah=1):
+    _pencatat.tambah(nama, jumlah)
+
+
+def daftarkan_sumber(nama, fungsi):
+    _pencatat.daftarkan_sumber(nama, fungsi)
+
+
+def ringkasan_metrik():
+    return _pencatat.ringkasan()
+
+
+def tulis_metrik(path=None):
+    _pencatat.tulis(path)
@@ -0,0 +1,34 @@
+import streamlit as st
+
+from spldv.metrik import ringkasan_metrik
+
+PARAMETER_DEBUG = "debug" # Panel ditampilkan jika URL berisi ?debug=1
+
+
+def panel_debug_aktif():
+    return st.query_params.get(PARAMETER_DEBUG) == "1"
+
+
+def tampilkan_panel_debug():
+    """
+    Menampilkan ringkasan metrik proses (p50/p95 per bagian, penghitung, statistik cache) dan jumlah
+    rerun parsial sesi ini di sidebar.
+    Hanya muncul jika halaman dibuka dengan ?debug=1, sehingga siswa tidak melihatnya.
+    """
+    if not panel_debug_aktif():
+        return
+    ringkasan = ringkasan_metrik()
+    with st.sidebar.expander("🛠️ Panel Debug (metrik proses)", expanded=True):
+        baris = ["| Bagian | n | p50 (ms) | p95 (ms) | terakhir (ms) |", "|---|---:|---:|---:|---:|"]
+        for nama, nilai in ringkasan["bagian"].items():
+            baris.append(f"| `{nama}` | {nilai['jumlah']} | {nilai['p50_ms']:.1f} | {nilai['p95_ms']:.1f} "
+                         f"| {nilai['terakhir_ms']:.1f} |")
+        st.markdown("\n".join(baris))
+        st.markdown("**Penghitung**")
+        st.json(ringkasan["hitungan"], expanded=False)
+        for nama, statistik in ringkasan["sumber"].items():
+            st.markdown(f"**{nama}**")
+            st.json(statistik, expanded=False)
+        if st.session_state.get("jumlah_rerun_parsial"):
+            st.markdown(f"**Rerun parsial sesi ini:** {st.session_state['jumlah_rerun_parsial']} kali, sekitar "
+                        f"{st.session_state.get('total_dilewati', 0.0):.2f} detik pekerjaan bagian lain dilewati")
@@ -0,0 +1,173 @@
+"""
+Pemeriksaan bank soal SPLDV dengan banyak proses sekaligus.
+
+File CSV dibagi menjadi rentang byte yang berakhir di batas baris; setiap
+proses pekerja mem-parse rentangnya sendiri, menyelesaikannya dengan
+hitung_solusi_spldv_batch, dan mengembalikan hasil yang sudah dikodekan.
+Bank soal biner (.spldv) dibuka lewat memmap oleh setiap pekerja, yang hanya
+menerima rentang barisnya, sehingga semua proses berbagi halaman file yang sama.
+File Parquet dibaca per batch oleh proses utama lalu dibagikan ke pekerja.
+Proses utama menulis hasil sesuai urutan masukan dengan jumlah tugas yang
+sedang berjalan dibatasi, sehingga memori tetap terbatas.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from spldv.bulk import KOLOM_KOEFISIEN, UKURAN_POTONGAN, baca_potongan, jumlah_baris, selesaikan_potongan
+from spldv.status import NAMA_STATUS
+
+TUGAS_PER_PEKERJA = 2 # Jumlah tugas yang boleh mengantre per pekerja
+_CONTOH_BYTE = 64 * 1024 # Ukuran sampel untuk memperkirakan panjang rata-rata baris CSV
+
+
+def _kemas_hasil(koefisien, format_keluar):
+    """Menyelesaikan satu potongan dan mengemas hasilnya: bytes CSV tanpa header, atau tabel Arrow."""
+    hasil, status = selesaikan_potongan(koefisien)
+    tabel = pa.Table.from_pandas(hasil, preserve_index=False)
+    per_status = np.bincount(status, minlength=len(NAMA_STATUS))
+    if format_keluar == "csv":
+        sink = pa.BufferOutputStream()
+        pa_csv.write_csv(tabel, sink, write_options=pa_csv.WriteOptions(include_header=False))
+        return sink.getvalue().to_pybytes(), len(hasil), per_status
+    return tabel, len(hasil), per_status
+
+
+def _kerjakan_rentang_csv(path, awal, akhir, nama_kolom, format_keluar):
+    """Tugas pekerja: mem-parse rentang byte [awal, akhir) dari file CSV lalu menyelesaikannya."""
+    with open(path, "rb") as f:
+        f.seek(awal)
+        data = f.read(akhir - awal)
+    tabel = pa_csv.read_csv(
+        pa.py_buffer(data),
+        read_options=pa_csv.ReadOptions(column_names=nama_kolom),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=KOLOM_KOEFISIEN,
+            column_types={nama: pa.float64() for nama in KOLOM_KOEFISIEN},
+        ),
+    )
+    koefisien = np.column_stack([tabel.column(nama).to_numpy() for nama in KOLOM_KOEFISIEN])
+    return _kemas_hasil(koefisien, format_keluar)
+
+
+def _kerjakan_rentang_bank(path, awal, akhir, format_keluar):
+    """Tugas pekerja: membaca baris [awal, akhir) bank soal langsung dari memmap lalu menyelesaikannya."""
+    from spldv.bank_biner import BankSoal
+
+    koefisien = BankSoal(path).koefisien[awal:akhir]
+    return _kemas_hasil(np.asarray(koefisien, dtype=float), format_keluar)
+
+
+def rentang_csv(path, ukuran_potongan=UKURAN_POTONGAN):
+    """
+    Membagi file CSV menjadi rentang byte berisi kira-kira `ukuran_potongan` baris.
+    Mengembalikan (nama_kolom, generator (awal, akhir)); setiap rentang berakhir tepat setelah baris baru.
+    """
+    ukuran_file = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        awal_data = f.tell()
+        contoh = f.read(_CONTOH_BYTE)
+    nama_kolom = [nama.strip().strip('"') for nama in header.decode("utf-8-sig").strip().split(",")]
+    panjang_baris = max(len(contoh) / max(contoh.count(b"\n"), 1), 1)
+    ukuran_byte = max(int(panjang_baris * ukuran_potongan), 1)
+
+    def generator():
+        with open(path, "rb") as f:
+            awal = awal_data
+            while awal < ukuran_file:
+                f.seek(min(awal + ukuran_byte, ukuran_file))
+                f.readline() # Maju sampai akhir baris yang sedang terpotong
+                akhir = min(f.tell(), ukuran_file)
+                yield awal, akhir
+                awal = akhir
+
+    return nama_kolom, generator()
+
+
+def _header_csv():
+    """Header CSV dengan gaya kutip yang sama seperti baris hasil dari pyarrow."""
+    sink = pa.BufferOutputStream()
+    kolom = KOLOM_KOEFISIEN + ["x", "y"]
+    skema = pa.schema([(nama, pa.float64()) for nama in kolom] + [("status", pa.string())])
+    pa_csv.write_csv(skema.empty_table(), sink)
+    return sink.getvalue().to_pybytes()
+
+
+def proses_paralel(sumber, tujuan, format_masuk, format_keluar="csv", ukuran_potongan=UKURAN_POTONGAN,
+                   pekerja=None, progres=None):
+    """
+    Versi multi-proses dari proses_bulk dengan ringkasan yang sama.
+    `sumber` dan `tujuan` berupa path. `pekerja` bawaan-nya jumlah inti CPU.
+    Hasil ditulis sesuai urutan baris masukan.
+    """
+    if format_keluar not in ("csv", "parquet"):
+        raise ValueError(f"Format keluaran tidak didukung: {format_keluar} (gunakan .csv atau .parquet)")
+    pekerja = pekerja or os.cpu_count() or 1
+    per_status = np.zeros(len(NAMA_STATUS), dtype=np.int64)
+    baris_selesai = 0
+    mulai = time.perf_counter()
+
+    writer = None
+    keluaran = None
+    if format_keluar == "csv":
+        keluaran = open(tujuan, "wb")
+        keluaran.write(_header_csv())
+
+    def tulis(hasil):
+        nonlocal writer, baris_selesai, per_status
+        data, jumlah, status = hasil
+        if format_keluar == "parquet":
+            if writer is None:
+                import pyarrow.parquet as pq
+
+                writer = pq.ParquetWriter(tujuan, data.schema)
+            writer.write_table(data)
+        else:
+            keluaran.write(data)
+        per_status += status
+        baris_selesai += jumlah
+        if progres is not None:
+            progres(baris_selesai, time.perf_counter() - mulai)
+
+    try:
+        with ProcessPoolExecutor(max_workers=pekerja) as executor:
+            if format_masuk == "csv":
+                nama_kolom, rentang = rentang_csv(sumber, ukuran_potongan)
+                tugas = (executor.submit(_kerjakan_rentang_csv, sumber, awal, akhir, nama_kolom, format_keluar)
+                         for awal, akhir in rentang)
+            elif format_masuk == "bank":
+                total = jumlah_baris(sumber, format_masuk)
+                tugas = (executor.submit(_kerjakan_rentang_bank, sumber, awal, min(awal + ukuran_potongan, total),
+                                         format_keluar)
+                         for awal in range(0, total, ukuran_potongan))
+            else:
+                tugas = (executor.submit(_kemas_hasil, koefisien, format_keluar)
+                         for koefisien in baca_potongan(sumber, format_masuk, ukuran_potongan))
+
+            antrean = deque()
+            for future in tugas:
+                antrean.append(future)
+                if len(antrean) >= pekerja * TUGAS_PER_PEKERJA:
+                    tulis(antrean.popleft().result())
+            while antrean:
+                tulis(antrean.popleft().result())
+    finally:
+        if writer is not None:
+            writer.close()
+        if keluaran is not None:
+            keluaran.close()
+
+    durasi = time.perf_counter() - mulai
+    return {
+        "baris": baris_selesai,
+        "detik": durasi,
+        "baris_per_detik": baris_selesai / durasi if durasi > 0 else float("inf"),
+        "per_status": {NAMA_STATUS[kode]: int(jumlah) for kode, jumlah in enumerate(per_status)},
+    }
@@ -0,0 +1,250 @@
+import functools
+import io
+import sys
+import weakref
+
+import numpy as np
+
+from spldv.cache import LRUCache
+from spldv.metrik import daftarkan_sumber, tambah_hitungan, ukur_bagian
+
+KAPASITAS_CACHE_PLOT = 128 # Jumlah gambar plot yang disimpan bersama oleh semua sesi
+OPSI_SAVEFIG = {"bbox_inches": "tight", "dpi": 200} # Sama dengan bawaan st.pyplot
+
+_cache_plot = LRUCache(KAPASITAS_CACHE_PLOT)
+
+
+@functools.cache
+def _kelas_matplotlib():
+    """
+    Mengimpor matplotlib saat plot pertama benar-benar digambar, bukan saat modul ini diimpor.
+    Backend non-interaktif Agg dipilih secara eksplisit (kecuali pyplot sudah dimuat oleh pemanggil).
+    """
+    import matplotlib
+
+    if "matplotlib.pyplot" not in sys.modules:
+        matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    return Figure, FigureCanvasAgg
+
+
+def klip_garis(persamaan, x_min, x_max):
+    """
+    Memotong garis ax + by = c secara analitik pada rentang [x_min, x_max].
+    Mengembalikan dua titik ujung ((x0, x1), (y0, y1)), atau None untuk garis vertikal (b = 0).
+    Garis horizontal (a = 0) menghasilkan y0 == y1.
+    """
+    a, b, c = persamaan
+    if b == 0:
+        return None
+    return (x_min, x_max), ((c - a * x_min) / b, (c - a * x_max) / b)
+
+
+def hitung_batas_y(nilai_y):
+    """
+    Menghitung batas sumbu Y (min, maks) yang memuat semua nilai hingga di `nilai_y` (array berbentuk apa pun)
+    dengan sedikit ruang, minimal setinggi 5 satuan. Dipakai juga oleh grafik eksplorasi dan sapuan.
+    Untuk plot garis cukup memakai titik ujung, karena garis lurus mencapai nilai ekstremnya di ujung rentang.
+    """
+    nilai_y = np.asarray(nilai_y, dtype=float)
+    nilai_y = nilai_y[np.isfinite(nilai_y)]
+    if nilai_y.size == 0: # Default range if no valid Y values (e.g., both vertical)
+        return -5, 5
+
+    min_y = float(nilai_y.min()) - 1.5
+    max_y = float(nilai_y.max()) + 1.5
+    # Prevent very narrow or inverted Y limits
+    if max_y - min_y < 5:
+        mid_y = (min_y + max_y) / 2
+        min_y = mid_y - 2.5
+        max_y = mid_y + 2.5
+    return min_y, max_y
+
+
+class PenggambarGaris:
+    """
+    Figure dan axes plot_garis yang dibuat sekali lalu dipakai ulang.
+
+    Setiap pemanggilan `perbarui` hanya mengganti data garis, posisi titik,
+    label, legenda, dan batas sumbu pada artist yang sudah ada, sehingga rerun
+    tidak lagi membuat figure baru. Figure dibuat lewat matplotlib.figure.Figure
+    (bukan pyplot), jadi tidak terdaftar di state global pyplot. Figure dilepas
+    oleh `tutup`, atau otomatis saat objek ini dibuang (misalnya sesi Streamlit
+    yang menyimpannya berakhir) dan paling lambat saat proses berakhir.
+    """
+
+    def __init__(self, figsize=(10, 7)): # Ukuran plot lebih besar
+        self.figsize = figsize
+        self.fig = self.ax = None # Dibuat saat perbarui pertama, sehingga matplotlib baru dimuat saat dibutuhkan
+        self.jumlah_gambar = 0
+
+    def _siapkan(self):
+        """Membuat figure, axes, dan semua artist yang akan diperbarui di tempat."""
+        Figure, FigureCanvasAgg = _kelas_matplotlib()
+        tambah_hitungan("plot/figure_dibuat")
+        self.fig = Figure(figsize=self.figsize, layout="tight") # Layout dihitung ulang saat figure digambar
+        FigureCanvasAgg(self.fig)
+        self._pelepas = weakref.finalize(self, _lepas_figure, self.fig) # Juga dijalankan saat interpreter berakhir
+        self.ax = ax = self.fig.subplots()
+
+        # Satu garis biasa dan satu garis vertikal per persamaan; yang tidak terpakai disembunyikan
+        self._garis = [ax.plot([], [], linewidth=2)[0] for _ in range(2)]
+        self._vertikal = [ax.axvline(0, linestyle='--', linewidth=2, visible=False) for _ in range(2)]
+        self._titik = ax.scatter([], [], s=150, zorder=5, edgecolor='black', linewidth=1.5)
+
+        ax.set_xlabel("Nilai X", fontsize=12)
+        ax.set_ylabel("Nilai Y", fontsize=12)
+        ax.set_title("Grafik Persamaan Linear", fontsize=14, fontweight='bold')
+        ax.axhline(0, color='grey', linewidth=0.7, linestyle=':')
+        ax.axvline(0, color='grey', linewidth=0.7, linestyle=':')
+        ax.grid(True, linestyle='--', alpha=0.6)
+
+    def _perbarui_persamaan(self, indeks, persamaan, x_min, x_max, warna):
+        """Memperbarui artist satu persamaan; mengembalikan (handle legenda atau None, ujung y)."""
+        a, b, c = persamaan
+        garis, vertikal = self._garis[indeks], self._vertikal[indeks]
+        ujung = klip_garis(persamaan, x_min, x_max)
+        garis.set_visible(ujung is not None)
+        vertikal.set_visible(ujung is None and a != 0)
+
+        if ujung is not None:
+            garis.set_data(*ujung)
+            garis.set_color(warna)
+            garis.set_label(f'{a:.0f}x + {b:.0f}y = {c:.0f} (Garis {indeks + 1})')
+            return garis, list(ujung[1])
+        if a != 0: # Garis vertikal
+            vertikal.set_xdata([c/a, c/a])
+            vertikal.set_color(warna)
+            vertikal.set_label(f'x = {c/a:.0f} (Garis {indeks + 1})')
+            return vertikal, []
+        return None, []
+
+    def perbarui(self, persamaan1, persamaan2, x_range, color1, color2, point_x=None, point_y=None,
+                 show_exact_point=False):
+        """
+        Menggambar ulang dua garis dan titik penanda pada figure yang sama, lalu mengembalikan figure tersebut.
+        Setiap garis digambar dari dua titik ujung hasil klip_garis, bukan dari sampel x_range.
+        """
+        if self.fig is None:
+            self._siapkan()
+        x_min, x_max = float(np.min(x_range)), float(np.max(x_range))
+        handle1, ujung_y1 = self._perbarui_persamaan(0, persamaan1, x_min, x_max, color1)
+        handle2, ujung_y2 = self._perbarui_persamaan(1, persamaan2, x_min, x_max, color2)
+        handles = [h for h in (handle1, handle2) if h is not None]
+
+        # Titik coba atau titik solusi yang ditemukan
+        point_x, point_y = _normalisasi_titik(point_x, point_y)
+        self._titik.set_visible(point_x is not None)
+        if point_x is not None:
+            self._titik.set_offsets([[point_x, point_y]])
+            self._titik.set_facecolor('purple' if not show_exact_point else 'green')
+            self._titik.set_label(f'Titik Coba ({point_x:.0f}, {point_y:.0f})' if not show_exact_point
+                                  else f'Solusi Akurat ({point_x:.0f}, {point_y:.0f})')
+            handles.append(self._titik)
+
+        legenda = self.ax.get_legend()
+        if legenda is not None:
+            legenda.remove()
+        if handles:
+            self.ax.legend(handles=handles, fontsize=10)
+        self.ax.set_xlim(x_min, x_max)
+        self.ax.set_ylim(*hitung_batas_y(ujung_y1 + ujung_y2))
+
+        self.jumlah_gambar += 1
+        return self.fig
+
+    def render(self, persamaan1, persamaan2, x_range, color1, color2, point_x=None, point_y=None,
+               show_exact_point=False, format="png"):
+        """Memperbarui figure lalu merendernya menjadi bytes (PNG atau SVG)."""
+        with ukur_bagian("plot/perbarui"):
+            self.perbarui(persamaan1, persamaan2, x_range, color1, color2, point_x, point_y, show_exact_point)
+        buffer = io.BytesIO()
+        with ukur_bagian(f"plot/render_{format}"):
+            self.fig.savefig(buffer, format=format, **OPSI_SAVEFIG)
+        return buffer.getvalue()
+
+    def tutup(self):
+        """Melepas figure beserta semua artist-nya; pemakaian berikutnya akan membuat figure baru."""
+        if self.fig is not None:
+            self._pelepas()
+        self.fig = self.ax = None
+        self._garis = self._vertikal = self._titik = None
+
+
+def _lepas_figure(fig):
+    tambah_hitungan("plot/figure_dilepas")
+    fig.clear()
+
+
+def plot_garis(persamaan1, persamaan2, x_range, color1, color2, point_x=None, point_y=None, show_exact_point=False):
+    """
+    Membuat plot dua garis dan menandai titik potong jika ada.
+    Figure dibuat baru setiap pemanggilan; untuk rerun berulang gunakan PenggambarGaris.
+    """
+    return PenggambarGaris().perbarui(persamaan1, persamaan2, x_range, color1, color2,
+                                      point_x=point_x, point_y=point_y, show_exact_point=show_exact_point)
+
+
+def _normalisasi_titik(point_x, point_y):
+    """Titik penanda hanya digambar jika kedua koordinatnya hingga; selain itu dianggap tidak ada."""
+    if point_x is None or point_y is None or not np.isfinite(point_x) or not np.isfinite(point_y):
+        return None, None
+    return float(point_x), float(point_y)
+
+
+def kunci_plot_garis(persamaan1, persamaan2, x_range, color1, color2, point_x=None, point_y=None,
+                     show_exact_point=False, format="png"):
+    """
+    Membentuk kunci cache yang dinormalisasi untuk satu gambar plot_garis.
+    x_range diasumsikan berjarak sama (hasil np.linspace), sehingga cukup diwakili oleh (min, max, jumlah titik).
+    """
+    x_range = np.asarray(x_range)
+    return (
+        tuple(float(v) for v in persamaan1),
+        tuple(float(v) for v in persamaan2),
+        (float(x_range.min()), float(x_range.max()), int(x_range.size)),
+        (color1.lower(), color2.lower()),
+        _normalisasi_titik(point_x, point_y),
+        bool(show_exact_point),
+        format,
+    )
+
+
+def render_plot_garis(persamaan1, persamaan2, x_range, color1, color2, point_x=None, point_y=None,
+                      show_exact_point=False, format="png", penggambar=None):
+    """
+    Mengembalikan gambar plot_garis dalam bentuk bytes (PNG atau SVG).
+    Hasil render disimpan di cache LRU yang dipakai bersama lintas sesi, sehingga
+    input yang sama tidak perlu digambar dan dirasterisasi ulang. Saat cache
+    meleset, gambar dibuat dengan `penggambar` (PenggambarGaris milik sesi) jika
+    diberikan, atau dengan PenggambarGaris sementara.
+    """
+    kunci = kunci_plot_garis(persamaan1, persamaan2, x_range, color1, color2, point_x, point_y,
+                             show_exact_point, format)
+    gambar = _cache_plot.get(kunci)
+    if gambar is not None:
+        return gambar
+
+    if penggambar is not None:
+        gambar = penggambar.render(persamaan1, persamaan2, x_range, color1, color2,
+                                   point_x, point_y, show_exact_point, format)
+    else:
+        # Hanya bytes hasil render yang disimpan di cache; figure sementara langsung dilepas
+        sementara = PenggambarGaris()
+        try:
+            gambar = sementara.render(persamaan1, persamaan2, x_range, color1, color2,
+                                      point_x, point_y, show_exact_point, format)
+        finally:
+            sementara.tutup()
+    _cache_plot.put(kunci, gambar)
+    return gambar
+
+
+def statistik_cache_plot():
+    """Mengembalikan statistik cache gambar plot (ukuran, hits, misses, evictions, hit_rate)."""
+    return _cache_plot.statistik()
+
+
+daftarkan_sumber("cache_plot", statistik_cache_plot)
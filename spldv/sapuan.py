@@ -0,0 +1,186 @@
+"""
+Sapuan parameter: satu koefisien diubah bertahap dan lintasan titik potongnya ditampilkan.
+
+Semua langkah diselesaikan sekaligus dengan satu panggilan
+hitung_solusi_spldv_batch. Grafik Altair berisi seluruh langkah dan slider
+parameternya berjalan di browser, sehingga menggeser slider tidak memicu rerun.
+Spesifikasi grafik yang sudah jadi disimpan di cache bersama, jadi sapuan yang
+sama untuk sesi lain tidak dihitung maupun diserialisasi ulang.
+"""
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from spldv.cache import LRUCache
+from spldv.metrik import daftarkan_sumber
+from spldv.plotting import hitung_batas_y, klip_garis
+from spldv.solver import hitung_solusi_spldv_batch
+from spldv.status import NAMA_STATUS, STATUS_BERHIMPIT, STATUS_PARALEL, STATUS_UNIK
+
+NAMA_KOEFISIEN = ("a1", "b1", "c1", "a2", "b2", "c2")
+BATAS_X = (-10.0, 10.0) # Sama dengan rentang X plot_garis
+BATAS_Y_LINTASAN = 100.0 # Titik potong yang lebih jauh tidak ikut menentukan skala sumbu Y
+JUMLAH_LANGKAH_MAKS = 2001
+KAPASITAS_CACHE_SAPUAN = 64
+
+_NAMA_STATUS = np.array([NAMA_STATUS[kode] for kode in sorted(NAMA_STATUS)])
+_KETERANGAN_STATUS = {
+    STATUS_PARALEL: "garis sejajar, tidak ada solusi",
+    STATUS_BERHIMPIT: "garis berhimpit, tak terhingga solusi",
+}
+_WARNA_STATUS = {"unik": "#9C27B0", "paralel": "#E53935", "berhimpit": "#1E88E5", "tidak valid": "#9E9E9E"}
+
+_cache_sapuan = LRUCache(KAPASITAS_CACHE_SAPUAN)
+
+
+def nilai_sapuan(awal, akhir, langkah):
+    """Nilai parameter dari `awal` sampai `akhir` (inklusif) dengan jarak `langkah`, dibulatkan agar desimalnya tepat."""
+    if langkah <= 0:
+        raise ValueError("Langkah sapuan harus lebih besar dari nol")
+    if akhir < awal:
+        raise ValueError("Nilai akhir sapuan tidak boleh lebih kecil dari nilai awal")
+    jumlah = int(round((akhir - awal) / langkah)) + 1
+    if jumlah > JUMLAH_LANGKAH_MAKS:
+        raise ValueError(f"Sapuan paling banyak {JUMLAH_LANGKAH_MAKS} langkah; perbesar langkahnya")
+    return np.round(awal + np.arange(jumlah) * langkah, 9)
+
+
+def hitung_lintasan(persamaan1, persamaan2, parameter, nilai):
+    """
+    Menyelesaikan sistem untuk setiap nilai `parameter` (salah satu NAMA_KOEFISIEN) sekaligus.
+    Mengembalikan (array sistem (N, 2, 3), array x, array y, array kode status).
+    """
+    sistem = np.empty((len(nilai), 2, 3))
+    sistem[:] = (persamaan1, persamaan2)
+    indeks = NAMA_KOEFISIEN.index(parameter)
+    sistem[:, indeks // 3, indeks % 3] = nilai
+    x, y, status = hitung_solusi_spldv_batch(sistem)
+    return sistem, x, y, status
+
+
+def _ruas_garis(persamaan, batas_y):
+    """
+    Dua titik ujung (x0, y0, x1, y1) setiap garis ax + by = c, dipotong pada BATAS_X dengan klip_garis
+    seperti pada plot statis; garis vertikal direntangkan sepanjang batas_y.
+    """
+    ujung = np.empty((len(persamaan), 4))
+    for i, (a, b, c) in enumerate(persamaan.tolist()):
+        ruas = klip_garis((a, b, c), *BATAS_X)
+        if ruas is None:
+            x_tegak = c / a if a != 0 else np.nan
+            ujung[i] = (x_tegak, batas_y[0], x_tegak, batas_y[1])
+        else:
+            (x0, x1), (y0, y1) = ruas
+            ujung[i] = (x0, y0, x1, y1)
+    return tuple(ujung.T)
+
+
+def _label(persamaan, nama):
+    a, b, c = persamaan
+    return f"{a:g}x + {b:g}y = {c:g} ({nama})"
+
+
+def chart_sapuan(persamaan1, persamaan2, parameter, nilai, color1, color2):
+    """
+    Grafik Altair sapuan parameter: garis yang tetap, garis yang berubah, jejak semua titik potong,
+    titik potong pada langkah terpilih, dan pita status di bawahnya yang menandai langkah sejajar/berhimpit.
+    Slider dimulai dari langkah yang paling dekat dengan nilai koefisien saat ini.
+    """
+    sistem, x, y, status = hitung_lintasan(persamaan1, persamaan2, parameter, nilai)
+    indeks = NAMA_KOEFISIEN.index(parameter)
+    bergerak = indeks // 3 # 0 jika yang diubah Persamaan 1, 1 jika Persamaan 2
+    nilai_mulai = float(nilai[np.abs(nilai - (persamaan1, persamaan2)[bergerak][indeks % 3]).argmin()])
+    tetap = (persamaan1, persamaan2)[1 - bergerak]
+    nama_bergerak = f"Garis {bergerak + 1}, {parameter} berubah"
+    label_tetap = _label(tetap, f"Garis {2 - bergerak}")
+    warna_tetap, warna_bergerak = (color2, color1) if bergerak == 0 else (color1, color2)
+
+    unik = status == STATUS_UNIK
+    ruas_tetap = _ruas_garis(np.array([tetap], dtype=float), BATAS_X)
+    terlihat = unik & (np.abs(x) <= BATAS_X[1])
+    batas_y = hitung_batas_y(np.concatenate([np.clip(y[terlihat], -BATAS_Y_LINTASAN, BATAS_Y_LINTASAN),
+                                             ruas_tetap[1], ruas_tetap[3]]))
+
+    langkah = float(nilai[1] - nilai[0]) if len(nilai) > 1 else 1.0
+    info = [
+        f"{parameter} = {n:g}  →  titik potong ({px:.2f}, {py:.2f})" if kode == STATUS_UNIK
+        else f"{parameter} = {n:g}  →  {_KETERANGAN_STATUS.get(kode, 'persamaan tidak valid')}"
+        for n, px, py, kode in zip(nilai.tolist(), x.tolist(), y.tolist(), status.tolist())
+    ]
+    lintasan = pd.DataFrame({"nilai": nilai, "x": x, "y": y, "status": _NAMA_STATUS[status], "info": info})
+
+    x0, y0, x1, y1 = _ruas_garis(sistem[:, bergerak], (batas_y[0] - 1000, batas_y[1] + 1000))
+    garis_bergerak = pd.DataFrame({
+        "nilai": np.repeat(nilai, 2),
+        "x": np.column_stack([x0, x1]).ravel(),
+        "y": np.column_stack([y0, y1]).ravel(),
+        "label": nama_bergerak,
+    })
+    garis_tetap = pd.DataFrame({"x": [ruas_tetap[0][0], ruas_tetap[2][0]], "y": [ruas_tetap[1][0], ruas_tetap[3][0]],
+                                "label": label_tetap})
+
+    nilai_param = alt.param(
+        name="nilai_sapuan",
+        value=nilai_mulai,
+        bind=alt.binding_range(min=float(nilai[0]), max=float(nilai[-1]), step=langkah, name=f"➡️ Nilai {parameter}: "),
+    )
+    pada_langkah = f"abs(datum.nilai - nilai_sapuan) < {langkah / 2}"
+    sumbu_x = alt.X("x:Q", title="Nilai X", scale=alt.Scale(domain=list(BATAS_X)))
+    sumbu_y = alt.Y("y:Q", title="Nilai Y", scale=alt.Scale(domain=list(batas_y)))
+    warna_garis = alt.Color("label:N", title=None, legend=alt.Legend(orient="top-left"),
+                            scale=alt.Scale(domain=[label_tetap, nama_bergerak], range=[warna_tetap, warna_bergerak]))
+
+    garis = alt.Chart(garis_tetap).mark_line(strokeWidth=2, clip=True).encode(x=sumbu_x, y=sumbu_y, color=warna_garis)
+    garis_langkah = alt.Chart(garis_bergerak).transform_filter(pada_langkah).mark_line(
+        strokeWidth=2, clip=True).encode(x=sumbu_x, y=sumbu_y, color=warna_garis)
+    dasar = alt.Chart(lintasan)
+    jejak = dasar.transform_filter("datum.status == 'unik'").mark_circle(size=12, opacity=0.35, color="purple",
+                                                                         clip=True).encode(x=sumbu_x, y=sumbu_y)
+    terpilih = dasar.transform_filter(pada_langkah)
+    titik = terpilih.transform_filter("datum.status == 'unik'").mark_point(
+        filled=True, size=150, color="purple", stroke="black", strokeWidth=1.5, opacity=1, clip=True
+    ).encode(x=sumbu_x, y=sumbu_y)
+    keterangan = terpilih.mark_text(align="left", baseline="top", fontSize=14, fontWeight="bold").encode(
+        x=alt.value(5), y=alt.value(-22), text="info:N"
+    )
+    grafik = (garis + jejak + garis_langkah + titik + keterangan).properties(
+        title=alt.Title("Lintasan Titik Potong", offset=30), height=420
+    )
+
+    sumbu_nilai = alt.X("nilai:Q", title=f"Nilai {parameter}", scale=alt.Scale(domain=[float(nilai[0]), float(nilai[-1])]))
+    warna_status = alt.Color("status:N", title="Status",
+                             scale=alt.Scale(domain=list(_WARNA_STATUS), range=list(_WARNA_STATUS.values())))
+    pita = dasar.transform_filter("datum.status == 'unik'").mark_tick(thickness=1, opacity=0.4).encode(
+        x=sumbu_nilai, color=warna_status
+    )
+    # Langkah tanpa solusi unik digambar lebih tebal di atas langkah unik, dan langkah berhimpit (biasanya
+    # hanya satu) paling atas, agar tidak tertutup langkah di sekitarnya
+    khusus = [
+        dasar.transform_filter(saringan).mark_tick(thickness=4).encode(x=sumbu_nilai, color=warna_status)
+        for saringan in ("datum.status == 'paralel' || datum.status == 'tidak valid'", "datum.status == 'berhimpit'")
+    ]
+    penanda = dasar.transform_filter(pada_langkah).mark_rule(color="black", strokeWidth=2).encode(x=sumbu_nilai)
+    status_langkah = alt.layer(pita, *khusus, penanda).properties(title="Status setiap langkah", height=40)
+
+    return alt.vconcat(grafik, status_langkah).add_params(nilai_param).resolve_scale(color="independent")
+
+
+def spesifikasi_sapuan(persamaan1, persamaan2, parameter, awal, akhir, langkah, color1, color2):
+    """Spesifikasi Vega-Lite (dict) grafik sapuan, diambil dari cache bersama jika sapuan yang sama sudah pernah dibuat."""
+    kunci = (tuple(map(float, persamaan1)), tuple(map(float, persamaan2)), parameter, float(awal), float(akhir),
+             float(langkah), color1, color2)
+    spesifikasi = _cache_sapuan.get(kunci)
+    if spesifikasi is None:
+        nilai = nilai_sapuan(awal, akhir, langkah)
+        spesifikasi = chart_sapuan(persamaan1, persamaan2, parameter, nilai, color1, color2).to_dict()
+        _cache_sapuan.put(kunci, spesifikasi)
+    return spesifikasi
+
+
+def statistik_cache_sapuan():
+    """Statistik cache spesifikasi grafik sapuan (ukuran, hits, misses, evictions, hit_rate)."""
+    return _cache_sapuan.statistik()
+
+
+daftarkan_sumber("cache_sapuan", statistik_cache_sapuan)
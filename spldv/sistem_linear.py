@@ -0,0 +1,93 @@
+import numpy as np
+
+from spldv.solver import hitung_solusi_spldv_batch
+from spldv.status import STATUS_BERHIMPIT, STATUS_PARALEL, STATUS_TIDAK_VALID, STATUS_UNIK
+
+# Sistem dengan bilangan kondisi di atas batas ini dianggap singular secara numerik
+BATAS_KONDISI = 1e12
+# Sistem singular dianggap konsisten (berhimpit) jika residu kuadrat terkecilnya paling besar ini kali ‖b‖
+TOLERANSI_RESIDU = 1e-9
+
+
+def kondisi_2x2(A):
+    """Bilangan kondisi (norma-2) matriks 2x2 dalam bentuk tertutup, tanpa SVD."""
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        frobenius2 = np.einsum("nij,nij->n", A, A)
+        det = np.abs(A[:, 0, 0] * A[:, 1, 1] - A[:, 0, 1] * A[:, 1, 0])
+        akar = np.sqrt(np.maximum(frobenius2 * frobenius2 - 4 * det * det, 0))
+        return (frobenius2 + akar) / (2 * det)
+
+
+def selesaikan_sistem_batch(A, b, batas_kondisi=BATAS_KONDISI):
+    """
+    Menyelesaikan tumpukan sistem linear k variabel A @ x = b sekaligus.
+
+    `A` berbentuk (N, k, k) dan `b` berbentuk (N, k). Mengembalikan
+    (solusi, status, kondisi): solusi (N, k) berisi NaN untuk sistem tanpa
+    solusi unik, status berisi STATUS_UNIK, STATUS_PARALEL (tidak ada solusi)
+    atau STATUS_BERHIMPIT (tak terhingga solusi), dan kondisi adalah bilangan
+    kondisi tiap matriks.
+
+    Sistem dengan koefisien NaN/inf, atau dengan persamaan yang semua
+    koefisien variabelnya nol (baris A bernilai nol), berstatus
+    STATUS_TIDAK_VALID dengan solusi dan kondisi NaN, tanpa menggagalkan
+    sistem lain. Aturan ini sama untuk semua k.
+
+    Untuk k = 2 dipakai jalur khusus aturan Cramer (hitung_solusi_spldv_batch),
+    sehingga klasifikasinya sama persis dengan kalkulator SPLDV.
+    Untuk k > 2, sistem dengan kondisi >= batas_kondisi dianggap singular dan
+    dibedakan lewat residu kuadrat terkecil relatif terhadap ‖b‖; sisanya
+    diselesaikan dengan faktorisasi LU ter-batch (np.linalg.solve).
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if A.ndim != 3 or A.shape[1] != A.shape[2] or b.shape != A.shape[:2]:
+        raise ValueError(f"A harus berbentuk (N, k, k) dan b (N, k), bukan {A.shape} dan {b.shape}")
+    n, k = A.shape[:2]
+
+    if k == 2:
+        x, y, status = hitung_solusi_spldv_batch(np.concatenate([A, b[:, :, None]], axis=2))
+        kondisi = kondisi_2x2(A)
+        kondisi[status == STATUS_TIDAK_VALID] = np.nan
+        return np.column_stack([x, y]), status, kondisi
+
+    # Persamaan tanpa variabel tidak valid, seperti a = b = 0 pada jalur Cramer k = 2
+    valid = np.isfinite(A).all(axis=(1, 2)) & np.isfinite(b).all(axis=1) & (A != 0).any(axis=2).all(axis=1)
+    if valid.all():
+        return _selesaikan_hingga(A, b, batas_kondisi)
+    # SVD ter-batch gagal total ("did not converge") jika satu sistem saja berisi NaN/inf
+    solusi = np.full((n, k), np.nan)
+    status = np.full(n, STATUS_TIDAK_VALID, dtype=np.int8)
+    kondisi = np.full(n, np.nan)
+    if valid.any():
+        solusi[valid], status[valid], kondisi[valid] = _selesaikan_hingga(A[valid], b[valid], batas_kondisi)
+    return solusi, status, kondisi
+
+
+def _selesaikan_hingga(A, b, batas_kondisi):
+    """Jalur k > 2 selesaikan_sistem_batch untuk sistem yang hingga dan tanpa baris A bernilai nol."""
+    n, k = A.shape[:2]
+    nilai_singular = np.linalg.svd(A, compute_uv=False)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        kondisi = nilai_singular[:, 0] / nilai_singular[:, -1]
+    singular = ~(kondisi < batas_kondisi) # Juga menangkap inf dari nilai singular terkecil nol
+
+    solusi = np.full((n, k), np.nan)
+    status = np.full(n, STATUS_UNIK, dtype=np.int8)
+    regular = ~singular
+    if regular.any():
+        solusi[regular] = np.linalg.solve(A[regular], b[regular][:, :, None])[:, :, 0]
+
+    if singular.any():
+        # Rank(A) memakai toleransi dari nilai singular A sendiri, sehingga besar b tidak memengaruhinya.
+        # Residu kuadrat terkecil dengan pseudo-invers terpotong adalah komponen b pada vektor singular kiri
+        # yang nilai singularnya di bawah toleransi; sistem konsisten jika residu itu kecil dibanding ‖b‖.
+        U, nilai_singular_s, _ = np.linalg.svd(A[singular])
+        b_s = b[singular]
+        toleransi = nilai_singular_s[:, :1] / batas_kondisi
+        proyeksi = np.einsum("nji,nj->ni", U, b_s)
+        residu = np.sqrt(np.where(nilai_singular_s > toleransi, 0.0, proyeksi * proyeksi).sum(axis=1))
+        konsisten = residu <= TOLERANSI_RESIDU * np.linalg.norm(b_s, axis=1)
+        status[singular] = np.where(konsisten, STATUS_BERHIMPIT, STATUS_PARALEL)
+
+    return solusi, status, kondisi
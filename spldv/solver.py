@@ -0,0 +1,186 @@
+import numpy as np
+
+from spldv.eksak import selesaikan_eksak
+from spldv.status import STATUS_BERHIMPIT, STATUS_PARALEL, STATUS_TIDAK_VALID, STATUS_UNIK
+
+TOLERANSI_DETERMINAN = 1e-9
+# Untuk koefisien bulat sampai batas ini, setiap hasil kali dan selisih pada determinan (< 2^24) tepat dalam float32
+BATAS_KOEFISIEN_FLOAT32 = 2.0 ** 11
+PILIHAN_ULANG = ("float64", "eksak")
+
+
+def hitung_y(persamaan, x_val):
+    """
+    Menghitung nilai y berdasarkan persamaan dan nilai x.
+    Persamaan diberikan dalam bentuk (a, b, c) untuk ax + by = c.
+    """
+    a, b, c = persamaan
+    if b == 0:
+        return np.full_like(x_val, np.nan) # Mengembalikan NaN untuk y jika b=0
+    return (c - a * x_val) / b
+
+
+def _pisahkan_koefisien(persamaan1, persamaan2, dtype=float):
+    """
+    Menyeragamkan input batch menjadi dua array (N, 3) bertipe `dtype` (None: tipe aslinya).
+    Menerima dua array (N, 3) atau satu array (N, 2, 3) pada `persamaan1`.
+    """
+    if persamaan2 is None:
+        sistem = np.asarray(persamaan1, dtype=dtype)
+        if sistem.ndim != 3 or sistem.shape[1:] != (2, 3):
+            raise ValueError(f"Array sistem harus berbentuk (N, 2, 3), bukan {sistem.shape}")
+        return sistem[:, 0, :], sistem[:, 1, :]
+
+    p1 = np.asarray(persamaan1, dtype=dtype)
+    p2 = np.asarray(persamaan2, dtype=dtype)
+    if p1.ndim != 2 or p1.shape[1] != 3 or p1.shape != p2.shape:
+        raise ValueError(f"Koefisien harus berbentuk (N, 3) yang sama, bukan {p1.shape} dan {p2.shape}")
+    return p1, p2
+
+
+def hitung_solusi_spldv_batch(persamaan1, persamaan2=None, toleransi=TOLERANSI_DETERMINAN):
+    """
+    Menyelesaikan banyak SPLDV sekaligus dengan aturan Cramer yang divektorisasi.
+
+    `persamaan1` dan `persamaan2` berupa array (N, 3) berisi baris (a, b, c),
+    atau `persamaan1` saja berupa array (N, 2, 3).
+    Mengembalikan (x, y, status): x dan y berisi NaN untuk baris yang tidak
+    memiliki solusi unik, status berisi salah satu konstanta STATUS_*.
+    Baris dengan koefisien NaN/inf, atau yang determinan maupun solusinya meluap
+    menjadi inf/NaN, berstatus STATUS_TIDAK_VALID.
+    """
+    p1, p2 = _pisahkan_koefisien(persamaan1, persamaan2)
+    a1, b1, c1 = p1[:, 0], p1[:, 1], p1[:, 2]
+    a2, b2, c2 = p2[:, 0], p2[:, 1], p2[:, 2]
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        determinant = a1 * b2 - a2 * b1
+        det_x = c1 * b2 - c2 * b1
+        det_y = a1 * c2 - a2 * c1
+
+    singular = np.abs(determinant) < toleransi
+    berhimpit = singular & (np.abs(det_y) < toleransi) & (np.abs(det_x) < toleransi)
+    tidak_valid = ((a1 == 0) & (b1 == 0)) | ((a2 == 0) & (b2 == 0))
+    tidak_valid |= ~(np.isfinite(p1).all(axis=1) & np.isfinite(p2).all(axis=1))
+    tidak_valid |= ~(np.isfinite(determinant) & np.isfinite(det_x) & np.isfinite(det_y))
+
+    status = np.full(determinant.shape, STATUS_UNIK, dtype=np.int8)
+    status[singular] = STATUS_PARALEL
+    status[berhimpit] = STATUS_BERHIMPIT
+    status[tidak_valid] = STATUS_TIDAK_VALID
+
+    # Pembagian hanya dipakai untuk baris unik; baris lain ditimpa NaN
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        x = det_x / determinant
+        y = det_y / determinant
+    status[(status == STATUS_UNIK) & ~(np.isfinite(x) & np.isfinite(y))] = STATUS_TIDAK_VALID
+    bukan_unik = status != STATUS_UNIK
+    x[bukan_unik] = np.nan
+    y[bukan_unik] = np.nan
+    return x, y, status
+
+
+def hitung_solusi_spldv_campuran(persamaan1, persamaan2=None, ulang="float64"):
+    """
+    Versi presisi campuran dari hitung_solusi_spldv_batch untuk bank soal besar.
+
+    Semua baris diselesaikan dulu dalam float32. Determinan float32 dipakai hanya untuk baris
+    yang batas galat pembulatannya nol: koefisien bulat dengan nilai mutlak paling besar
+    BATAS_KOEFISIEN_FLOAT32. Untuk baris itu status, x, dan y (dibagi dalam float64) sama
+    persis dengan hitung_solusi_spldv_batch maupun penyelesaian eksak. Baris lainnya,
+    termasuk koefisien yang berubah saat diubah ke float32, diselesaikan ulang dengan
+    hitung_solusi_spldv_batch (ulang="float64") atau selesaikan_eksak (ulang="eksak"),
+    sehingga seluruh hasil sama dengan penyelesaian penuh metode tersebut. Baris dengan NaN/inf
+    atau solusi di luar rentang float64 berstatus STATUS_TIDAK_VALID pada kedua pilihan.
+    Masukan float32 atau bulat tidak perlu dibaca dalam float64 sama sekali.
+    Mengembalikan (x, y, status, diulang); diulang menandai baris yang diselesaikan ulang.
+    """
+    if ulang not in PILIHAN_ULANG:
+        raise ValueError(f"ulang harus salah satu dari {PILIHAN_ULANG}, bukan {ulang!r}")
+    p1, p2 = _pisahkan_koefisien(persamaan1, persamaan2, dtype=None)
+
+    # Satu salinan float32 per kolom yang bersebelahan di memori; semua operasi berikutnya membaca kolom utuh
+    kolom = np.empty((6, len(p1)), dtype=np.float32)
+    with np.errstate(over='ignore', invalid='ignore'):
+        kolom[:3] = p1.T
+        kolom[3:] = p2.T
+        if p1.dtype.kind == "f":
+            # Nilai yang tidak bulat atau di luar rentang int16 tidak mungkin kembali sama setelah diubah ke int16;
+            # nilai mutlaknya dibaca sebagai uint16 agar -32768 tidak lolos
+            bulat = kolom.astype(np.int16)
+            tepat = (bulat == kolom).all(axis=0)
+            tepat &= np.abs(bulat).view(np.uint16).max(axis=0, initial=0) <= BATAS_KOEFISIEN_FLOAT32
+            if p1.dtype != np.float32:
+                tepat &= (kolom[:3] == p1.T).all(axis=0) & (kolom[3:] == p2.T).all(axis=0)
+        else:
+            tepat = np.abs(kolom).max(axis=0, initial=0) <= BATAS_KOEFISIEN_FLOAT32
+    a1, b1, c1, a2, b2, c2 = kolom
+
+    # Baris yang meluap atau berisi NaN/inf di float32 tidak tepat dan akan diselesaikan ulang
+    with np.errstate(over='ignore', invalid='ignore'):
+        determinant = a1 * b2 - a2 * b1
+        det_x = c1 * b2 - c2 * b1
+        det_y = a1 * c2 - a2 * c1
+
+    # Determinan yang tepat adalah bilangan bulat, jadi nol persis sama dengan di bawah toleransi float64
+    singular = determinant == 0
+    status = np.full(determinant.shape, STATUS_UNIK, dtype=np.int8)
+    status[singular] = STATUS_PARALEL
+    status[singular & (det_x == 0) & (det_y == 0)] = STATUS_BERHIMPIT
+    status[((a1 == 0) & (b1 == 0)) | ((a2 == 0) & (b2 == 0))] = STATUS_TIDAK_VALID
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = det_x.astype(float) / determinant
+        y = det_y.astype(float) / determinant
+    bukan_unik = status != STATUS_UNIK
+    x[bukan_unik] = np.nan
+    y[bukan_unik] = np.nan
+
+    diulang = ~tepat
+    if diulang.any():
+        if ulang == "float64":
+            x[diulang], y[diulang], status[diulang] = hitung_solusi_spldv_batch(p1[diulang], p2[diulang])
+        else:
+            # NaN/inf tidak memiliki nilai rasional; baris itu diserahkan ke jalur float64 yang menandainya tidak valid
+            hingga = np.isfinite(p1).all(axis=1) & np.isfinite(p2).all(axis=1)
+            tak_hingga = diulang & ~hingga
+            if tak_hingga.any():
+                x[tak_hingga], y[tak_hingga], status[tak_hingga] = hitung_solusi_spldv_batch(p1[tak_hingga],
+                                                                                            p2[tak_hingga])
+            for i in np.flatnonzero(diulang & hingga).tolist():
+                kode, solusi_x, solusi_y = selesaikan_eksak(p1[i].tolist(), p2[i].tolist())
+                if kode == STATUS_UNIK:
+                    try:
+                        x[i], y[i] = solusi_x[0] / solusi_x[1], solusi_y[0] / solusi_y[1]
+                    except OverflowError:
+                        kode = STATUS_TIDAK_VALID # Solusi eksak di luar rentang float64, seperti determinan yang meluap
+                status[i] = kode
+                if kode != STATUS_UNIK:
+                    x[i] = y[i] = np.nan
+    return x, y, status, diulang
+
+
+def hitung_solusi_spldv(persamaan1, persamaan2, eksak=False):
+    """
+    Menghitung solusi SPLDV menggunakan metode eliminasi/substitusi.
+    Mengembalikan (x, y) atau (None, None) jika paralel/tidak valid, atau (float('inf'), float('inf')) untuk garis identik.
+    Pembungkus tipis di atas `hitung_solusi_spldv_batch` agar hasil keduanya selalu sama.
+    Dengan eksak=True, klasifikasi memakai aritmetika rasional (jalur int untuk koefisien bulat)
+    dan x, y dibulatkan ke float hanya di akhir; solusi di luar rentang float dianggap tidak valid,
+    seperti pada hitung_solusi_spldv_campuran.
+    """
+    if eksak:
+        status, solusi_x, solusi_y = selesaikan_eksak(persamaan1, persamaan2)
+        if status == STATUS_UNIK:
+            try:
+                return solusi_x[0] / solusi_x[1], solusi_y[0] / solusi_y[1]
+            except OverflowError:
+                return None, None
+    else:
+        x, y, status = hitung_solusi_spldv_batch([persamaan1], [persamaan2])
+        status = status[0]
+        if status == STATUS_UNIK:
+            return float(x[0]), float(y[0])
+
+    if status == STATUS_BERHIMPIT:
+        return float('inf'), float('inf') # Mengindikasikan tak terhingga solusi
+    return None, None # Garis paralel atau persamaan tidak valid
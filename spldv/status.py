@@ -0,0 +1,12 @@
+# --- Kode status per sistem untuk solver batch ---
+STATUS_UNIK = 0        # Tepat satu titik potong
+STATUS_PARALEL = 1     # Garis sejajar, tidak ada solusi
+STATUS_BERHIMPIT = 2   # Garis berhimpit, tak terhingga solusi
+STATUS_TIDAK_VALID = 3 # Ada persamaan dengan a = b = 0
+
+NAMA_STATUS = {
+    STATUS_UNIK: "unik",
+    STATUS_PARALEL: "paralel",
+    STATUS_BERHIMPIT: "berhimpit",
+    STATUS_TIDAK_VALID: "tidak valid",
+}
@@ -0,0 +1,128 @@
+import operator
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Optional
+
+from spldv.eksak import ke_rasional
+
+TOLERANSI_PENYEBUT = 1e-9
+TOLERANSI_VERIFIKASI = 1e-6
+
+# --- Alasan kegagalan yang dapat muncul pada jejak substitusi ---
+GAGAL_PERSAMAAN1_TIDAK_VALID = "persamaan1_tidak_valid" # a1 = b1 = 0
+GAGAL_DETERMINAN_NOL = "determinan_nol"                 # Sistem sejajar atau berhimpit
+GAGAL_B1_NOL = "b1_nol"                                 # Substitusi balik ke Persamaan 1 tidak bisa mencari y
+GAGAL_A1_NOL = "a1_nol"                                 # Substitusi balik ke Persamaan 1 tidak bisa mencari x
+
+
+@dataclass(frozen=True)
+class JejakSubstitusi:
+    """
+    Jejak langkah metode substitusi untuk a1x + b1y = c1 dan a2x + b2y = c2.
+
+    `variabel_substitusi` adalah variabel yang dinyatakan dari Persamaan 1
+    (`'x'` atau `'y'`), dengan bentuk variabel = m_val * lainnya + c_val.
+    `pembilang` / `penyebut` adalah persamaan hasil substitusi ke Persamaan 2,
+    `nilai_pertama` adalah variabel lain yang diperoleh darinya, dan
+    `suku_balik` / `sisa_balik` adalah hitungan substitusi balik ke Persamaan 1.
+    Jika `alasan_gagal` tidak None, langkah-langkah setelah titik gagal bernilai None.
+    Pada mode eksak, nilai-nilai hasil hitungan berupa int atau Fraction.
+    """
+    a1: float
+    b1: float
+    c1: float
+    a2: float
+    b2: float
+    c2: float
+    variabel_substitusi: Optional[str] = None
+    m_val: Optional[float] = None
+    c_val: Optional[float] = None
+    pembilang: Optional[float] = None
+    penyebut: Optional[float] = None
+    nilai_pertama: Optional[float] = None
+    suku_balik: Optional[float] = None
+    sisa_balik: Optional[float] = None
+    x: Optional[float] = None
+    y: Optional[float] = None
+    alasan_gagal: Optional[str] = None
+
+    @property
+    def berhasil(self):
+        return self.alasan_gagal is None
+
+
+def solve_spldv_substitusi(a1, b1, c1, a2, b2, c2, eksak=False):
+    """
+    Menyelesaikan SPLDV dengan metode substitusi tanpa Streamlit.
+    Mengembalikan JejakSubstitusi yang berisi semua nilai antara untuk ditampilkan.
+    Dengan eksak=True, perhitungan memakai int/Fraction dan pembanding nol tanpa toleransi;
+    koefisien bulat tetap dihitung sebagai int sampai pembagian pertama.
+    """
+    koefisien = dict(a1=a1, b1=b1, c1=c1, a2=a2, b2=b2, c2=c2)
+    if eksak:
+        a1, b1, c1, a2, b2, c2 = (ke_rasional(v) for v in (a1, b1, c1, a2, b2, c2))
+        bagi = Fraction
+        hampir_nol = operator.not_
+    else:
+        bagi = operator.truediv
+        hampir_nol = lambda nilai: abs(nilai) < TOLERANSI_PENYEBUT # Mendekati nol untuk floating point
+
+    # Langkah 1: Nyatakan x dari Persamaan 1, atau y jika a1 = 0
+    if a1 == 0:
+        if b1 == 0:
+            return JejakSubstitusi(**koefisien, alasan_gagal=GAGAL_PERSAMAAN1_TIDAK_VALID)
+        substitute_var = 'y'
+        m_val = bagi(-a1, b1)
+        c_val = bagi(c1, b1)
+    else:
+        substitute_var = 'x'
+        m_val = bagi(-b1, a1)
+        c_val = bagi(c1, a1)
+    langkah1 = dict(koefisien, variabel_substitusi=substitute_var, m_val=m_val, c_val=c_val)
+
+    # Langkah 2 & 3: Substitusi ke Persamaan 2 dan selesaikan
+    if substitute_var == 'x':
+        # y * (b2*a1 - a2*b1) = c2*a1 - a2*c1
+        denominator = (b2 * a1 - a2 * b1)
+        numerator = (c2 * a1 - a2 * c1)
+    else:
+        # x * (a2*b1 - b2*a1) = c2*b1 - b2*c1
+        denominator = (a2 * b1 - b2 * a1)
+        numerator = (c2 * b1 - b2 * c1)
+    if hampir_nol(denominator):
+        return JejakSubstitusi(**langkah1, pembilang=numerator, penyebut=denominator,
+                               alasan_gagal=GAGAL_DETERMINAN_NOL)
+    nilai_pertama = bagi(numerator, denominator)
+    langkah3 = dict(langkah1, pembilang=numerator, penyebut=denominator, nilai_pertama=nilai_pertama)
+
+    # Langkah 4: Substitusi balik ke Persamaan 1
+    if substitute_var == 'x':
+        if hampir_nol(b1):
+            return JejakSubstitusi(**langkah3, alasan_gagal=GAGAL_B1_NOL)
+        x_final = bagi(c1 - b1 * nilai_pertama, a1)
+        suku_balik = a1 * x_final
+        sisa_balik = c1 - suku_balik
+        y_final = bagi(sisa_balik, b1)
+    else:
+        if hampir_nol(a1):
+            return JejakSubstitusi(**langkah3, alasan_gagal=GAGAL_A1_NOL)
+        y_final = bagi(c1 - a1 * nilai_pertama, b1)
+        suku_balik = b1 * y_final
+        sisa_balik = c1 - suku_balik
+        x_final = bagi(sisa_balik, a1)
+
+    return JejakSubstitusi(**langkah3, suku_balik=suku_balik, sisa_balik=sisa_balik, x=x_final, y=y_final)
+
+
+def verifikasi_solusi(a1, b1, c1, a2, b2, c2, x, y, eksak=False):
+    """
+    Memasukkan (x, y) kembali ke kedua persamaan.
+    Mengembalikan (ruas_kiri1, ruas_kiri2, tepat); dengan eksak=True kesamaan diperiksa tanpa toleransi.
+    """
+    if eksak:
+        a1, b1, c1, a2, b2, c2, x, y = (ke_rasional(v) for v in (a1, b1, c1, a2, b2, c2, x, y))
+    check1 = a1 * x + b1 * y
+    check2 = a2 * x + b2 * y
+    if eksak:
+        return check1, check2, check1 == c1 and check2 == c2
+    return check1, check2, abs(check1 - c1) < TOLERANSI_VERIFIKASI and abs(check2 - c2) < TOLERANSI_VERIFIKASI
@@ -0,0 +1,63 @@
+import streamlit as st
+
+from spldv.langkah_substitusi import angka_tampilan, bentuk_jejak, bentuk_solusi_akhir, nilai_templat, templat_jejak
+from spldv.substitusi import solve_spldv_substitusi, verifikasi_solusi
+
+
+def _tampilkan_templat(bentuk, nilai, gabung):
+    tampil = {"markdown": st.markdown, "write": st.write, "code": st.code, "info": st.info,
+              "success": st.success, "warning": st.warning, "error": st.error}
+    for jenis, teks in templat_jejak(bentuk, gabung):
+        tampil[jenis](teks.format(**nilai))
+
+
+def tampilkan_jejak_substitusi(jejak, gabung=False):
+    """
+    Menampilkan JejakSubstitusi sebagai langkah-langkah penyelesaian di Streamlit.
+
+    Dengan gabung=True, teks, rumus, dan kode di antara kotak info/success/error
+    dikirim sebagai satu blok markdown, sehingga satu perhitungan hanya
+    menghasilkan sekitar sepuluh elemen, bukan 25-30, dengan tampilan yang sama.
+    """
+    _tampilkan_templat(bentuk_jejak(jejak), nilai_templat(jejak), gabung)
+
+
+def tampilkan_solusi_akhir(jejak, gabung=False):
+    """
+    Menampilkan solusi akhir jejak yang berhasil beserta verifikasinya, dari templat yang sama
+    dengan lembar kerja. Verifikasi memakai aritmetika eksak, sehingga input bulat tidak
+    memunculkan selisih pembulatan. Mengembalikan True jika solusi tepat.
+    """
+    cek1, cek2, tepat = verifikasi_solusi(jejak.a1, jejak.b1, jejak.c1, jejak.a2, jejak.b2, jejak.c2,
+                                          jejak.x, jejak.y, eksak=True)
+    nilai = nilai_templat(jejak)
+    nilai.update(cek1=angka_tampilan(cek1), cek2=angka_tampilan(cek2))
+    _tampilkan_templat(bentuk_solusi_akhir(tepat), nilai, gabung)
+    if tepat:
+        st.balloons()
+    return tepat
+
+
+def jejak_substitusi_streamlit(a1, b1, c1, a2, b2, c2, eksak=False, gabung=False, pakai_cache=False):
+    """
+    Menyelesaikan SPLDV dengan metode substitusi, menampilkan langkahnya di Streamlit, dan
+    mengembalikan JejakSubstitusi-nya (misalnya untuk tampilkan_solusi_akhir).
+    Dengan pakai_cache=True, jejak diambil dari cache solusi bersama (spldv.cache_solusi).
+    """
+    if pakai_cache:
+        from spldv.cache_solusi import solve_spldv_substitusi_cache
+
+        jejak = solve_spldv_substitusi_cache(a1, b1, c1, a2, b2, c2, eksak=eksak)
+    else:
+        jejak = solve_spldv_substitusi(a1, b1, c1, a2, b2, c2, eksak=eksak)
+    tampilkan_jejak_substitusi(jejak, gabung=gabung)
+    return jejak
+
+
+def solve_spldv_substitusi_streamlit(a1, b1, c1, a2, b2, c2, eksak=False, gabung=False, pakai_cache=False):
+    """
+    Menyelesaikan SPLDV dengan metode substitusi dan menampilkan langkahnya di Streamlit.
+    Mengembalikan (x, y), atau (None, None) jika tidak dapat diselesaikan.
+    """
+    jejak = jejak_substitusi_streamlit(a1, b1, c1, a2, b2, c2, eksak=eksak, gabung=gabung, pakai_cache=pakai_cache)
+    return jejak.x, jejak.y
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Akar repositori ditambahkan ke sys.path agar paket bersama `spldv` dapat diimpor
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,124 @@
+import http.client
+import json
+import math
+import socket
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import uvicorn
+
+from spldv import api
+from spldv.status import NAMA_STATUS, STATUS_TIDAK_VALID, STATUS_UNIK
+
+
+@pytest.fixture(scope="module")
+def server():
+    with socket.socket() as sok:
+        sok.bind(("127.0.0.1", 0))
+        port = sok.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(api.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    batas = time.monotonic() + 10
+    while not server.started:
+        assert time.monotonic() < batas, "server uvicorn tidak kunjung siap"
+        time.sleep(0.01)
+    yield SimpleNamespace(port=port, ident_loop=thread.ident)
+    server.should_exit = True
+    thread.join(timeout=10)
+
+
+def _kirim(port, metode, jalur, isi=None):
+    koneksi = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        koneksi.request(metode, jalur, body=isi, headers={"Content-Type": "application/json"})
+        jawaban = koneksi.getresponse()
+        return jawaban.status, jawaban.getheader("Content-Type"), json.loads(jawaban.read())
+    finally:
+        koneksi.close()
+
+
+def test_batch_besar_tidak_menahan_permintaan_lain(server, monkeypatch):
+    jumlah = 200_000
+    rng = np.random.default_rng(0)
+    sistem = rng.integers(-50, 51, size=(jumlah, 6))
+    sistem[:, 0], sistem[:, 1], sistem[:, 3], sistem[:, 4] = 1, 1, 1, -1 # Determinan -2: selalu unik
+    isi = json.dumps({"sistem": sistem.tolist()}).encode()
+
+    # Validasi batch ditahan sampai permintaan lain selesai dijawab: bila batch dikerjakan
+    # di event loop, permintaan kesehatan tidak akan pernah terlayani selama penahanan ini
+    kesehatan_selesai = threading.Event()
+    thread_batch = []
+    koefisien_batch_asli = api.koefisien_batch
+
+    def koefisien_batch_ditahan(isi_batch):
+        thread_batch.append(threading.get_ident())
+        thread_batch.append(kesehatan_selesai.wait(timeout=10))
+        return koefisien_batch_asli(isi_batch)
+
+    monkeypatch.setattr(api, "koefisien_batch", koefisien_batch_ditahan)
+    hasil = {}
+    thread = threading.Thread(target=lambda: hasil.update(batch=_kirim(server.port, "POST", "/selesaikan/batch", isi)))
+    thread.start()
+    batas = time.monotonic() + 30
+    while not thread_batch:
+        assert time.monotonic() < batas, "permintaan batch tidak kunjung diproses"
+        time.sleep(0.01)
+    kode, _, jawaban = _kirim(server.port, "GET", "/kesehatan")
+    kesehatan_selesai.set()
+    thread.join(timeout=60)
+
+    assert (kode, jawaban) == (200, {"status": "ok"})
+    ident_batch, tepat_waktu = thread_batch
+    assert ident_batch != server.ident_loop and tepat_waktu
+    kode, tipe, jawaban = hasil["batch"]
+    assert kode == 200 and tipe == "application/json"
+    assert jawaban["jumlah"] == jumlah
+    assert set(jawaban["status"]) == {NAMA_STATUS[STATUS_UNIK]}
+    np.testing.assert_allclose(jawaban["x"], (sistem[:, 2] + sistem[:, 5]) / 2)
+
+
+def test_batch_tidak_valid_dijawab_galat_json(server):
+    kode, _, jawaban = _kirim(server.port, "POST", "/selesaikan/batch", b"bukan json")
+    assert kode == 400 and "galat" in jawaban
+    kode, _, jawaban = _kirim(server.port, "POST", "/selesaikan/batch", json.dumps({"sistem": [[1, 2, 3]]}).encode())
+    assert kode == 400 and "galat" in jawaban
+
+
+def test_eksak_solusi_meluap_tidak_valid():
+    isi = {"persamaan1": [1e-300, 0, 1e300], "persamaan2": [0, 1, 0], "eksak": True, "langkah": True}
+    hasil = api.selesaikan_satu(isi)
+    assert (hasil["status"], hasil["x"], hasil["y"]) == (NAMA_STATUS[STATUS_TIDAK_VALID], None, None)
+    json.dumps(hasil, allow_nan=False)
+
+
+@pytest.mark.parametrize("opsi", ["eksak", "langkah"])
+@pytest.mark.parametrize("nilai", ["false", 0, 1, None])
+def test_opsi_harus_bool_json(opsi, nilai):
+    with pytest.raises(api.PermintaanTidakValid):
+        api.selesaikan_satu({"persamaan1": [2, 1, 5], "persamaan2": [1, -1, 1], opsi: nilai})
+
+
+@pytest.mark.parametrize("isi", [
+    {"sistem": [[2, 1, 5, 1, -1, "1"]]},
+    {"sistem": [[2, 1, 5, 1, -1, True]]},
+    {"sistem": [[2, 1, 5, 1, -1, 10 ** 400]]},
+    {"sistem": [[2, 1, 5, 1, -1, math.nan]]},
+    {"sistem": [[2, 1, 5, 1, -1]]},
+    {"sistem": "1,2,3"},
+    {"a1": ["2"], "b1": [1], "c1": [5], "a2": [1], "b2": [-1], "c2": [1]},
+    {"a1": [2], "b1": [1], "c1": [5], "a2": [1], "b2": [-1]},
+])
+def test_batch_memeriksa_koefisien_seperti_selesaikan(isi):
+    with pytest.raises(api.PermintaanTidakValid) as galat:
+        api.koefisien_batch(isi)
+    assert galat.value.kode == 400
+
+
+@pytest.mark.parametrize("isi", [{"sistem": []}, dict.fromkeys(("a1", "b1", "c1", "a2", "b2", "c2"), [])])
+def test_batch_kosong_dijawab_kosong(isi):
+    jawaban = json.loads(api.jawab_batch(json.dumps(isi).encode()))
+    assert jawaban == {"jumlah": 0, "x": [], "y": [], "status": []}
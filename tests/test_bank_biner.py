@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from spldv.bank_biner import BankSoal, PenulisBank, tulis_bank
+
+SOAL = np.array([[2, 1, 5, 1, -1, 1], [1, 1, 2, 2, 2, 4]], dtype=float)
+
+
+def test_tulis_dan_baca_bank(tmp_path):
+    path = tmp_path / "soal.spldv"
+    tulis_bank(path, SOAL, dtype="int16", dengan_hasil=True)
+    bank = BankSoal(path)
+    assert len(bank) == 2
+    assert bank.soal(0) == ((2.0, 1.0, 5.0), (1.0, -1.0, 1.0))
+    assert bank.status.tolist() == [0, 2]
+    assert [p.name for p in tmp_path.iterdir()] == ["soal.spldv"]
+
+
+def test_exception_dalam_penulis_tidak_meninggalkan_file(tmp_path):
+    path = tmp_path / "soal.spldv"
+    with pytest.raises(RuntimeError):
+        with PenulisBank(path) as penulis:
+            penulis.tulis(SOAL)
+            raise RuntimeError("sumber soal terputus")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_exception_dalam_penulis_tidak_mengubah_bank_lama(tmp_path):
+    path = tmp_path / "soal.spldv"
+    tulis_bank(path, SOAL[:1])
+    with pytest.raises(ValueError):
+        with PenulisBank(path, dtype="int16") as penulis:
+            penulis.tulis(SOAL)
+            penulis.tulis([[0.5, 1, 1, 1, 1, 1]]) # Tidak tepat sebagai int16
+    assert len(BankSoal(path)) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["soal.spldv"]
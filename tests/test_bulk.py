@@ -0,0 +1,20 @@
+import io
+
+import pandas as pd
+import pytest
+
+from spldv.bulk import format_dari_nama, proses_bulk
+
+
+def test_format_tidak_dikenali_menyebut_semua_akhiran():
+    with pytest.raises(ValueError, match=r"\.csv.*\.parquet.*\.spldv"):
+        format_dari_nama("soal.xlsx")
+
+
+def test_hasil_bisa_ditulis_ke_buffer_memori():
+    sumber = io.BytesIO(b"a1,b1,c1,a2,b2,c2\n2,1,5,1,-1,1\n1,1,2,2,2,4\n")
+    tujuan = io.BytesIO()
+    proses_bulk(sumber, tujuan, "csv", "csv")
+    hasil = pd.read_csv(io.BytesIO(tujuan.getvalue()))
+    assert hasil["status"].tolist() == ["unik", "berhimpit"]
+    assert (hasil.loc[0, "x"], hasil.loc[0, "y"]) == (2.0, 1.0)
@@ -0,0 +1,59 @@
+from fractions import Fraction
+
+import pytest
+
+from spldv.cache import CacheTersimpan, LRUCache
+from spldv.substitusi import solve_spldv_substitusi
+
+
+def test_lru_membuang_entri_paling_lama_tidak_dipakai():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1 # "a" kini paling baru dipakai
+    cache.put("c", 3)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.get("b", "tidak ada") == "tidak ada"
+    statistik = cache.statistik()
+    assert (statistik["ukuran"], statistik["hits"], statistik["misses"], statistik["evictions"]) == (2, 1, 1, 1)
+    assert statistik["hit_rate"] == 0.5
+
+
+def test_lru_kapasitas_minimal_satu():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_cache_tersimpan_dibaca_ulang_dari_sqlite(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    jejak = solve_spldv_substitusi(1, 2, 3, 4, 5, 6, eksak=True)
+    cache = CacheTersimpan(4, path)
+    cache.put("jejak", jejak)
+    cache.put("pecahan", (Fraction(1, 3), None))
+    cache.tutup()
+
+    cache = CacheTersimpan(4, path)
+    assert cache.get("jejak") == jejak # Nilai di-pickle dan dibaca kembali utuh
+    assert cache.get("pecahan") == (Fraction(1, 3), None)
+    assert cache.get("pecahan") == (Fraction(1, 3), None) # Kini dari memori
+    statistik = cache.statistik()
+    assert (statistik["hits_disk"], statistik["hits"], statistik["ukuran_disk"]) == (2, 1, 2)
+    cache.tutup()
+
+
+def test_cache_tersimpan_membatasi_baris_sqlite(tmp_path):
+    cache = CacheTersimpan(1, tmp_path / "cache.sqlite", kapasitas_disk=2)
+    for i in range(3):
+        cache.put(f"k{i}", i)
+    assert cache.statistik()["ukuran_disk"] == 2
+    assert cache.get("k0") is None and cache.get("k1") == 1 and cache.get("k2") == 2
+    cache.clear()
+    assert cache.get("k2") is None and cache.statistik()["ukuran_disk"] == 0
+    cache.tutup()
+
+
+def test_cache_tersimpan_tanpa_path_hanya_memori():
+    cache = CacheTersimpan(1)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") is None and cache.get("b") == 2
@@ -0,0 +1,46 @@
+import pytest
+
+from spldv import cache_solusi
+from spldv.cache_solusi import hitung_solusi_spldv_cache, kunci_sistem, solve_spldv_substitusi_cache
+from spldv.solver import hitung_solusi_spldv
+
+
+@pytest.fixture(autouse=True)
+def cache_baru():
+    cache_solusi.atur_cache_solusi(kapasitas=16)
+    yield
+    cache_solusi.atur_cache_solusi()
+
+
+def test_kunci_sistem_sama_untuk_kelipatan_dan_urutan():
+    kunci = kunci_sistem((1, 1, 2), (1, -1, 0))
+    assert kunci == kunci_sistem((-2, -2, -4), (0.5, -0.5, 0)) == kunci_sistem((1, -1, 0), (3, 3, 6))
+    assert kunci != kunci_sistem((1, 1, 3), (1, -1, 0))
+    assert kunci_sistem((float("nan"), 1, 2), (1, -1, 0)) is None
+
+
+def test_eksak_memakai_satu_entri_untuk_sistem_setara():
+    assert hitung_solusi_spldv_cache((1, 1, 2), (1, -1, 0), eksak=True) == (1, 1)
+    assert hitung_solusi_spldv_cache((1, -1, 0), (2, 2, 4), eksak=True) == (1, 1)
+    statistik = cache_solusi.statistik_cache_solusi()
+    assert (statistik["ukuran"], statistik["hits"]) == (1, 1)
+
+
+@pytest.mark.parametrize("urutan", [0, 1])
+def test_float_tidak_bergantung_pada_variasi_yang_pertama_diminta(urutan):
+    # Setara secara eksak, tetapi toleransi determinan mutlak mengklasifikasikan keduanya berbeda
+    sistem = [((1e-5, 1e-5, 1), (1e-5, -1e-5, 0)), ((1, 1, 1e5), (1, -1, 0))]
+    if urutan:
+        sistem.reverse()
+    for persamaan1, persamaan2 in sistem:
+        assert hitung_solusi_spldv_cache(persamaan1, persamaan2) == hitung_solusi_spldv(persamaan1, persamaan2)
+
+
+def test_float_koefisien_tak_hingga_tidak_valid():
+    assert hitung_solusi_spldv_cache((float("inf"), 1, 2), (1, -1, 0)) == (None, None)
+
+
+def test_jejak_disimpan_dengan_koefisien_apa_adanya():
+    jejak = solve_spldv_substitusi_cache(2, 1, 5, 1, -1, 1, eksak=True)
+    assert solve_spldv_substitusi_cache(2, 1, 5, 1, -1, 1, eksak=True) is jejak
+    assert solve_spldv_substitusi_cache(4, 2, 10, 1, -1, 1, eksak=True) is not jejak
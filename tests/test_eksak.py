@@ -0,0 +1,74 @@
+import random
+from fractions import Fraction
+from math import gcd
+
+import pytest
+
+from spldv.eksak import cramer_bulat, kanonikkan_persamaan, ke_rasional, selesaikan_eksak
+from spldv.status import STATUS_BERHIMPIT, STATUS_PARALEL, STATUS_TIDAK_VALID, STATUS_UNIK
+
+
+def _rank(baris):
+    """Rank matriks Fraction dengan eliminasi Gauss, terpisah dari rumus Cramer yang diuji."""
+    baris = [list(b) for b in baris]
+    rank = 0
+    for kolom in range(len(baris[0])):
+        poros = next((i for i in range(rank, len(baris)) if baris[i][kolom] != 0), None)
+        if poros is None:
+            continue
+        baris[rank], baris[poros] = baris[poros], baris[rank]
+        for i in range(len(baris)):
+            if i != rank:
+                faktor = baris[i][kolom] / baris[rank][kolom]
+                baris[i] = [v - faktor * w for v, w in zip(baris[i], baris[rank])]
+        rank += 1
+    return rank
+
+
+def _status_acuan(p1, p2):
+    sistem = [[ke_rasional(v) * Fraction(1) for v in p] for p in (p1, p2)]
+    if any(a == b == 0 for a, b, _ in sistem):
+        return STATUS_TIDAK_VALID
+    rank_a = _rank([b[:2] for b in sistem])
+    if rank_a == 2:
+        return STATUS_UNIK
+    return STATUS_BERHIMPIT if _rank(sistem) == rank_a else STATUS_PARALEL
+
+
+def _periksa(p1, p2, hasil):
+    status, solusi_x, solusi_y = hasil
+    if status != STATUS_UNIK:
+        assert solusi_x is solusi_y is None
+        return status
+    for pembilang, penyebut in (solusi_x, solusi_y):
+        assert penyebut > 0 and gcd(pembilang, penyebut) == 1
+    x, y = Fraction(*solusi_x), Fraction(*solusi_y)
+    for a, b, c in (p1, p2):
+        assert ke_rasional(a) * x + ke_rasional(b) * y == ke_rasional(c)
+    return status
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cramer_bulat_sesuai_fraction(seed):
+    rng = random.Random(seed)
+    for _ in range(400):
+        p1 = tuple(rng.randint(-4, 4) for _ in range(3))
+        p2 = tuple(rng.choice([v * rng.randint(-2, 2) for v in p1] + [rng.randint(-4, 4)]) for _ in range(3))
+        assert _periksa(p1, p2, cramer_bulat(*p1, *p2)) == _status_acuan(p1, p2), (p1, p2)
+
+
+def test_selesaikan_eksak_desimal_dan_bulat_besar():
+    p1, p2 = (0.1, 0.2, 0.3), (0.3, -0.1, 0.2)
+    assert _periksa(p1, p2, selesaikan_eksak(p1, p2)) == STATUS_UNIK
+    assert selesaikan_eksak(p1, p2)[1:] == ((1, 1), (1, 1))
+    besar = 10 ** 30
+    p1, p2 = (besar, 1, besar + 2), (1, -1, -1)
+    assert _periksa(p1, p2, selesaikan_eksak(p1, p2)) == STATUS_UNIK
+    assert selesaikan_eksak((0.1, 0.2, 0.3), (1, 2, 3)) == (STATUS_BERHIMPIT, None, None)
+    assert selesaikan_eksak((0.1, 0.2, 0.3), (1, 2, 3.0000001)) == (STATUS_PARALEL, None, None)
+
+
+def test_kanonikkan_persamaan():
+    assert kanonikkan_persamaan((2, 2, 4)) == kanonikkan_persamaan((-0.5, -0.5, -1)) == (1, 1, 2)
+    assert kanonikkan_persamaan((0, -0.2, 0.6)) == (0, 1, -3)
+    assert kanonikkan_persamaan((0, 0, 0)) == (0, 0, 0)
@@ -0,0 +1,61 @@
+import numpy as np
+
+from spldv.kelas import JUMLAH_BIN_X, LABEL_JARAK, LABEL_PERCOBAAN, TEPI_JARAK, PengumpulKelas
+
+SOAL = ((1, -1, 0), (1, 1, 4)) # Titik potong x = 2
+SEJAJAR = ((1, 1, 1), (1, 1, 2))
+
+
+def test_sesi_paling_lama_tidak_mencoba_dibuang():
+    kelas = PengumpulKelas(ukuran_riwayat=3, kapasitas_sesi=2)
+    kelas.catat("a", *SOAL, x_coba=0.0, berhasil=False, waktu=100.0)
+    kelas.catat("b", *SOAL, x_coba=1.0, berhasil=False, waktu=101.0)
+    kelas.catat("a", *SOAL, x_coba=1.5, berhasil=False, waktu=102.0) # "a" kini yang terbaru
+    kelas.catat("c", *SOAL, x_coba=2.0, berhasil=True, waktu=103.0)  # "b" dibuang
+    assert list(kelas._sesi) == ["a", "c"]
+    assert kelas._sesi["a"].percobaan == 2
+    assert kelas.statistik() == {"siswa_dilacak": 2, "total_percobaan": 4, "total_berhasil": 1, "riwayat": 3}
+
+    potret = kelas.potret(sekarang=110.0)
+    assert (potret["siswa_aktif"], potret["sudah_menemukan"], potret["belum_menemukan"]) == (2, 1, 1)
+    # Histogram kumulatif tetap menghitung percobaan siswa yang sudah dibuang
+    assert sum(potret["histogram_x"]) == potret["total_percobaan"] == 4
+
+
+def test_histogram_dan_aktivitas():
+    kelas = PengumpulKelas(batas_aktif=60.0)
+    waktu = 1000.0
+    for x_coba in (-1.0, 2.5, 0.5):
+        kelas.catat("a", *SOAL, x_coba=x_coba, berhasil=False, waktu=waktu)
+    kelas.catat("a", *SOAL, x_coba=2.0, berhasil=True, waktu=waktu + 70)
+    kelas.catat("a", *SOAL, x_coba=2.0, berhasil=True, waktu=waktu + 75) # Berhasil lagi tidak dihitung ulang
+    kelas.catat("b", *SEJAJAR, x_coba=-10.0, berhasil=False, waktu=waktu + 80)
+    kelas.catat("c", *SOAL, x_coba=-1.0, berhasil=False, waktu=waktu)     # Sudah tidak aktif
+
+    potret = kelas.potret(sekarang=waktu + 90)
+    histogram_x = np.zeros(JUMLAH_BIN_X, dtype=int)
+    for bin_x in (18, 25, 21, 24, 24, 0, 18): # (x + 10) / 20 * 40
+        histogram_x[bin_x] += 1
+    assert potret["histogram_x"] == histogram_x.tolist()
+
+    # Jarak hanya untuk percobaan yang belum tepat pada sistem bersolusi unik
+    histogram_jarak = [0] * len(LABEL_JARAK)
+    for jarak in (-3.0, 0.5, -1.5, -3.0):
+        histogram_jarak[int(np.searchsorted(TEPI_JARAK, jarak, side="right"))] += 1
+    assert potret["histogram_jarak"] == histogram_jarak
+    assert potret["histogram_percobaan"] == [0, 0, 1, 0, 0, 0] and len(LABEL_PERCOBAAN) == 6
+
+    assert (potret["siswa_aktif"], potret["sudah_menemukan"], potret["tanpa_solusi_unik"]) == (2, 1, 1)
+    assert potret["soal_selesai"] == potret["total_berhasil"] == 1
+    assert potret["percobaan_per_menit"][:2] == [3, 4]
+    assert potret["berhasil_per_menit"][:2] == [2, 0]
+
+
+def test_soal_baru_memulai_hitungan_percobaan():
+    kelas = PengumpulKelas()
+    kelas.catat("a", *SOAL, x_coba=2.0, berhasil=True, waktu=0.0)
+    kelas.catat("a", *SEJAJAR, x_coba=0.0, berhasil=False, waktu=1.0)
+    status = kelas._sesi["a"]
+    assert (status.percobaan, status.berhasil, status.jarak, status.soal_selesai) == (1, False, None, 1)
+    kelas.reset()
+    assert kelas.statistik()["total_percobaan"] == 0 and not any(kelas.potret(sekarang=2.0)["histogram_x"])
@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+import pytest
+
+from spldv.langkah_substitusi import (
+    angka_tampilan,
+    bentuk_jejak,
+    bentuk_solusi_akhir,
+    nilai_templat,
+    templat_jejak,
+)
+from spldv.substitusi import solve_spldv_substitusi, verifikasi_solusi
+
+
+def _render(jejak, bentuk, **tambahan):
+    nilai = {**nilai_templat(jejak), **tambahan}
+    return "\n".join(teks.format(**nilai) for _, teks in templat_jejak(bentuk))
+
+
+def test_jejak_eksak_di_luar_rentang_float_tetap_dapat_ditampilkan():
+    jejak = solve_spldv_substitusi(1e-300, 1, 1e300, 0, 1, 0, eksak=True)
+    assert jejak.berhasil and jejak.x > 10 ** 599
+    nilai = nilai_templat(jejak)
+    assert isinstance(nilai["x"], Decimal) and f"{nilai['x']:.2f}".startswith("1000000000000000")
+    cek1, cek2, tepat = verifikasi_solusi(1e-300, 1, 1e300, 0, 1, 0, jejak.x, jejak.y, eksak=True)
+    teks = _render(jejak, bentuk_jejak(jejak) + bentuk_solusi_akhir(tepat),
+                   cek1=angka_tampilan(cek1), cek2=angka_tampilan(cek2))
+    assert "Solusi Anda TEPAT" in teks
+
+
+def test_angka_tampilan_float_untuk_nilai_biasa():
+    assert angka_tampilan(3) == 3.0 and type(angka_tampilan(3)) is float
+
+
+_SISTEM_CABANG = [
+    (2, 1, 5, 1, -1, 1), # Unik lewat x
+    (0, 2, 4, 1, 1, 5),  # a1 = 0
+    (0, 0, 1, 1, 1, 1),  # Persamaan 1 tidak valid
+    (1, 1, 2, 2, 2, 4),  # Determinan nol
+    (2, 0, 4, 1, 1, 5),  # b1 = 0
+]
+
+
+def test_templat_gabung_menyatukan_elemen_markdown_berurutan():
+    bentuk = ("mulai",)
+    assert templat_jejak(bentuk, gabung=True) == (
+        ("markdown", "### Memulai Perhitungan"),
+        ("info", "Persamaan 1: **{a1}x + {b1}y = {c1}**"),
+        ("info", "Persamaan 2: **{a2}x + {b2}y = {c2}**"),
+        ("markdown", "---\n\n### Langkah 1: Ubah salah satu persamaan\n\n"
+                     "Kita akan mencoba mengubah Persamaan 1 untuk menyatakan `x` dalam bentuk `y`."),
+    )
+    assert templat_jejak(bentuk, gabung=True) is templat_jejak(bentuk, gabung=True)
+
+
+@pytest.mark.parametrize("koefisien", _SISTEM_CABANG)
+def test_templat_gabung_mempertahankan_isi_dan_urutan(koefisien):
+    jejak = solve_spldv_substitusi(*koefisien)
+    bentuk = bentuk_jejak(jejak)
+    if jejak.berhasil:
+        bentuk += bentuk_solusi_akhir(True)
+    terpisah, gabung = templat_jejak(bentuk), templat_jejak(bentuk, gabung=True)
+
+    assert all(not (kiri[0] == kanan[0] == "markdown") for kiri, kanan in zip(gabung, gabung[1:]))
+    assert not {jenis for jenis, _ in gabung} & {"write", "code"}
+    # Elemen lain tetap utuh dan berurutan; setiap blok markdown adalah rangkaian elemen di antaranya
+    lain = [item for item in terpisah if item[0] not in ("markdown", "write", "code")]
+    assert [item for item in gabung if item[0] != "markdown"] == lain
+    for jenis, teks in terpisah:
+        if jenis == "code":
+            assert any(f"```python\n{teks}\n```" in isi for j, isi in gabung if j == "markdown")
+    nilai = {**nilai_templat(jejak), "cek1": 0.0, "cek2": 0.0}
+    for _, teks in gabung:
+        teks.format(**nilai)
@@ -0,0 +1,52 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from spldv.eksak import kanonikkan_persamaan, selesaikan_eksak
+from spldv.latihan import buat_soal, kunci_kanonik, periksa_soal
+from spldv.status import STATUS_UNIK
+
+
+@pytest.mark.parametrize("tingkat", ["mudah", "sedang", "sulit"])
+def test_soal_unik_dan_solusinya_benar(tingkat):
+    koefisien, solusi_x, solusi_y = buat_soal(2000, tingkat, seed=7)
+    assert koefisien.shape == (2000, 6) and koefisien.dtype == np.int64
+    # Tidak ada dua soal yang setara (kelipatan persamaan atau urutan persamaan ditukar)
+    kunci = {tuple(sorted((kanonikkan_persamaan(baris[:3]), kanonikkan_persamaan(baris[3:]))))
+             for baris in koefisien.tolist()}
+    assert len(kunci) == len(koefisien)
+    for baris, (px, qx), (py, qy) in zip(koefisien.tolist()[:300], solusi_x.tolist(), solusi_y.tolist()):
+        status, x, y = selesaikan_eksak(baris[:3], baris[3:])
+        assert (status, Fraction(*x), Fraction(*y)) == (STATUS_UNIK, Fraction(px, qx), Fraction(py, qy))
+
+
+def test_seed_sama_hasil_sama_dan_tanpa_nol():
+    pertama = buat_soal(500, "sulit", tanpa_nol=True, seed=3)
+    kedua = buat_soal(500, "sulit", tanpa_nol=True, seed=3)
+    for lama, baru in zip(pertama, kedua):
+        np.testing.assert_array_equal(lama, baru)
+    assert (pertama[0][:, [0, 1, 3, 4]] != 0).all()
+
+
+def test_kunci_kanonik_menyamakan_sistem_setara():
+    sistem = np.array([[2, 1, 5, 1, -1, 1], [1, -1, 1, 2, 1, 5], [-2, 2, -2, 4, 2, 10]])
+    assert (kunci_kanonik(sistem) == kunci_kanonik(sistem[:1])).all()
+
+
+def test_rentang_terlalu_sempit():
+    with pytest.raises(ValueError, match="Rentang terlalu sempit"):
+        buat_soal(50, rentang_koefisien=(1, 2), rentang_solusi=(0, 1))
+
+
+def test_periksa_soal_menolak_solusi_salah():
+    koefisien, solusi_x, solusi_y = buat_soal(20, "mudah", seed=1)
+    periksa_soal(koefisien, solusi_x, solusi_y)
+    solusi_y = solusi_y.copy()
+    solusi_y[5, 0] += 1
+    with pytest.raises(AssertionError, match="1 soal tidak lolos"):
+        periksa_soal(koefisien, solusi_x, solusi_y)
+    koefisien = koefisien.copy()
+    koefisien[0, 3:] = koefisien[0, :3] * 2 # Berhimpit, bukan unik
+    with pytest.raises(AssertionError):
+        periksa_soal(koefisien, solusi_x, solusi_y)
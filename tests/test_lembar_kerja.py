@@ -0,0 +1,84 @@
+import math
+import re
+
+import pandas as pd
+import pytest
+
+from spldv import lembar_kerja
+from spldv.bulk import KOLOM_KOEFISIEN
+from spldv.langkah_substitusi import bentuk_jejak
+from spldv.lembar_kerja import FORMAT_LEMBAR, bentuk_lembar, ekspor_lembar, render_soal, templat_lembar
+from spldv.substitusi import solve_spldv_substitusi
+
+SOAL = [(2, 1, 5, 1, -1, 1), (0, 2, 4, 1, 1, 3), (1, 1, 2, 2, 2, 4)]
+
+
+@pytest.mark.parametrize("format", FORMAT_LEMBAR)
+def test_templat_lembar_dapat_diisi_untuk_semua_bentuk(format):
+    for koefisien in SOAL:
+        jejak = solve_spldv_substitusi(*koefisien, eksak=True)
+        templat = templat_lembar(bentuk_lembar(jejak, True), format)
+        assert templat is templat_lembar(bentuk_lembar(jejak, True), format) # Dihitung sekali per bentuk
+        assert "Soal 7" in render_soal(koefisien, format, nomor=7)
+
+
+def test_render_soal_html_berisi_langkah_dan_verifikasi():
+    teks = render_soal(SOAL[0], "html")
+    assert "Langkah 4: Substitusi Balik" in teks
+    assert "<strong>x = 2.00</strong>" in teks and "Solusi Anda TEPAT" in teks
+    assert not re.search(r"\{(nomor|[abc][12]|x|y|cek[12])[:}]", teks) # Semua isian terisi
+
+
+def test_render_soal_gagal_tanpa_solusi_akhir():
+    jejak = solve_spldv_substitusi(*SOAL[2], eksak=True)
+    assert bentuk_lembar(jejak, None) == bentuk_jejak(jejak)
+    teks = render_soal(SOAL[2], "latex")
+    assert "Solusi Akhir" not in teks and "\\kotak{red}" in teks
+
+
+@pytest.mark.parametrize("koefisien", [(math.nan, 1, 2, 1, 1, 1), (1, 1, math.inf, 1, -1, 0)])
+def test_render_soal_tidak_valid(koefisien):
+    for format in FORMAT_LEMBAR:
+        assert "Input tidak valid" in render_soal(koefisien, format, nomor=2)
+
+
+def _tulis_soal(path, baris):
+    pd.DataFrame(baris, columns=KOLOM_KOEFISIEN).to_csv(path, index=False)
+
+
+@pytest.mark.parametrize("pekerja", [1, 2])
+def test_ekspor_html_melewati_baris_tidak_valid(tmp_path, pekerja):
+    sumber = tmp_path / "soal.csv"
+    _tulis_soal(sumber, SOAL + [(math.nan, 1, 2, 1, 1, 1)])
+    tujuan = tmp_path / "lembar.html"
+    ringkasan = ekspor_lembar(sumber, tujuan, "csv", "html", pekerja=pekerja, soal_per_tugas=2)
+    teks = tujuan.read_text(encoding="utf-8")
+    assert ringkasan["soal"] == 4 and teks.count('<section class="soal">') == 4
+    assert teks.rstrip().endswith("</html>") and "Input tidak valid" in teks
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["lembar.html", "soal.csv"]
+
+
+def test_ekspor_svg_satu_file_per_soal(tmp_path):
+    sumber = tmp_path / "soal.csv"
+    _tulis_soal(sumber, SOAL)
+    ekspor_lembar(sumber, tmp_path / "svg", "csv", "svg", pekerja=1)
+    berkas = sorted((tmp_path / "svg").iterdir())
+    assert [p.name for p in berkas] == ["soal_000001.svg", "soal_000002.svg", "soal_000003.svg"]
+    assert all(p.read_text(encoding="utf-8").rstrip().endswith("</svg>") for p in berkas)
+    assert not (tmp_path / "svg.sementara").exists()
+
+
+def test_ekspor_gagal_tidak_mengubah_tujuan(tmp_path, monkeypatch):
+    sumber = tmp_path / "soal.csv"
+    _tulis_soal(sumber, SOAL)
+    tujuan = tmp_path / "lembar.tex"
+    tujuan.write_text("lama", encoding="utf-8")
+
+    def render_gagal(koefisien, format, nomor_awal):
+        raise RuntimeError("pekerja berhenti")
+
+    monkeypatch.setattr(lembar_kerja, "_render_potongan", render_gagal)
+    with pytest.raises(RuntimeError):
+        ekspor_lembar(sumber, tujuan, "csv", "latex", pekerja=1)
+    assert tujuan.read_text(encoding="utf-8") == "lama"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["lembar.tex", "soal.csv"]
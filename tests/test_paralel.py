@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spldv.bulk import KOLOM_KOEFISIEN, proses_bulk
+from spldv.paralel import proses_paralel, rentang_csv
+
+
+@pytest.fixture
+def csv_bom(tmp_path):
+    """CSV berawalan BOM UTF-8, seperti hasil ekspor Excel."""
+    koefisien = np.random.default_rng(0).integers(-9, 10, size=(500, 6))
+    path = tmp_path / "soal.csv"
+    path.write_bytes(b"\xef\xbb\xbf" + pd.DataFrame(koefisien, columns=KOLOM_KOEFISIEN).to_csv(index=False).encode())
+    return path
+
+
+def test_rentang_csv_membuang_bom(csv_bom):
+    nama_kolom, _ = rentang_csv(csv_bom)
+    assert nama_kolom == KOLOM_KOEFISIEN
+
+
+def test_csv_bom_serial_sama_dengan_paralel(csv_bom, tmp_path):
+    ringkasan_serial = proses_bulk(csv_bom, tmp_path / "serial.csv", "csv")
+    ringkasan_paralel = proses_paralel(csv_bom, tmp_path / "paralel.csv", "csv", ukuran_potongan=100, pekerja=2)
+    assert ringkasan_paralel["baris"] == ringkasan_serial["baris"] == 500
+    assert ringkasan_paralel["per_status"] == ringkasan_serial["per_status"]
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "paralel.csv"), pd.read_csv(tmp_path / "serial.csv"))
@@ -0,0 +1,41 @@
+import gc
+
+import numpy as np
+
+from spldv import plotting
+from spldv.plotting import PenggambarGaris, render_plot_garis
+
+X_RANGE = np.linspace(-10, 10, 400)
+
+
+def test_tutup_melepas_figure():
+    penggambar = PenggambarGaris()
+    penggambar.render((1, 1, 2), (1, -1, 0), X_RANGE, "#ff0000", "#0000ff")
+    fig = penggambar.fig
+    penggambar.tutup()
+    assert penggambar.fig is None and not fig.axes
+    penggambar.tutup() # Aman dipanggil dua kali
+
+
+def test_figure_dilepas_saat_penggambar_dibuang():
+    penggambar = PenggambarGaris()
+    penggambar.perbarui((1, 1, 2), (1, -1, 0), X_RANGE, "#ff0000", "#0000ff")
+    fig = penggambar.fig
+    del penggambar
+    gc.collect()
+    assert not fig.axes
+
+
+def test_render_tanpa_penggambar_menutup_figure_sementara(monkeypatch):
+    ditutup = []
+    tutup_asli = PenggambarGaris.tutup
+    monkeypatch.setattr(PenggambarGaris, "tutup", lambda self: (ditutup.append(self.fig), tutup_asli(self)))
+    monkeypatch.setattr(plotting, "_cache_plot", plotting.LRUCache(4))
+    render_plot_garis((1, 2, 3), (2, -1, 1), X_RANGE, "#ff0000", "#0000ff")
+    assert len(ditutup) == 1 and not ditutup[0].axes
+
+
+def test_hitung_batas_y_menerima_array_dan_mengabaikan_nan():
+    assert plotting.hitung_batas_y([]) == (-5, 5)
+    assert plotting.hitung_batas_y(np.array([[np.nan, 1.0], [np.inf, 2.0]])) == (-1.0, 4.0)
+    assert plotting.hitung_batas_y([-20, 10]) == (-21.5, 11.5)
@@ -0,0 +1,18 @@
+import numpy as np
+
+from spldv.plotting import klip_garis
+from spldv.sapuan import BATAS_X, _ruas_garis, chart_sapuan, nilai_sapuan
+
+
+def test_ruas_garis_sama_dengan_plot_statis():
+    persamaan = np.array([[1, 1, 2], [0, 1, 3], [2, -1, 1], [2, 0, 4]], dtype=float)
+    x0, y0, x1, y1 = _ruas_garis(persamaan, (-7, 9))
+    for i, baris in enumerate(persamaan[:3]):
+        assert ((x0[i], x1[i]), (y0[i], y1[i])) == klip_garis(tuple(baris), *BATAS_X)
+    assert (x0[3], y0[3], x1[3], y1[3]) == (2, -7, 2, 9) # Garis vertikal x = 2 sepanjang batas y
+
+
+def test_chart_sapuan_melewati_langkah_sejajar():
+    nilai = nilai_sapuan(-2, 2, 0.5)
+    chart = chart_sapuan((1, 1, 2), (1, -1, 0), "a2", nilai, "#ff0000", "#0000ff")
+    assert chart.to_dict()["params"][0]["name"] == "nilai_sapuan"
@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from spldv.sistem_linear import selesaikan_sistem_batch
+from spldv.status import STATUS_BERHIMPIT, STATUS_PARALEL, STATUS_TIDAK_VALID, STATUS_UNIK
+
+_RANK_DUA = np.array([[1.0, 2.0, 3.0], [2.0, 4.0, 6.0], [1.0, 0.0, 1.0]])
+
+
+def test_sistem_tak_hingga_tidak_menggagalkan_batch():
+    A = np.stack([np.eye(3), np.eye(3), np.eye(3)])
+    A[1, 0, 0] = math.nan
+    b = np.array([[1.0, 2.0, 3.0], [1.0, 1.0, 1.0], [1.0, math.inf, 0.0]])
+    solusi, status, kondisi = selesaikan_sistem_batch(A, b)
+    assert status.tolist() == [STATUS_UNIK, STATUS_TIDAK_VALID, STATUS_TIDAK_VALID]
+    np.testing.assert_allclose(solusi[0], [1.0, 2.0, 3.0])
+    assert np.isnan(solusi[1:]).all() and np.isnan(kondisi[1:]).all()
+
+
+def test_singular_a_kecil_b_besar():
+    # Rank(A) tidak boleh bergantung pada besar b: A diskalakan 1e-3, b sekitar 1e10
+    A = _RANK_DUA * 1e-3
+    b_konsisten = A @ np.array([1e13, 2e13, -1e13])
+    b_tidak_konsisten = b_konsisten + np.array([0.0, 1e9, 0.0])
+    _, status, _ = selesaikan_sistem_batch(np.stack([A, A]), np.stack([b_konsisten, b_tidak_konsisten]))
+    assert status.tolist() == [STATUS_BERHIMPIT, STATUS_PARALEL]
+
+
+def test_singular_skala_biasa():
+    A = np.stack([_RANK_DUA, _RANK_DUA])
+    b = np.array([[1.0, 2.0, 0.0], [1.0, 3.0, 0.0]])
+    _, status, _ = selesaikan_sistem_batch(A, b)
+    assert status.tolist() == [STATUS_BERHIMPIT, STATUS_PARALEL]
+
+
+@pytest.mark.parametrize("k", [2, 3, 4])
+def test_persamaan_nol_tidak_valid_untuk_semua_k(k):
+    # Jalur Cramer (k = 2) dan jalur SVD (k > 2) harus sepakat
+    A = np.stack([np.zeros((k, k)), np.zeros((k, k)), np.eye(k), np.eye(k)])
+    A[3, -1] = 0.0
+    b = np.zeros((4, k))
+    b[1, 0] = b[3, -1] = 1.0
+    solusi, status, kondisi = selesaikan_sistem_batch(A, b)
+    assert status.tolist() == [STATUS_TIDAK_VALID, STATUS_TIDAK_VALID, STATUS_UNIK, STATUS_TIDAK_VALID]
+    assert np.isnan(solusi[[0, 1, 3]]).all() and np.isnan(kondisi[[0, 1, 3]]).all()
@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+import pytest
+
+from spldv.solver import PILIHAN_ULANG, hitung_solusi_spldv, hitung_solusi_spldv_batch, hitung_solusi_spldv_campuran
+from spldv.status import STATUS_TIDAK_VALID, STATUS_UNIK
+
+
+def test_batch_determinan_meluap_tidak_valid():
+    x, y, status = hitung_solusi_spldv_batch([[[1e200, 1, 2], [1e200, -1e200, 1]]])
+    assert status.tolist() == [STATUS_TIDAK_VALID]
+    assert np.isnan(x).all() and np.isnan(y).all()
+
+
+def test_batch_koefisien_tak_hingga_tidak_valid():
+    sistem = [
+        [[math.nan, 1, 2], [1, 1, 1]],
+        [[1, 1, math.inf], [1, -1, 0]],
+        [[1, 1, 2], [1, -math.inf, 0]],
+        [[2, 1, 5], [1, -1, 1]],
+    ]
+    x, y, status = hitung_solusi_spldv_batch(sistem)
+    assert status.tolist() == [STATUS_TIDAK_VALID] * 3 + [STATUS_UNIK]
+    assert np.isnan(x[:3]).all() and np.isnan(y[:3]).all()
+    assert (x[3], y[3]) == (2.0, 1.0)
+
+
+@pytest.mark.parametrize("ulang", PILIHAN_ULANG)
+def test_campuran_koefisien_tak_hingga_tidak_valid(ulang):
+    sistem = [
+        [[math.nan, 1, 2], [1, 1, 1]],
+        [[1, 1, math.inf], [1, -1, 0]],
+        [[1, 1, 2], [-math.inf, 1, 0]],
+        [[2.5, 1, 5], [1, -1, 1]],
+        [[2, 1, 5], [1, -1, 1]],
+    ]
+    x, y, status, diulang = hitung_solusi_spldv_campuran(sistem, ulang=ulang)
+    assert status.tolist() == [STATUS_TIDAK_VALID] * 3 + [STATUS_UNIK] * 2
+    assert diulang.tolist() == [True] * 4 + [False]
+    assert np.isnan(x[:3]).all() and np.isnan(y[:3]).all()
+    assert (x[4], y[4]) == (2.0, 1.0)
+
+
+@pytest.mark.parametrize("ulang", PILIHAN_ULANG)
+def test_campuran_solusi_meluap_tidak_valid(ulang):
+    x, y, status, _ = hitung_solusi_spldv_campuran([[[1e-5, 1, 1e305], [0, 1, 0]]], ulang=ulang)
+    assert status.tolist() == [STATUS_TIDAK_VALID]
+    assert np.isnan(x).all() and np.isnan(y).all()
+
+
+def test_eksak_solusi_meluap_tidak_valid():
+    assert hitung_solusi_spldv((1e-300, 0, 1e300), (0, 1, 0), eksak=True) == (None, None)
+    assert hitung_solusi_spldv((2, 1, 5), (1, -1, 1), eksak=True) == (2.0, 1.0)
@@ -0,0 +1,54 @@
+from fractions import Fraction
+
+import pytest
+
+from spldv.substitusi import (
+    GAGAL_A1_NOL,
+    GAGAL_B1_NOL,
+    GAGAL_DETERMINAN_NOL,
+    GAGAL_PERSAMAAN1_TIDAK_VALID,
+    solve_spldv_substitusi,
+    verifikasi_solusi,
+)
+
+
+def test_jejak_substitusi_x_dari_persamaan1():
+    # 2x + y = 5, x - y = 1  ->  x = -y/2 + 5/2, lalu -3y = -3
+    jejak = solve_spldv_substitusi(2, 1, 5, 1, -1, 1)
+    assert jejak.berhasil and jejak.variabel_substitusi == "x"
+    assert (jejak.m_val, jejak.c_val) == (-0.5, 2.5)
+    assert (jejak.pembilang, jejak.penyebut, jejak.nilai_pertama) == (-3, -3, 1.0)
+    assert (jejak.suku_balik, jejak.sisa_balik) == (4.0, 1.0)
+    assert (jejak.x, jejak.y) == (2.0, 1.0)
+
+
+def test_jejak_substitusi_a1_nol_memakai_y():
+    # 2y = 4, x + y = 5: y dinyatakan dari Persamaan 1, x diperoleh dari Persamaan 2,
+    # tetapi substitusi balik ke Persamaan 1 tidak dapat mencari x karena a1 = 0
+    jejak = solve_spldv_substitusi(0, 2, 4, 1, 1, 5)
+    assert jejak.variabel_substitusi == "y"
+    assert (jejak.m_val, jejak.c_val) == (0.0, 2.0)
+    assert (jejak.pembilang, jejak.penyebut, jejak.nilai_pertama) == (6, 2, 3.0)
+    assert jejak.alasan_gagal == GAGAL_A1_NOL and not jejak.berhasil
+    assert jejak.suku_balik is jejak.sisa_balik is jejak.x is jejak.y is None
+
+
+@pytest.mark.parametrize("koefisien, alasan, terisi", [
+    ((0, 0, 1, 1, 1, 1), GAGAL_PERSAMAAN1_TIDAK_VALID, ()),
+    ((1, 1, 2, 2, 2, 4), GAGAL_DETERMINAN_NOL, ("m_val", "c_val", "pembilang", "penyebut")),
+    ((2, 0, 4, 1, 1, 5), GAGAL_B1_NOL, ("m_val", "c_val", "pembilang", "penyebut", "nilai_pertama")),
+])
+def test_jejak_gagal_berhenti_di_titik_gagal(koefisien, alasan, terisi):
+    jejak = solve_spldv_substitusi(*koefisien)
+    assert jejak.alasan_gagal == alasan
+    for nama in ("m_val", "c_val", "pembilang", "penyebut", "nilai_pertama", "suku_balik", "sisa_balik", "x", "y"):
+        assert (getattr(jejak, nama) is not None) == (nama in terisi), nama
+
+
+def test_jejak_eksak_memakai_fraction():
+    jejak = solve_spldv_substitusi(2, 1, 5, 1, -1, 1, eksak=True)
+    assert (jejak.m_val, jejak.c_val) == (Fraction(-1, 2), Fraction(5, 2))
+    assert type(jejak.pembilang) is int and type(jejak.x) is Fraction
+    jejak = solve_spldv_substitusi(0.1, 0.2, 0.3, 1, -1, 0, eksak=True)
+    assert (jejak.x, jejak.y) == (Fraction(1), Fraction(1))
+    assert verifikasi_solusi(0.1, 0.2, 0.3, 1, -1, 0, jejak.x, jejak.y, eksak=True)[2]